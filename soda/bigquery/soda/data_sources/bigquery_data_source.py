@@ -61,6 +61,7 @@ class BigQueryDataSource(DataSource):
         "FLOAT64",
     ]
     TEXT_TYPES_FOR_PROFILING = ["STRING"]
+    SUPPORTS_GROUPING_SETS: bool = True
 
     def __init__(self, logs: Logs, data_source_name: str, data_source_properties: dict):
         super().__init__(logs, data_source_name, data_source_properties)
@@ -182,6 +183,18 @@ class BigQueryDataSource(DataSource):
         )
         return sql
 
+    def get_tables_columns_key(self, table_name: str) -> str:
+        return table_name
+
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        table_names_sql = ", ".join(f"'{table_name}'" for table_name in table_names)
+        return (
+            f"SELECT table_name, column_name, data_type, is_nullable "
+            f"FROM {self.sql_information_schema_columns()} "
+            f"WHERE table_name IN ({table_names_sql}) "
+            f"ORDER BY ordinal_position;"
+        )
+
     def sql_get_column(self, include_tables: list[str] | None = None, exclude_tables: list[str] | None = None) -> str:
         table_filter_expression = self.sql_table_include_exclude_filter(
             "table_name", "table_schema", include_tables, exclude_tables
@@ -202,6 +215,13 @@ class BigQueryDataSource(DataSource):
         where_clause = f"\nWHERE {table_filter_expression} \n" if table_filter_expression else ""
         return f"SELECT table_id, row_count \n" f"FROM {self.schema}.__TABLES__" f"{where_clause}"
 
+    def sql_get_table_version(self, table_name: str) -> str | None:
+        return (
+            f"SELECT row_count, size_bytes, last_modified_time \n"
+            f"FROM {self.schema}.__TABLES__ \n"
+            f"WHERE table_id = '{table_name}'"
+        )
+
     def quote_table(self, table_name) -> str:
         return f"`{table_name}`"
 
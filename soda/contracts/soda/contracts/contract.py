@@ -402,6 +402,8 @@ class Contract:
                 )
                 # noinspection PyProtectedMember
                 scan._data_source_manager.data_sources[self.warehouse.warehouse_name] = sodacl_data_source
+                # Logs are per scan, so the data source must log into the logs of this scan
+                sodacl_data_source.logs = scan_logs
 
                 if self.soda_cloud:
                     scan.set_scan_definition_name(scan_definition_name)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from soda.common.file_system import file_system
+from soda.common.logs import Logs
+from soda.execution.batch_connection_pool import BatchConnectionPool
+from soda.scan import Scan
+
+DEFAULT_MAX_CONCURRENT_SCANS = 4
+SODACL_FILE_SUFFIXES = (".yml", ".yaml")
+
+
+class BatchScanResult:
+    def __init__(self, scan_definition_name: str, scan: Scan, exit_code: int):
+        self.scan_definition_name: str = scan_definition_name
+        # The executed scan, eg for scan.get_scan_results() or scan.get_logs_text()
+        self.scan: Scan = scan
+        self.exit_code: int = exit_code
+
+
+class BatchScan:
+    """
+    Runs many scans in one process.  Each scan is a regular Scan with its own logs and results, so each produces
+    the same scan results file as an individual run.  The scans run on max_concurrent_scans threads and share the
+    connections of their data sources through a BatchConnectionPool, so a batch opens at most
+    max_concurrent_scans connections per data source instead of one per scan.
+
+    Configuration, data source name, variables etc are set on the batch and applied to each scan before its
+    checks files are added.  Use add_scan_setup for anything else that must be set up on each scan.
+    """
+
+    def __init__(self, max_concurrent_scans: int = DEFAULT_MAX_CONCURRENT_SCANS):
+        self.max_concurrent_scans: int = max(1, max_concurrent_scans)
+        self._logs = Logs()
+        self._scan_setups: list[Callable[[Scan], None]] = []
+        # (scan definition name, SodaCL paths, SodaCL YAML string, scan results file) tuples
+        self._scan_definitions: list[tuple[str, list[str], str | None, str | None]] = []
+
+    def add_scan_setup(self, scan_setup: Callable[[Scan], None]):
+        self._scan_setups.append(scan_setup)
+
+    def set_data_source_name(self, data_source_name: str):
+        self.add_scan_setup(lambda scan: scan.set_data_source_name(data_source_name))
+
+    def set_verbose(self, verbose_var: bool = True):
+        self._logs.verbose = verbose_var
+        self.add_scan_setup(lambda scan: scan.set_verbose(verbose_var))
+
+    def add_configuration_yaml_file(self, file_path: str):
+        self.add_scan_setup(lambda scan: scan.add_configuration_yaml_file(file_path))
+
+    def add_configuration_yaml_str(self, environment_yaml_str: str, file_path: str = "yaml string"):
+        self.add_scan_setup(lambda scan: scan.add_configuration_yaml_str(environment_yaml_str, file_path))
+
+    def add_variables(self, variables: dict[str, str]):
+        self.add_scan_setup(lambda scan: scan.add_variables(variables))
+
+    def add_scan(
+        self,
+        scan_definition_name: str,
+        sodacl_paths: list[str] | None = None,
+        sodacl_yaml_str: str | None = None,
+        scan_results_file: str | None = None,
+    ):
+        """
+        Adds a scan of the checks files or directories in sodacl_paths and/or the checks in sodacl_yaml_str.
+        """
+        self._scan_definitions.append((scan_definition_name, sodacl_paths or [], sodacl_yaml_str, scan_results_file))
+
+    def add_scans_from_dir(self, batch_dir: str, scan_results_dir: str | None = None):
+        """
+        Adds a scan for each checks file and for each subdirectory in batch_dir.  The scan definition name is the
+        file name without suffix or the subdirectory name.  If scan_results_dir is given, the scan results of each
+        scan are stored in {scan_results_dir}/{scan definition name}.json
+        """
+        fs = file_system()
+        if not fs.is_dir(batch_dir):
+            self._logs.error(f"Batch directory '{batch_dir}' does not exist or is not a directory")
+            return
+        if scan_results_dir is not None:
+            fs.mkdirs(scan_results_dir)
+        for dir_entry in sorted(fs.scan_dir(batch_dir), key=lambda dir_entry: dir_entry.name):
+            path = fs.join(batch_dir, dir_entry.name)
+            if dir_entry.is_dir():
+                scan_definition_name = dir_entry.name
+            elif dir_entry.name.endswith(SODACL_FILE_SUFFIXES):
+                scan_definition_name = os.path.splitext(dir_entry.name)[0]
+            else:
+                continue
+            scan_results_file = (
+                fs.join(scan_results_dir, f"{scan_definition_name}.json") if scan_results_dir is not None else None
+            )
+            self.add_scan(scan_definition_name, sodacl_paths=[path], scan_results_file=scan_results_file)
+
+    def execute(self) -> list[BatchScanResult]:
+        """
+        Executes all scans and returns their results in the order in which the scans were added.
+        """
+        if not self._scan_definitions:
+            self._logs.warning("No scans in batch")
+            return []
+
+        batch_connection_pool = BatchConnectionPool()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrent_scans, len(self._scan_definitions)),
+                thread_name_prefix="soda-batch-scan",
+            ) as executor:
+                batch_scan_results = list(
+                    executor.map(
+                        lambda scan_definition: self._execute_scan(batch_connection_pool, *scan_definition),
+                        self._scan_definitions,
+                    )
+                )
+        finally:
+            batch_connection_pool.close(self._logs)
+
+        for batch_scan_result in batch_scan_results:
+            self._logs.info(f"Scan {batch_scan_result.scan_definition_name}: exit code {batch_scan_result.exit_code}")
+        return batch_scan_results
+
+    def _execute_scan(
+        self,
+        batch_connection_pool: BatchConnectionPool,
+        scan_definition_name: str,
+        sodacl_paths: list[str],
+        sodacl_yaml_str: str | None,
+        scan_results_file: str | None,
+    ) -> BatchScanResult:
+        scan = Scan()
+        scan._data_source_manager.batch_connection_pool = batch_connection_pool
+        scan.set_scan_definition_name(scan_definition_name)
+        try:
+            for scan_setup in self._scan_setups:
+                scan_setup(scan)
+            for sodacl_path in sodacl_paths:
+                scan.add_sodacl_yaml_files(sodacl_path)
+            if sodacl_yaml_str is not None:
+                scan.add_sodacl_yaml_str(sodacl_yaml_str)
+            if scan_results_file is not None:
+                scan.set_scan_results_file(scan_results_file)
+            exit_code = scan.execute()
+        except Exception as e:
+            scan._logs.error(f"Error occurred while executing scan {scan_definition_name}.", exception=e)
+            scan._close()
+            exit_code = 3
+        return BatchScanResult(scan_definition_name=scan_definition_name, scan=scan, exit_code=exit_code)
+
+    @staticmethod
+    def get_exit_code(batch_scan_results: list[BatchScanResult]) -> int:
+        """
+        The highest exit code of the scans, so that the batch fails if any of its scans fails.
+        """
+        return max((batch_scan_result.exit_code for batch_scan_result in batch_scan_results), default=0)
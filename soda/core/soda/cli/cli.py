@@ -18,18 +18,15 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import click
-from ruamel.yaml import YAML
-from ruamel.yaml.main import round_trip_dump
 from soda.common.exceptions import SODA_SCIENTIFIC_MISSING_LOG_MESSAGE
 from soda.common.file_system import file_system
 from soda.common.logs import configure_logging
-from soda.scan import Scan
-from soda.telemetry.soda_telemetry import SodaTelemetry
 from soda.telemetry.soda_tracer import soda_trace, span_setup_function_args
 
 from ..__version__ import SODA_CORE_VERSION
 
-soda_telemetry = SodaTelemetry.get_instance()
+# Modules that are slow to import, like soda.scan, ruamel.yaml and Open Telemetry, are imported in the commands that
+# use them, so that each command only loads what it needs.  See tests/benchmarks/benchmark_cli_startup.py
 
 # TODO IA-163. Add and test support for other data sources
 DATA_SOURCES_WITH_DISTRIBUTION_CHECK_SUPPORT = ["postgres", "snowflake", "bigquery", "mysql"]
@@ -96,6 +93,25 @@ if __name__ == "__main__":
     default=None,
     help="Specify the file path for check templates",
 )
+@click.option(
+    "--sodacl-cache",
+    is_flag=True,
+    help="Reuse the parsed checks files of a previous scan with the same checks files, variables and configuration",
+)
+@click.option(
+    "--batch",
+    required=False,
+    default=None,
+    help="Run a scan for each checks file and each subdirectory in the given directory, sharing connections",
+    type=click.STRING,
+)
+@click.option(
+    "--max-concurrent-scans",
+    required=False,
+    default=None,
+    help="Max number of scans of a --batch that run at the same time. Default 4",
+    type=click.INT,
+)
 @click.argument("sodacl_paths", nargs=-1, type=click.STRING)
 @soda_trace
 def scan(
@@ -108,6 +124,9 @@ def scan(
     verbose: bool | None,
     scan_results_file: str | None = None,
     template_path: str | None = None,
+    sodacl_cache: bool = False,
+    batch: str | None = None,
+    max_concurrent_scans: int | None = None,
 ):
     """
     The soda scan command:
@@ -138,17 +157,31 @@ def scan(
 
     option -t --data-timestamp Optional. Set the scan data timestamp to backfill the data for a previous date.
 
-    [CHECKS_FILE_PATHS] Required. Specify a list of file paths for checks files. Can be a file or a directory.
-    Soda recursively scans directories and adds all files ending with .yml.
+    option --sodacl-cache Optional. Store the parsed checks files in ~/.soda/sodacl_cache and reuse them in
+    subsequent scans with the same checks files, variables and configuration.
+
+    option --batch Optional. Run a scan for each checks file and each subdirectory of checks files in the given
+    directory, in one process and with shared data source connections.  The scan definition name of each scan is
+    the file name without suffix or the subdirectory name.  With --scan-results-file, the scan results of each scan
+    are stored in a file named after the scan definition in the given directory.  The exit code is the highest exit
+    code of the scans.
+
+    option --max-concurrent-scans Optional. Max number of scans of a --batch that run at the same time. Default 4.
+
+    [CHECKS_FILE_PATHS] Required unless --batch is used. Specify a list of file paths for checks files. Can be a
+    file or a directory. Soda recursively scans directories and adds all files ending with .yml.
 
     Example command:
 
     soda scan -d snowflake_customer_data -v TODAY=2022-03-11 -V ./snfk/pipeline_customer_checks.yml
     """
 
+    from soda.scan import Scan
+    from soda.telemetry.soda_telemetry import SodaTelemetry
+
     configure_logging()
 
-    soda_telemetry.set_attribute("cli_command_name", "scan")
+    SodaTelemetry.get_instance().set_attribute("cli_command_name", "scan")
 
     span_setup_function_args(
         {
@@ -163,21 +196,40 @@ def scan(
                 "non_interactive": False,  # TODO: change after non interactive mode is supported.
                 "verbose": verbose,
                 "scan_results_file": scan_results_file,
+                "batch": batch is not None,
             },
         }
     )
 
-    scan = Scan()
-    scan._data_timestamp = datetime.fromisoformat(data_timestamp)
-
-    # Add variables before any other config as they might be used.
+    variables_dict = {}
     if variable:
-        variables_dict = {}
         for v in variable:
             # Partition by first occurrence of "=" as variable value may contain "=" sign.
             variable_key, _, variable_value = v.partition("=")
             if variable_key and variable_value:
                 variables_dict[variable_key] = variable_value
+
+    if batch is not None:
+        sys.exit(
+            __execute_batch(
+                batch_dir=batch,
+                sodacl_paths=sodacl_paths,
+                data_source=data_source,
+                configuration=configuration,
+                data_timestamp=data_timestamp,
+                variables_dict=variables_dict,
+                verbose=verbose,
+                scan_results_dir=scan_results_file,
+                sodacl_cache=sodacl_cache,
+                max_concurrent_scans=max_concurrent_scans,
+            )
+        )
+
+    scan = Scan()
+    scan._data_timestamp = datetime.fromisoformat(data_timestamp)
+
+    # Add variables before any other config as they might be used.
+    if variables_dict:
         scan.add_variables(variables_dict)
 
     if template_path:
@@ -197,6 +249,9 @@ def scan(
 
     __load_configuration(scan, configuration)
 
+    if sodacl_cache:
+        scan.enable_sodacl_cache()
+
     if sodacl_paths:
         for sodacl_path_element in sodacl_paths:
             scan.add_sodacl_yaml_files(sodacl_path_element)
@@ -265,6 +320,10 @@ def update_dro(
     soda update-dro -d snowflake_customer_data ./customers_size_distribution_reference.yml
     """
 
+    from ruamel.yaml import YAML
+    from ruamel.yaml.main import round_trip_dump
+    from soda.scan import Scan
+
     configure_logging()
 
     fs = file_system()
@@ -460,10 +519,13 @@ def ingest(tool: str, data_source: str, configuration: str, verbose: bool | None
     """
     The soda ingest command ingests test results from a different tool to send to Soda Cloud.
     """
+    from soda.scan import Scan
+    from soda.telemetry.soda_telemetry import SodaTelemetry
+
     configure_logging()
     fs = file_system()
 
-    soda_telemetry.set_attribute("cli_command_name", "ingest")
+    SodaTelemetry.get_instance().set_attribute("cli_command_name", "ingest")
 
     telemetry_kwargs = {k: bool(v) for k, v in kwargs.items()}
 
@@ -566,9 +628,12 @@ def test_connection(
 
     soda test-connection -d snowflake_customer_data -c configuration.yml -V
     """
+    from soda.scan import Scan
+    from soda.telemetry.soda_telemetry import SodaTelemetry
+
     configure_logging()
 
-    soda_telemetry.set_attribute("cli_command_name", "test-connection")
+    SodaTelemetry.get_instance().set_attribute("cli_command_name", "test-connection")
 
     span_setup_function_args(
         {
@@ -622,6 +687,8 @@ def test_connection(
 )
 @soda_trace
 def simulate_anomaly_detection(configuration: list[str]) -> None:
+    from soda.scan import Scan
+
     configure_logging()
     try:
         # This file path using Pathlib
@@ -677,6 +744,46 @@ def __execute_query(connection, sql: str) -> list[tuple]:
         logging.error(f"Query error: {e}\n{sql}", exception=e)
 
 
+def __execute_batch(
+    batch_dir: str,
+    sodacl_paths: list[str],
+    data_source: str,
+    configuration: list[str],
+    data_timestamp: str,
+    variables_dict: dict[str, str],
+    verbose: bool | None,
+    scan_results_dir: str | None,
+    sodacl_cache: bool,
+    max_concurrent_scans: int | None,
+) -> int:
+    from soda.batch_scan import DEFAULT_MAX_CONCURRENT_SCANS, BatchScan
+
+    batch_scan = BatchScan(max_concurrent_scans=max_concurrent_scans or DEFAULT_MAX_CONCURRENT_SCANS)
+    if sodacl_paths:
+        batch_scan._logs.error("Checks files can not be combined with --batch, add them to the batch directory")
+        return 3
+
+    def setup_scan(scan: Scan):
+        scan._data_timestamp = datetime.fromisoformat(data_timestamp)
+        # Add variables before any other config as they might be used.
+        if variables_dict:
+            scan.add_variables(variables_dict)
+        if verbose:
+            scan.set_verbose()
+        scan.set_data_source_name(data_source)
+        __load_configuration(scan, configuration)
+        if sodacl_cache:
+            scan.enable_sodacl_cache()
+
+    batch_scan.add_scan_setup(setup_scan)
+    batch_scan.add_scans_from_dir(batch_dir, scan_results_dir=scan_results_dir)
+    batch_scan_results = batch_scan.execute()
+    # A batch without scans is an error, like a missing batch directory
+    if not batch_scan_results:
+        return 3
+    return BatchScan.get_exit_code(batch_scan_results)
+
+
 def __load_configuration(scan: Scan, configuration_paths: list[str] | None):
     fs = file_system()
 
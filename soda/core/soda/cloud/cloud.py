@@ -43,6 +43,8 @@ class Cloud(ABC):
         self.headers = {"User-Agent": f"SodaCore/{SODA_CORE_VERSION}"}
         self.logs = logs
         self._organization_configuration = None
+        # Shared by all requests so that connections are kept alive and reused
+        self._session: requests.Session = requests.Session()
 
     @property
     def organization_configuration(self) -> dict:
@@ -147,7 +149,7 @@ class Cloud(ABC):
             self.logs.error(f"Error while executing Soda Cloud {request_type}", exception=e)
 
     def _http_post(self, request_name: str = None, **kwargs) -> Response:
-        response = requests.post(**kwargs)
+        response = self._session.post(**kwargs)
 
         if request_name:
             trace_id = response.headers.get("X-Soda-Trace-Id")
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import gzip
+import io
 import json
 import logging
-import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import date, datetime, timedelta, timezone
-from typing import TYPE_CHECKING
+from itertools import islice
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Iterable
 
+import requests
+from requests.adapters import HTTPAdapter
 from soda.__version__ import SODA_CORE_VERSION
 from soda.cloud.cloud import Cloud
 from soda.cloud.historic_descriptor import (
@@ -17,6 +24,7 @@ from soda.cloud.historic_descriptor import (
 from soda.common.json_helper import JsonHelper
 from soda.common.logs import Logs
 from soda.execution.check_type import CheckType
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +37,22 @@ class SodaCloud(Cloud):
 
     CSV_TEXT_MAX_LENGTH = 1500
 
+    DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
+    DEFAULT_MAX_RETRIES = 3
+
+    DEFAULT_RETRY_BACKOFF_FACTOR = 0.5
+
+    # Response status codes for which Soda Cloud rejected the request before processing it, so it is safe to retry.
+    # 502 and 504 are not retried as a gateway may report them after Soda Cloud processed the request, and
+    # retrying a command like sending scan results could then duplicate it.
+    RETRY_STATUS_CODES = (429, 503)
+
+    DEFAULT_SAMPLES_LIMIT = 100
+
+    # Samples are uploaded as JSONL, gzip compressed if the Soda Cloud configuration enables compress_sample_uploads
+    DEFAULT_COMPRESS_SAMPLE_UPLOADS = False
+
     def __init__(
         self,
         host: str,
@@ -38,6 +62,10 @@ class SodaCloud(Cloud):
         port: str | None,
         logs: Logs,
         scheme: str = "https",
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+        compress_sample_uploads: bool = DEFAULT_COMPRESS_SAMPLE_UPLOADS,
     ):
         self.host = host
         self.port = f":{port}" if port else ""
@@ -50,6 +78,53 @@ class SodaCloud(Cloud):
         self.logs = logs
         self.soda_cloud_trace_ids = {}
         self._organization_configuration = None
+        # Number of requests that are sent to Soda Cloud at the same time, see submit_request
+        self.max_concurrent_requests: int = max_concurrent_requests
+        self.compress_sample_uploads: bool = compress_sample_uploads
+        # Shared by all requests so that connections are kept alive and reused
+        self._session: requests.Session = self._create_session(
+            max_concurrent_requests, max_retries, retry_backoff_factor
+        )
+        # Created on the first submitted request
+        self._request_executor: ThreadPoolExecutor | None = None
+        self._request_executor_lock: Lock = Lock()
+
+    @classmethod
+    def _create_session(cls, pool_size: int, max_retries: int, retry_backoff_factor: float) -> requests.Session:
+        """
+        Creates a session with a pool of pool_size keep-alive connections.  Requests are retried with exponential
+        backoff on connection errors and on RETRY_STATUS_CODES, but not on read errors or other status codes as
+        Soda Cloud may have processed the request already.
+        """
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,
+            status=max_retries,
+            status_forcelist=cls.RETRY_STATUS_CODES,
+            # Soda Cloud requests are POSTs, which are not retried by default.  All methods are retried here as
+            # connection errors and RETRY_STATUS_CODES mean the request was not processed.
+            allowed_methods=None,
+            backoff_factor=retry_backoff_factor,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def submit_request(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Runs fn, a function that sends requests to Soda Cloud, in the background.  All submitted requests share one
+        pool of max_concurrent_requests threads and the connections of the session.
+        """
+        with self._request_executor_lock:
+            if self._request_executor is None:
+                self._request_executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_requests, thread_name_prefix="soda-cloud"
+                )
+        return self._request_executor.submit(fn, *args, **kwargs)
 
     @property
     def organization_configuration(self) -> dict:
@@ -116,16 +191,28 @@ class SodaCloud(Cloud):
         )
 
     def upload_sample(
-        self, scan: Scan, sample_rows: tuple[tuple], sample_file_name: str, samples_limit: int | None
-    ) -> str:
+        self, scan: Scan, sample_rows: Iterable[tuple], sample_file_name: str, samples_limit: int | None
+    ) -> str | None:
         """
         :param sample_file_name: file name without extension
         :return: Soda Cloud file_id
         """
+        file_id = self.upload_sample_async(scan, sample_rows, sample_file_name, samples_limit)
+        return file_id.result() if isinstance(file_id, Future) else file_id
+
+    def upload_sample_async(
+        self, scan: Scan, sample_rows: Iterable[tuple], sample_file_name: str, samples_limit: int | None
+    ) -> Future | None:
+        """
+        Serializes the sample rows and uploads them in the background, see submit_request.
+        The rows are consumed before this method returns, so sample_rows can stream rows from an open cursor.
+        :param sample_file_name: file name without extension
+        :return: a Future of the Soda Cloud file_id or None if there are no rows or the sample could not be serialized
+        """
 
         # Keep the interface of this method backward compatible and allow for samples limit to be None, but do not continue with no limit in such case.
         if not samples_limit:
-            samples_limit = 100
+            samples_limit = self.DEFAULT_SAMPLES_LIMIT
 
         try:
             scan_definition_name = scan._scan_definition_name
@@ -135,43 +222,61 @@ class SodaCloud(Cloud):
                 f'_{scan_data_timestamp.strftime("%Y%m%d%H%M%S")}'
                 f'_{datetime.now(tz=timezone.utc).strftime("%Y%m%d%H%M%S")}'
             )
+            file_path = f"{scan_folder_name}/" + f"{sample_file_name}.jsonl"
+
+            sample_rows = iter(sample_rows)
+            sample_bytes, row_count = self._serialize_sample_rows(islice(sample_rows, samples_limit))
+            # Drains the rows beyond the limit so that streaming samples can count them
+            for _ in sample_rows:
+                pass
+            if row_count == 0:
+                return None
+
+            # Logs in once upfront instead of in each of the concurrent uploads
+            self._get_token()
+            return self.submit_request(
+                self._upload_sample_http_logging_errors, scan_definition_name, file_path, sample_bytes, sample_file_name
+            )
 
-            with tempfile.TemporaryFile() as temp_file:
-                for row in sample_rows[0:samples_limit]:
-                    row = [self._serialize_file_upload_value(v) for v in row]
-                    rows_json_str = json.dumps(row)
-                    rows_json_bytes = bytearray(rows_json_str, "utf-8")
-                    temp_file.write(rows_json_bytes)
-                    temp_file.write(b"\n")
-
-                temp_file_size_in_bytes = temp_file.tell()
-                temp_file.seek(0)
-
-                file_path = f"{scan_folder_name}/" + f"{sample_file_name}.jsonl"
-
-                file_id = self._upload_sample_http(scan_definition_name, file_path, temp_file, temp_file_size_in_bytes)
-
-                return file_id
+        except Exception as e:
+            self.logs.error(f"Soda cloud error: Could not upload sample {sample_file_name}", exception=e)
 
+    def _serialize_sample_rows(self, sample_rows: Iterable[tuple]) -> tuple[bytes, int]:
+        """
+        Returns the rows as JSONL bytes, compressed if compress_sample_uploads, and the number of rows
+        """
+        buffer = io.BytesIO()
+        row_count = 0
+        compressor = gzip.GzipFile(fileobj=buffer, mode="wb") if self.compress_sample_uploads else nullcontext(buffer)
+        with compressor as sample_file:
+            for row in sample_rows:
+                row = [self._serialize_file_upload_value(v) for v in row]
+                sample_file.write(json.dumps(row).encode("utf-8"))
+                sample_file.write(b"\n")
+                row_count += 1
+        return buffer.getvalue(), row_count
+
+    def _upload_sample_http_logging_errors(
+        self, scan_definition_name: str, file_path: str, sample_bytes: bytes, sample_file_name: str
+    ) -> str | None:
+        try:
+            return self._upload_sample_http(scan_definition_name, file_path, sample_bytes)
         except Exception as e:
             self.logs.error(f"Soda cloud error: Could not upload sample {sample_file_name}", exception=e)
+            return None
 
-    def _upload_sample_http(self, scan_definition_name: str, file_path, temp_file, file_size_in_bytes: int):
+    def _upload_sample_http(self, scan_definition_name: str, file_path, sample_bytes: bytes):
         headers = {
             "Authorization": self._get_token(),
             "Content-Type": "application/octet-stream",
             "Is-V3": "true",
             "File-Path": file_path,
+            "Content-Length": str(len(sample_bytes)),
         }
+        if self.compress_sample_uploads:
+            headers["Content-Encoding"] = "gzip"
 
-        if file_size_in_bytes == 0:
-            # because of https://github.com/psf/requests/issues/4215 we can't send content size
-            # when the size is 0 since requests blocks then on I/O indefinitely
-            self.logs.warning("Empty file upload detected, not sending Content-Length header")
-        else:
-            headers["Content-Length"] = str(file_size_in_bytes)
-
-        upload_response = self._http_post(url=f"{self.api_url}/scan/upload", headers=headers, data=temp_file)
+        upload_response = self._http_post(url=f"{self.api_url}/scan/upload", headers=headers, data=sample_bytes)
         upload_response_json = upload_response.json()
 
         if "fileId" not in upload_response_json:
@@ -200,6 +305,30 @@ class SodaCloud(Cloud):
 
         return {"measurements": measurements, "check_results": check_results}
 
+    def get_historic_data_batch(
+        self, historic_descriptors: list[HistoricDescriptor]
+    ) -> dict[HistoricDescriptor, dict[str, object]]:
+        """
+        Fetches the historic data for all descriptors of a scan.  Duplicate descriptors are fetched only once and
+        up to max_concurrent_requests requests are sent at the same time.
+        """
+        unique_historic_descriptors = list(dict.fromkeys(historic_descriptors))
+        max_workers = min(self.max_concurrent_requests, len(unique_historic_descriptors))
+        if max_workers <= 1:
+            historic_data = [self.get_historic_data(hd) for hd in unique_historic_descriptors]
+        else:
+            # Log in once upfront instead of in each of the concurrent requests
+            try:
+                self._get_token()
+            except Exception:
+                # Login errors are reported by each of the requests
+                pass
+            historic_data_futures = [
+                self.submit_request(self.get_historic_data, hd) for hd in unique_historic_descriptors
+            ]
+            historic_data = [historic_data_future.result() for historic_data_future in historic_data_futures]
+        return dict(zip(unique_historic_descriptors, historic_data))
+
     def is_samples_disabled(self) -> bool:
         return self.organization_configuration.get(self.ORG_CONFIG_KEY_DISABLE_COLLECTING_WH_DATA, True)
 
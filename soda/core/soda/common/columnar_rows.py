@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+BATCH_SIZE = 1000
+
+
+class ColumnarRows:
+    """
+    Compact representation of a multi-row query result that stores one list per column instead of a tuple or dict
+    per row.  Rows are exposed as lightweight ColumnarRow views, so that results with many rows can be processed
+    column by column without creating an object per row.
+    """
+
+    __slots__ = ("column_names", "columns", "column_indexes")
+
+    def __init__(self, column_names: list[str], columns: list[list]):
+        self.column_names: list[str] = column_names
+        self.columns: list[list] = columns
+        self.column_indexes: dict[str, int] = {column_name: index for index, column_name in enumerate(column_names)}
+
+    @classmethod
+    def from_cursor(cls, cursor, limit: int | None = None) -> ColumnarRows:
+        """
+        Fetches up to limit rows from the cursor.  Rows beyond the limit are not fetched.
+        """
+        column_names = [column[0] for column in cursor.description]
+        columns = [[] for _ in column_names]
+        row_count = 0
+        while limit is None or row_count < limit:
+            batch_size = BATCH_SIZE if limit is None else min(BATCH_SIZE, limit - row_count)
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for column, column_values in zip(columns, zip(*rows)):
+                column.extend(column_values)
+            row_count += len(rows)
+        return cls(column_names, columns)
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def __iter__(self) -> Iterator[ColumnarRow]:
+        return (ColumnarRow(self, index) for index in range(len(self)))
+
+    def __getitem__(self, index: int) -> ColumnarRow:
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Row index {index} out of range")
+        return ColumnarRow(self, index % len(self))
+
+    def get_column(self, column: str | int) -> list:
+        """
+        Returns the values of a column by name or by index.
+        """
+        return self.columns[column if isinstance(column, int) else self.column_indexes[column]]
+
+    def to_dicts(self) -> list[dict]:
+        return [dict(zip(self.column_names, row_values)) for row_values in zip(*self.columns)]
+
+
+class ColumnarRow:
+    """
+    View on a single row of ColumnarRows.  Values can be accessed by column index like in a tuple or by column name
+    like in a dict.
+    """
+
+    __slots__ = ("rows", "index")
+
+    def __init__(self, rows: ColumnarRows, index: int):
+        self.rows: ColumnarRows = rows
+        self.index: int = index
+
+    def __getitem__(self, column: str | int) -> object:
+        return self.rows.get_column(column)[self.index]
+
+    def get(self, column_name: str, default: object = None) -> object:
+        column_index = self.rows.column_indexes.get(column_name)
+        return default if column_index is None else self.rows.columns[column_index][self.index]
+
+    def __len__(self) -> int:
+        return len(self.rows.columns)
+
+    def __iter__(self) -> Iterator[object]:
+        return (column[self.index] for column in self.rows.columns)
+
+    def __eq__(self, other) -> bool:
+        return tuple(self) == (tuple(other) if isinstance(other, ColumnarRow) else other)
+
+    def __repr__(self) -> str:
+        return repr(tuple(self))
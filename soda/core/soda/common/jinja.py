@@ -1,9 +1,13 @@
 import os
+from functools import lru_cache
 from typing import Optional
 
-from jinja2 import Environment
+from jinja2 import Environment, Template
 from jinja2.runtime import Context
 
+# Max number of compiled templates kept by Jinja.compile
+TEMPLATE_CACHE_SIZE = 4096
+
 
 class OsContext(Context):
     def resolve_or_missing(self, key):
@@ -34,10 +38,19 @@ class Jinja:
         """
         if not isinstance(variables, dict):
             variables = {}
-        jinja_template = Jinja.environment.from_string(template)
+        jinja_template = Jinja.compile(template)
         rendered_value = jinja_template.render(variables)
         return rendered_value
 
+    @staticmethod
+    @lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+    def compile(template: str) -> Template:
+        """
+        Compiles the template source, memoized as the same query and filter templates are resolved for many checks.
+        Compiled templates are immutable and can be rendered concurrently.
+        """
+        return Jinja.environment.from_string(template)
+
     @staticmethod
     def env_var(variable_name: str, default_value: Optional[str] = None) -> str:
         """
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
+from contextlib import contextmanager
 from logging import Logger
 
 from soda.common.log import Log, LogLevel
@@ -30,23 +32,34 @@ def configure_logging():
     )
 
 
+DEFAULT_MAX_LOGS = 10000
+
+
 class Logs:
-    __instance = None
+    """
+    Log sink of a single scan.  Each Scan has its own Logs, so that scans can be executed concurrently in one
+    process without mixing their logs.  Logs are appended under a lock, so that the threads of a scan can log
+    concurrently.
+
+    At most max_logs logs are retained in self.logs.  Beyond that, info and debug logs are still written to python
+    logging, but no longer retained.  Error and warning logs are always retained as they determine the scan outcome.
+    """
 
-    def __new__(cls, logger: Logger = None):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-            cls.__instance._initialize()
-        return cls.__instance
+    def __init__(self, logger: Logger = None, max_logs: int | None = DEFAULT_MAX_LOGS):
+        self.max_logs: int | None = max_logs
+        self._lock = threading.Lock()
+        self._initialize()
 
     def _initialize(self):
         self.logs: list[Log] = []
         self.logs_buffer: list[Log] = []
         self.verbose: bool = False
+        self.dropped_log_count: int = 0
+        self._thread_captures = threading.local()
 
     def reset(self):
-        self.__instance = Logs()
-        self.__instance._initialize()
+        with self._lock:
+            self._initialize()
 
     def error(
         self,
@@ -117,8 +130,40 @@ class Logs:
             doc=doc,
             exception=exception,
         )
+        captured_logs = getattr(self._thread_captures, "logs", None)
+        if captured_logs is not None:
+            captured_logs.append(log)
+            return
+        self._append(log)
+
+    def _append(self, log: Log):
         log.log_to_python_logging()
-        self.logs.append(log)
+        with self._lock:
+            if (
+                self.max_logs is not None
+                and len(self.logs) >= self.max_logs
+                and log.level not in (LogLevel.ERROR, LogLevel.WARNING)
+            ):
+                self.dropped_log_count += 1
+            else:
+                self.logs.append(log)
+
+    @contextmanager
+    def capture(self):
+        """
+        Collects the logs of the current thread in a list instead of logging them right away.  Used to keep
+        logs of concurrently executed work deterministic: see replay(...)
+        """
+        captured_logs: list[Log] = []
+        self._thread_captures.logs = captured_logs
+        try:
+            yield captured_logs
+        finally:
+            self._thread_captures.logs = None
+
+    def replay(self, captured_logs: list[Log]):
+        for log in captured_logs:
+            self._append(log)
 
     def log_into_buffer(self, level, message, location, doc, exception):
         log = Log(
@@ -128,13 +173,15 @@ class Logs:
             doc=doc,
             exception=exception,
         )
-        self.logs_buffer.append(log)
+        with self._lock:
+            self.logs_buffer.append(log)
 
     def flush_buffer(self):
-        for log in self.logs_buffer:
-            log.log_to_python_logging()
-            self.logs.append(log)
-        self.logs_buffer = []
+        with self._lock:
+            logs_buffer = self.logs_buffer
+            self.logs_buffer = []
+        for log in logs_buffer:
+            self._append(log)
 
     def error_into_buffer(
         self,
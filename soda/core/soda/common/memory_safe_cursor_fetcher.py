@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from soda.common.logs import Logs
 
@@ -6,9 +6,9 @@ BATCH_SIZE = 100
 
 
 class MemorySafeCursorFetcher:
-    def __init__(self, cursor, limit=10000):
+    def __init__(self, cursor, limit=10000, logs: Optional[Logs] = None):
         self._cursor = cursor
-        self._logs = Logs()
+        self._logs = logs if logs is not None else Logs()
         self.limit = limit
         self.rows = None
         self.limit_exhausted = False
@@ -22,6 +22,25 @@ class MemorySafeCursorFetcher:
         if self.rows is not None:
             return self.rows
 
+        for _ in self._fetch_rows(warn_when_limit_exhausted=True):
+            pass
+        return self.rows
+
+    def iter_rows(self, limit: Optional[int] = None) -> Iterator[Tuple]:
+        """
+        Yields the first limit rows while they are fetched from the cursor, so that they can be processed without
+        materializing all rows up to the memory limit first.  Afterwards get_rows only returns the yielded rows.
+        The generator must be consumed completely for the row count to include the remaining rows of the cursor.
+        """
+        if self.rows is not None:
+            yield from self.rows[:limit]
+            return
+
+        if limit is not None:
+            self.limit = min(self.limit, limit)
+        yield from self._fetch_rows(warn_when_limit_exhausted=False)
+
+    def _fetch_rows(self, warn_when_limit_exhausted: bool) -> Iterator[Tuple]:
         self.rows = []
         self.total_row_count = 0
         while True:
@@ -36,13 +55,13 @@ class MemorySafeCursorFetcher:
 
             # Only store the needed number of results in memory
             if len(self.rows) < self.limit:
-                self.rows.extend(results[: self.limit - len(self.rows)])
-            elif self.limit_exhausted is False:
+                stored_results = results[: self.limit - len(self.rows)]
+                self.rows.extend(stored_results)
+                yield from stored_results
+            elif self.limit_exhausted is False and warn_when_limit_exhausted:
                 self._logs.warning(
                     "The query produced a lot of results, which have not all been stored in memory. "
                     f"Soda limits the number of processed results for sampling-like use-cases to {self.limit}. "
                     "You might want to consider optimising your query to select less results."
                 )
                 self.limit_exhausted = True
-
-        return self.rows
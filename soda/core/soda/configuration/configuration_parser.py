@@ -159,6 +159,18 @@ class ConfigurationParser(Parser):
         scheme = None
         if "scheme" in config_dict:
             scheme = config_dict.get("scheme")
+        max_concurrent_requests = int(
+            config_dict.get("max_concurrent_requests", SodaCloud.DEFAULT_MAX_CONCURRENT_REQUESTS)
+        )
+        max_retries = int(config_dict.get("max_retries", SodaCloud.DEFAULT_MAX_RETRIES))
+        retry_backoff_factor = float(config_dict.get("retry_backoff_factor", SodaCloud.DEFAULT_RETRY_BACKOFF_FACTOR))
+        compress_sample_uploads = config_dict.get("compress_sample_uploads", SodaCloud.DEFAULT_COMPRESS_SAMPLE_UPLOADS)
+        if not isinstance(compress_sample_uploads, bool):
+            self.logs.error(
+                "'compress_sample_uploads' configuration must be a boolean",
+                location=self.location,
+            )
+            compress_sample_uploads = SodaCloud.DEFAULT_COMPRESS_SAMPLE_UPLOADS
         return SodaCloud(
             api_key_id=api_key,
             api_key_secret=api_secret,
@@ -167,6 +179,10 @@ class ConfigurationParser(Parser):
             port=port,
             logs=self.logs,
             scheme=scheme,
+            max_concurrent_requests=max_concurrent_requests,
+            max_retries=max_retries,
+            retry_backoff_factor=retry_backoff_factor,
+            compress_sample_uploads=compress_sample_uploads,
         )
 
     def parse_dbt_cloud_cfg(self, config_dict: dict):
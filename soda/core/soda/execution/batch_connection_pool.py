@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import threading
+
+from soda.common.logs import Logs
+from soda.execution.data_source import DataSource
+
+
+class BatchConnectionPool:
+    """
+    Idle PEP 249 connections per data source that are shared by the scans of a BatchScan.
+
+    Each scan still creates its own DataSource.  Instead of opening a new primary connection, the DataSourceManager
+    of the scan takes an idle connection of a data source with the same name and properties from this pool and
+    releases it back to the pool when the scan is closed.  As a connection is only used by one scan at a time, the
+    pool never holds more connections per data source than the number of concurrently running scans.
+    """
+
+    def __init__(self):
+        self._idle_connections: dict[str, list[object]] = {}
+        self._lock = threading.Lock()
+
+    def connect(self, data_source: DataSource) -> None:
+        """
+        Sets the primary connection of the data source to an idle connection or to a new connection if there is
+        none.  Any BaseException of DataSource.connect() is propagated.
+        """
+        key = self._create_key(data_source)
+        with self._lock:
+            idle_connections = self._idle_connections.get(key)
+            connection = idle_connections.pop() if idle_connections else None
+        if connection is None:
+            data_source.connect()
+        else:
+            data_source.connection = connection
+            data_source.logs.debug(
+                f"Reusing a connection of the batch for data source '{data_source.data_source_name}'"
+            )
+
+    def release(self, data_source: DataSource) -> None:
+        """
+        Returns the primary connection of the data source to the pool after ending any open transaction.  A connection
+        that cannot be used anymore is closed instead, so that the next scan opens a new one.
+        """
+        connection = data_source.connection
+        if connection is None:
+            return
+        data_source.connection = None
+        if not self._reset_connection(data_source, connection):
+            try:
+                connection.close()
+            except BaseException as e:
+                data_source.logs.debug(f"Could not close discarded batch connection: {e}")
+            return
+        with self._lock:
+            self._idle_connections.setdefault(self._create_key(data_source), []).append(connection)
+
+    @staticmethod
+    def _reset_connection(data_source: DataSource, connection: object) -> bool:
+        """
+        Rolls back the connection and returns True if it can be used by the next scan.  Some drivers, like DuckDB,
+        raise if there is no open transaction to roll back, so if the rollback fails the connection is validated with
+        the test connection query instead.
+        """
+        try:
+            connection.rollback()
+            return True
+        except BaseException as rollback_exception:
+            try:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(data_source.sql_test_connection())
+                    cursor.fetchall()
+                finally:
+                    cursor.close()
+                return True
+            except BaseException as e:
+                data_source.logs.debug(
+                    f"Discarding batch connection of data source '{data_source.data_source_name}' that could not be "
+                    f"rolled back ({rollback_exception}) or validated ({e})"
+                )
+                return False
+
+    def close(self, logs: Logs) -> None:
+        with self._lock:
+            idle_connections_by_key = self._idle_connections
+            self._idle_connections = {}
+        for idle_connections in idle_connections_by_key.values():
+            for connection in idle_connections:
+                try:
+                    connection.close()
+                except BaseException as e:
+                    logs.error(f"Could not close batch connection: {e}", exception=e)
+
+    @staticmethod
+    def _create_key(data_source: DataSource) -> str:
+        # Only data sources with identical properties share connections
+        return json.dumps(
+            [data_source.data_source_name, data_source.data_source_properties], sort_keys=True, default=str
+        )
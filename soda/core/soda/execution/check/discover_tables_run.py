@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
+from soda.profiling.discover_table_result_table import DiscoverTablesResultTable
 from soda.profiling.discover_tables_result import DiscoverTablesResult
 from soda.sodacl.data_source_check_cfg import DataSourceCheckCfg
 
@@ -36,26 +38,37 @@ class DiscoverTablesRun:
             )
             return discover_tables_result
 
+        self.data_source_scan.prefetch_table_columns(table_names)
         self.logs.info(f"Discovering the following tables:")
-        for table_name in table_names:
-            self.logs.info(f"  - {table_name}")
-            discover_tables_result_table = discover_tables_result.create_table(
-                table_name, self.data_source.data_source_name
-            )
-            # get columns & metadata for current table
-            columns_metadata_result = self.data_source.get_table_columns(
-                table_name=table_name,
-                query_name=f"discover-tables-column-metadata-for-{table_name}",
-            )
-
-            if columns_metadata_result:
-                for column_name, column_type in columns_metadata_result.items():
-                    _ = discover_tables_result_table.create_column(column_name, column_type)
-            else:
-                self.logs.warning(
-                    f"Unable to retrieve column metadata for table {table_name}."
-                    "Column discovery results may be incomplete or entirely skipped",
-                    location=self.data_source_check_cfg.location,
-                )
+        discover_tables_result_tables = [
+            discover_tables_result.create_table(table_name, self.data_source.data_source_name)
+            for table_name in table_names
+        ]
+        self.data_source_scan.run_concurrently(
+            [
+                partial(self.discover_table, discover_tables_result_table)
+                for discover_tables_result_table in discover_tables_result_tables
+            ],
+            max_workers=self.data_source.max_concurrent_tables,
+        )
 
         return discover_tables_result
+
+    def discover_table(self, discover_tables_result_table: DiscoverTablesResultTable) -> None:
+        table_name = discover_tables_result_table.table_name
+        self.logs.info(f"  - {table_name}")
+        # get columns & metadata for current table
+        columns_metadata_result = self.data_source.get_table_columns(
+            table_name=table_name,
+            query_name=f"discover-tables-column-metadata-for-{table_name}",
+        )
+
+        if columns_metadata_result:
+            for column_name, column_type in columns_metadata_result.items():
+                _ = discover_tables_result_table.create_column(column_name, column_type)
+        else:
+            self.logs.warning(
+                f"Unable to retrieve column metadata for table {table_name}."
+                "Column discovery results may be incomplete or entirely skipped",
+                location=self.data_source_check_cfg.location,
+            )
@@ -69,12 +69,23 @@ class DistributionCheck(Check):
             self.logs.error(f"{SODA_SCIENTIFIC_MISSING_LOG_MESSAGE}\n Original error: {e}")
             return
 
-        sql = self.sql_column_values_query(self.distribution_check_cfg)
+        reference_bins = self.get_reference_bins()
+        is_pushdown = (
+            self.distribution_check_cfg.pushdown
+            and self.distribution_type == "continuous"
+            and reference_bins is not None
+        )
+        if is_pushdown:
+            sql = self.sql_binned_counts_query(self.distribution_check_cfg, reference_bins)
+            query_name = "get_binned_counts_for_distro_check"
+        else:
+            sql = self.sql_column_values_query(self.distribution_check_cfg)
+            query_name = "get_values_for_distro_check"
         self.logs.debug(f"Executing query for the distribution check: \n{sql}")
 
         self.query = Query(
             data_source_scan=self.data_source_scan,
-            unqualified_query_name="get_values_for_distro_check",
+            unqualified_query_name=query_name,
             sql=sql,
         )
         self.query.execute()
@@ -83,7 +94,17 @@ class DistributionCheck(Check):
             dist_method = self.distribution_check_cfg.method
             dist_name = self.distribution_check_cfg.distribution_name
             try:
-                if self.distribution_type == "categorical":
+                binned_counts = None
+                if is_pushdown:
+                    # Collect test data as a list of tuples (bin index, count, min value, max value)
+                    binned_counts = self.query.rows
+                    test_data = []
+                    if len(binned_counts) > 0 and all(row[0] == -1 for row in binned_counts):
+                        self.logs.warning(
+                            f"All values are null in your test data. Skipping distribution check for column '{self.column.column_name}'"
+                        )
+                        return
+                elif self.distribution_type == "categorical":
                     # Collect test data as a list of tuples (value, count)
                     test_data = self.query.rows
                 else:
@@ -104,6 +125,7 @@ class DistributionCheck(Check):
                     data=test_data,
                     max_limit=self.max_limit,
                     logs=self.logs,
+                    binned_counts=binned_counts,
                 ).run()
                 self.check_value = check_result_dict["check_value"]
                 self.metrics["distribution-difference-metric"].value = self.check_value
@@ -157,8 +179,24 @@ class DistributionCheck(Check):
             dist_type = self.parsed_dro[dist_name]["distribution_type"]
         return dist_type
 
-    def sql_column_values_query(self, distribution_check_cfg: DistributionCheckCfg) -> str:
-        column_name = distribution_check_cfg.column_name
+    def get_reference_bins(self) -> list | None:
+        """
+        Returns the sorted numeric bin edges of the DRO or None if they are not available.  Errors about missing
+        bins are reported by the DistributionChecker.
+        """
+        dist_name = self.distribution_check_cfg.distribution_name
+        parsed_dro = self.parsed_dro.get(dist_name) if dist_name else self.parsed_dro
+        if not isinstance(parsed_dro, dict):
+            return None
+        distribution_reference = parsed_dro.get("distribution_reference") or parsed_dro.get("distribution reference")
+        if not isinstance(distribution_reference, dict):
+            return None
+        bins = distribution_reference.get("bins")
+        if not bins or not all(isinstance(bin_edge, Number) for bin_edge in bins):
+            return None
+        return sorted(bins)
+
+    def _get_filter_clause(self, distribution_check_cfg: DistributionCheckCfg) -> str:
         scan = self.data_source_scan.scan
 
         partition_filter = scan.jinja_resolve(self.partition.sql_partition_filter)
@@ -167,7 +205,23 @@ class DistributionCheck(Check):
         filters.append(partition_filter)
         filters.append(distribution_check_filter)
 
-        filter_clause = " AND ".join(_filter for _filter in filters if _filter)
+        return " AND ".join(_filter for _filter in filters if _filter)
+
+    def sql_binned_counts_query(self, distribution_check_cfg: DistributionCheckCfg, bins: list) -> str:
+        scan = self.data_source_scan.scan
+        return self.data_source_scan.data_source.sql_distribution_binned_counts(
+            column_name=distribution_check_cfg.column_name,
+            table_name=self.partition.table.qualified_table_name,
+            bins=bins,
+            filter_clause=self._get_filter_clause(distribution_check_cfg),
+            sample_clause=scan.jinja_resolve(distribution_check_cfg.sample_clause),
+        )
+
+    def sql_column_values_query(self, distribution_check_cfg: DistributionCheckCfg) -> str:
+        column_name = distribution_check_cfg.column_name
+        scan = self.data_source_scan.scan
+
+        filter_clause = self._get_filter_clause(distribution_check_cfg)
         sample_clause = None
         limit = None
 
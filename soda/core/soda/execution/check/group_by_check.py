@@ -44,63 +44,70 @@ class GroupByCheck(Check):
         query_results = metrics[GROUP_BY_RESULTS].value
         group_limit = self.check_cfg.group_limit
 
+        # The group by query fetches at most one row more than the group limit
         if len(query_results) > group_limit:
-            raise Exception(
-                f"Total number of groups {len(query_results)} exceeds configured group limit: {group_limit}"
-            )
+            raise Exception(f"Total number of groups exceeds configured group limit: {group_limit}")
 
         fields = list(self.check_cfg.fields)
         group_check_cfgs = self.check_cfg.check_cfgs
-        groups = [tuple(map(qr.get, fields)) for qr in query_results]
-
+        for gcc in group_check_cfgs:
+            if gcc.name is None:
+                raise Exception("name property is required for the group check")
+
+        # Groups are built column by column.  Index of the first query result row of each group, so that each group
+        # is looked up in constant time.
+        field_columns = [
+            query_results.get_column(field) if field in query_results.column_indexes else [None] * len(query_results)
+            for field in fields
+        ]
+        groups = list(zip(*field_columns)) if fields else [()] * len(query_results)
+        row_index_by_group = {}
+        for row_index, group in enumerate(groups):
+            row_index_by_group.setdefault(group, row_index)
+
+        column = ",".join(fields)
+        identity = self.create_identity(with_datasource=True, with_filename=True)
         group_checks = []
 
         for group in groups:
+            row_index = row_index_by_group[group]
+            group_name = f"{','.join(str(v) for v in group)}"
             for gcc in group_check_cfgs:
-                if gcc.name is None:
-                    raise Exception("name property is required for the group check")
-
-                group_name = f"{','.join(str(v) for v in group)}"
-                config = copy.deepcopy(gcc)
-                config.name = gcc.name + f" [{group_name}]"
-                config.source_configurations["group_value"] = f"[{group_name}]"
-                column = ",".join(fields)
+                config = self._create_group_check_cfg(gcc, group_name)
                 gc = Check.create(
                     check_cfg=config, data_source_scan=self.data_source_scan, partition=self.partition, column=column
                 )
-                result = next(filter(lambda qr: tuple(map(qr.get, fields)) == group, query_results))
-                if result is not None:
-                    gc.check_value = result[config.metric_name]
-                    metric = Metric(
-                        self.data_source_scan,
-                        self.partition,
-                        column=None,
-                        name=config.name,
-                        check=None,
-                        identity_parts=[],
-                    )
-
-                    # TODO fetch historic values, change over time checks will not work yet
-                    # historic_values = {}
-                    # if gc.historic_descriptors:
-                    #     for hd_key, hd in gc.historic_descriptors.items():
-                    #         print(f"hd_key: {hd_key}, hd: {hd}")
-                    #         historic_values[hd_key] = self.data_source_scan.scan.__get_historic_data_from_soda_cloud_metric_store(hd)
-
-                    metric.set_value(gc.check_value)
-                    self.data_source_scan.scan._add_metric(metric)
-                    gc.metrics = {config.metric_name: metric}
-                    gc.evaluate(metrics=None, historic_values=None)
-
-                    cloud_group_attr = {
-                        "group": {
-                            "identity": self.create_identity(with_datasource=True, with_filename=True),
-                            "name": gcc.name,
-                            "distinctLabel": group_name,
-                        }
+                gc.check_value = query_results.get_column(config.metric_name)[row_index]
+                metric = Metric(
+                    self.data_source_scan,
+                    self.partition,
+                    column=None,
+                    name=config.name,
+                    check=None,
+                    identity_parts=[],
+                )
+
+                # TODO fetch historic values, change over time checks will not work yet
+                # historic_values = {}
+                # if gc.historic_descriptors:
+                #     for hd_key, hd in gc.historic_descriptors.items():
+                #         print(f"hd_key: {hd_key}, hd: {hd}")
+                #         historic_values[hd_key] = self.data_source_scan.scan.__get_historic_data_from_soda_cloud_metric_store(hd)
+
+                metric.set_value(gc.check_value)
+                self.data_source_scan.scan._add_metric(metric)
+                gc.metrics = {config.metric_name: metric}
+                gc.evaluate(metrics=None, historic_values=None)
+
+                cloud_group_attr = {
+                    "group": {
+                        "identity": identity,
+                        "name": gcc.name,
+                        "distinctLabel": group_name,
                     }
-                    gc.cloud_dict.update(cloud_group_attr)
-                    gc.dict.update(cloud_group_attr)
+                }
+                gc.cloud_dict.update(cloud_group_attr)
+                gc.dict.update(cloud_group_attr)
                 group_checks.append(gc)
 
         self.data_source_scan.scan._checks.extend(group_checks)
@@ -112,6 +119,17 @@ class GroupByCheck(Check):
         else:
             self.outcome = CheckOutcome.PASS
 
+    @staticmethod
+    def _create_group_check_cfg(group_check_cfg: CheckCfg, group_name: str) -> CheckCfg:
+        """
+        Returns a shallow copy of the group check configuration for a single group.  Only the name and the source
+        configurations differ per group, all other configuration objects are shared by the groups.
+        """
+        config = copy.copy(group_check_cfg)
+        config.name = group_check_cfg.name + f" [{group_name}]"
+        config.source_configurations = {**group_check_cfg.source_configurations, "group_value": f"[{group_name}]"}
+        return config
+
     def get_cloud_diagnostics_dict(self) -> dict:
         group_by_diagnostics = {}
         return group_by_diagnostics
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from functools import partial
 from typing import TYPE_CHECKING
 
 from soda.profiling.numeric_column_profiler import NumericColumnProfiler
@@ -9,6 +10,7 @@ from soda.profiling.profile_columns_result import (
     ProfileColumnsResultColumn,
     ProfileColumnsResultTable,
 )
+from soda.profiling.table_profiler import TableProfiler
 from soda.profiling.text_column_profiler import TextColumnProfiler
 
 if TYPE_CHECKING:
@@ -36,49 +38,78 @@ class ProfileColumnsRun:
             return profile_columns_result
 
         self.logs.info("Profiling columns for the following tables:")
-        for table_name, columns_metadata in profile_result_column_tables.items():
-            row_count = self.data_source.get_table_row_count(table_name)
-            result_table = ProfileColumnsResultTable(
-                table_name=table_name, data_source=self.data_source.data_source_name, row_count=row_count
-            )
-            self.logs.info(f"  - {table_name}")
-            for column_name, column_data_type in columns_metadata.items():
-                profiling_column_type = "unknown type"
-                try:
-                    if column_data_type.startswith(tuple(self.data_source.NUMERIC_TYPES_FOR_PROFILING)):
-                        profiling_column_type = "numeric"
-                        numeric_column_profiler = NumericColumnProfiler(
-                            data_source_scan=self.data_source_scan,
-                            profile_columns_cfg=self.profile_columns_cfg,
-                            table_name=table_name,
-                            column_name=column_name,
-                            column_data_type=column_data_type,
-                        )
-                        result_column: ProfileColumnsResultColumn = numeric_column_profiler.profile()
-                        result_table.append_column(result_column)
-                    elif column_data_type.startswith(tuple(self.data_source.TEXT_TYPES_FOR_PROFILING)):
-                        profiling_column_type = "text"
-                        text_column_profiler = TextColumnProfiler(
-                            data_source_scan=self.data_source_scan,
-                            profile_columns_cfg=self.profile_columns_cfg,
-                            table_name=table_name,
-                            column_name=column_name,
-                            column_data_type=column_data_type,
-                        )
-                        result_column: ProfileColumnsResultColumn = text_column_profiler.profile()
-                        result_table.append_column(result_column)
-                    else:
-                        self.logs.warning(
-                            f"Column '{table_name}.{column_name}' was not profiled because column data "
-                            f"type '{column_data_type}' is not in supported profiling data types"
-                        )
-                except Exception as e:
-                    self.logs.error(
-                        f"Problem profiling {profiling_column_type} column '{table_name}.{column_name}' with data type '{column_data_type}': {e}"
-                    )
+        result_tables = self.data_source_scan.run_concurrently(
+            [
+                partial(self.profile_table, table_name, columns_metadata)
+                for table_name, columns_metadata in profile_result_column_tables.items()
+            ],
+            max_workers=self.data_source.max_concurrent_tables,
+        )
+        for result_table in result_tables:
             profile_columns_result.append_table(result_table)
         return profile_columns_result
 
+    def profile_table(self, table_name: str, columns_metadata: dict[str, str]) -> ProfileColumnsResultTable:
+        self.logs.info(f"  - {table_name}")
+        if self.data_source.SUPPORTS_MULTI_COLUMN_PROFILING:
+            return self.profile_table_single_pass(table_name, columns_metadata)
+        return self.profile_table_per_column(table_name, columns_metadata)
+
+    def profile_table_single_pass(self, table_name: str, columns_metadata: dict[str, str]) -> ProfileColumnsResultTable:
+        try:
+            table_profiler = TableProfiler(
+                data_source_scan=self.data_source_scan,
+                profile_columns_cfg=self.profile_columns_cfg,
+                table_name=table_name,
+                columns_metadata=columns_metadata,
+            )
+            return table_profiler.profile()
+        except Exception as e:
+            # Column errors are handled in the TableProfiler, so fall back to profiling the table column by column
+            self.logs.info(f"Profiling columns of table '{table_name}' one by one as single pass profiling failed: {e}")
+            return self.profile_table_per_column(table_name, columns_metadata)
+
+    def profile_table_per_column(self, table_name: str, columns_metadata: dict[str, str]) -> ProfileColumnsResultTable:
+        row_count = self.data_source.get_table_row_count(table_name)
+        result_table = ProfileColumnsResultTable(
+            table_name=table_name, data_source=self.data_source.data_source_name, row_count=row_count
+        )
+        for column_name, column_data_type in columns_metadata.items():
+            profiling_column_type = "unknown type"
+            try:
+                if column_data_type.startswith(tuple(self.data_source.NUMERIC_TYPES_FOR_PROFILING)):
+                    profiling_column_type = "numeric"
+                    numeric_column_profiler = NumericColumnProfiler(
+                        data_source_scan=self.data_source_scan,
+                        profile_columns_cfg=self.profile_columns_cfg,
+                        table_name=table_name,
+                        column_name=column_name,
+                        column_data_type=column_data_type,
+                    )
+                    result_column: ProfileColumnsResultColumn = numeric_column_profiler.profile()
+                    result_table.append_column(result_column)
+                elif column_data_type.startswith(tuple(self.data_source.TEXT_TYPES_FOR_PROFILING)):
+                    profiling_column_type = "text"
+                    text_column_profiler = TextColumnProfiler(
+                        data_source_scan=self.data_source_scan,
+                        profile_columns_cfg=self.profile_columns_cfg,
+                        table_name=table_name,
+                        column_name=column_name,
+                        column_data_type=column_data_type,
+                    )
+                    result_column: ProfileColumnsResultColumn = text_column_profiler.profile()
+                    result_table.append_column(result_column)
+                else:
+                    self.logs.warning(
+                        f"Column '{table_name}.{column_name}' was not profiled because column data "
+                        f"type '{column_data_type}' is not in supported profiling data types"
+                    )
+            except Exception as e:
+                self.logs.error(
+                    f"Problem profiling {profiling_column_type} column '{table_name}.{column_name}' with data type '{column_data_type}': {e}"
+                )
+        return result_table
+
     def get_table_columns_metadata(self) -> defaultdict[str, dict] | None:
         include_patterns = self.parse_profiling_expressions(self.profile_columns_cfg.include_columns)
         exclude_patterns = self.parse_profiling_expressions(self.profile_columns_cfg.exclude_columns)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from soda.profiling.sample_tables_result import SampleTablesResult
+from soda.sampler.sample_ref import SampleRef
 from soda.sodacl.data_source_check_cfg import DataSourceCheckCfg
 
 if TYPE_CHECKING:
@@ -29,15 +31,22 @@ class SampleTablesRun:
         )
 
         self.logs.info(f"Sampling the following tables:")
-        for table_name in table_names:
-            self.logs.info(f"  - {table_name}")
-
-            # get columns and first n rows
-            sample_ref = self.data_source.store_table_sample(table_name, limit=100)
+        sample_refs = self.data_source_scan.run_concurrently(
+            [partial(self.sample_table, table_name) for table_name in table_names],
+            max_workers=self.data_source.max_concurrent_tables,
+        )
+        for table_name, sample_ref in zip(table_names, sample_refs):
             sample_tables_result.append_table(table_name, self.data_source_name, sample_ref)
-            self.logs.info(f"Successfully collected samples for dataset: {table_name}!")
 
         if not isinstance(sample_tables_result.tables, list):
             self.logs.error(f"Sample tables for data source: {self.data_source_name} failed")
 
         return sample_tables_result
+
+    def sample_table(self, table_name: str) -> SampleRef:
+        self.logs.info(f"  - {table_name}")
+
+        # get columns and first n rows
+        sample_ref = self.data_source.store_table_sample(table_name, limit=100)
+        self.logs.info(f"Successfully collected samples for dataset: {table_name}!")
+        return sample_ref
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import queue
+import threading
+from contextlib import contextmanager
+
+from soda.execution.data_source import DataSource
+
+
+class ConnectionPool:
+    """
+    A bounded pool of PEP 249 connections for a single data source.
+
+    The data source's primary connection is always part of the pool.  Additional connections are created lazily
+    through DataSource.create_pooled_connection() until max_size connections exist.  While a connection is
+    borrowed, it is bound to the current thread so that data_source.connection (and thereby Query execution,
+    rollbacks etc.) transparently uses it.
+    """
+
+    def __init__(self, data_source: DataSource, max_size: int):
+        self.data_source: DataSource = data_source
+        self.max_size: int = max(1, max_size)
+        self._idle_connections: queue.LifoQueue = queue.LifoQueue()
+        self._idle_connections.put(data_source.connection)
+        self._created_connections: list[object] = []
+        self._size: int = 1
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def borrow(self):
+        connection = self._acquire()
+        self.data_source.bind_thread_connection(connection)
+        try:
+            yield connection
+        finally:
+            self.data_source.bind_thread_connection(None)
+            self._idle_connections.put(connection)
+
+    def _acquire(self) -> object:
+        try:
+            return self._idle_connections.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._size < self.max_size:
+                # Under the lock as create_pooled_connection temporarily replaces the primary connection
+                try:
+                    connection = self.data_source.create_pooled_connection()
+                except BaseException as e:
+                    # Do not try to grow the pool again
+                    self.max_size = self._size
+                    self.data_source.logs.warning(
+                        f"Could not open an additional connection for data source "
+                        f"'{self.data_source.data_source_name}', continuing with fewer connections: {e}"
+                    )
+                else:
+                    self._size += 1
+                    self._created_connections.append(connection)
+                    return connection
+        return self._idle_connections.get()
+
+    def close(self):
+        """
+        Closes all connections that were created by the pool.  The primary connection is left open and is
+        closed by the DataSourceManager at the end of the scan.
+        """
+        for connection in self._created_connections:
+            try:
+                connection.close()
+            except BaseException as e:
+                self.data_source.logs.error(
+                    f"Could not close pooled connection of data source '{self.data_source.data_source_name}': {e}",
+                    exception=e,
+                )
+        self._created_connections = []
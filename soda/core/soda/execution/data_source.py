@@ -5,6 +5,7 @@ import hashlib
 import importlib
 import json
 import re
+import threading
 from collections import defaultdict
 from datetime import date, datetime
 from functools import lru_cache
@@ -15,6 +16,17 @@ from soda.common.exceptions import DataSourceError
 from soda.common.logs import Logs
 from soda.common.string_helper import string_matches_simple_pattern
 from soda.execution.data_type import DataType
+from soda.execution.incremental_metric_store import (
+    DEFAULT_INCREMENTAL_METRICS_MAX_ENTRIES,
+    DEFAULT_INCREMENTAL_METRICS_PATH,
+    IncrementalMetricStore,
+)
+from soda.execution.metric_result_cache import (
+    DEFAULT_METRIC_CACHE_MAX_ENTRIES,
+    DEFAULT_METRIC_CACHE_PATH,
+    DEFAULT_METRIC_CACHE_TTL_SECONDS,
+    MetricResultCache,
+)
 from soda.execution.query.query import Query
 from soda.execution.query.query_without_results import QueryWithoutResults
 from soda.execution.query.schema_query import TableColumnsQuery
@@ -160,6 +172,10 @@ class DataSource:
         "bigserial",
     ]
     TEXT_TYPES_FOR_PROFILING = ["character varying", "varchar", "text", "character", "char"]
+    # Whether the aggregates and histograms of all profiled columns of a table can be computed in a single query
+    SUPPORTS_MULTI_COLUMN_PROFILING: bool = True
+    # Whether the duplicate counts of multiple column sets can be computed in a single GROUP BY GROUPING SETS query
+    SUPPORTS_GROUPING_SETS: bool = False
     LIMIT_KEYWORD: str = "LIMIT"
 
     # Building up format queries normally works with regexp expression + a set of formats,
@@ -224,6 +240,7 @@ class DataSource:
         # https://www.python.org/dev/peps/pep-0249/#connection-objects
         # @see self.connect() for initialization
         self.type = self.data_source_properties.get("connection_type")
+        self._thread_connections = threading.local()
         self.connection = None
         self.database: str | None = data_source_properties.get("database")
         self.schema: str | None = data_source_properties.get("schema")
@@ -234,6 +251,95 @@ class DataSource:
         # See https://sodadata.atlassian.net/browse/CLOUD-5446
         self.migrate_data_source_name = None
         self.quote_tables: bool = data_source_properties.get("quote_tables", False)
+        # Number of queries that DataSourceScan.execute_queries runs at the same time, each on its own connection.
+        self.max_concurrent_queries: int = int(data_source_properties.get("max_concurrent_queries", 1))
+        # Number of tables that column profiling, table discovery and table sampling process at the same time.
+        self.max_concurrent_tables: int = int(data_source_properties.get("max_concurrent_tables", 1))
+        # Fetch the failed rows samples of all metrics of a partition in a single query.  See CombinedSampleQuery.
+        self.combine_failed_rows_samples: bool = bool(data_source_properties.get("combine_failed_rows_samples", False))
+        # Optional local cache of metric values for tables that did not change.  See MetricResultCache.
+        self.metric_cache: MetricResultCache | None = self._create_metric_cache(
+            data_source_properties.get("metric_cache")
+        )
+        # Optional watermark state to aggregate only the new rows of append-only tables.  See IncrementalMetricStore.
+        self.incremental_metric_store: IncrementalMetricStore | None = self._create_incremental_metric_store(
+            data_source_properties.get("incremental_metrics")
+        )
+
+    def _create_metric_cache(self, metric_cache_properties: bool | dict | None) -> MetricResultCache | None:
+        if not metric_cache_properties:
+            return None
+        if not isinstance(metric_cache_properties, dict):
+            metric_cache_properties = {}
+        try:
+            return MetricResultCache(
+                logs=self.logs,
+                path=metric_cache_properties.get("path", DEFAULT_METRIC_CACHE_PATH),
+                ttl_seconds=int(metric_cache_properties.get("ttl", DEFAULT_METRIC_CACHE_TTL_SECONDS)),
+                max_entries=int(metric_cache_properties.get("max_entries", DEFAULT_METRIC_CACHE_MAX_ENTRIES)),
+            )
+        except Exception as e:
+            self.logs.warning(f"Metric cache for data source {self.data_source_name} disabled: {e}")
+            return None
+
+    def _create_incremental_metric_store(
+        self, incremental_metrics_properties: dict | None
+    ) -> IncrementalMetricStore | None:
+        if not incremental_metrics_properties:
+            return None
+        try:
+            watermark_columns = incremental_metrics_properties.get("tables")
+            if not isinstance(watermark_columns, dict) or not watermark_columns:
+                raise ValueError("'tables' must map table names to their watermark column")
+            return IncrementalMetricStore(
+                logs=self.logs,
+                watermark_columns=watermark_columns,
+                path=incremental_metrics_properties.get("path", DEFAULT_INCREMENTAL_METRICS_PATH),
+                max_entries=int(
+                    incremental_metrics_properties.get("max_entries", DEFAULT_INCREMENTAL_METRICS_MAX_ENTRIES)
+                ),
+            )
+        except Exception as e:
+            self.logs.warning(f"Incremental metrics for data source {self.data_source_name} disabled: {e}")
+            return None
+
+    @property
+    def connection(self):
+        """
+        The PEP 249 connection to be used by the current thread.  This is the primary connection unless
+        a pooled connection was bound to the current thread with bind_thread_connection(...)
+        """
+        thread_connections = self.__dict__.get("_thread_connections")
+        thread_connection = getattr(thread_connections, "connection", None) if thread_connections else None
+        if thread_connection is not None:
+            return thread_connection
+        return self.__dict__.get("_connection")
+
+    @connection.setter
+    def connection(self, connection):
+        self._connection = connection
+
+    def bind_thread_connection(self, connection) -> None:
+        self._thread_connections.connection = connection
+
+    def create_pooled_connection(self):
+        """
+        Opens an additional connection for concurrent query execution without replacing the primary connection.
+        Data sources that cannot open a second connection to the same data (eg in-memory databases)
+        should override this method.  ConnectionPool calls this under its lock as connect() temporarily replaces the
+        primary connection.
+        """
+        primary_connection = self._connection
+        try:
+            # Most data sources only assign self.connection in connect() and return None
+            connection = self.connect()
+            if connection is None:
+                connection = self._connection
+            if connection is None or connection is primary_connection:
+                raise DataSourceError(f"Data source '{self.data_source_name}' did not open a new connection")
+            return connection
+        finally:
+            self._connection = primary_connection
 
     def has_valid_connection(self) -> bool:
         query = Query(
@@ -367,6 +473,38 @@ class DataSource:
         sql = f"SELECT {columns_names} FROM {qualified_table_name}{filter_sql}{limit_sql}"
         return sql
 
+    def sql_select_failed_rows_combined(self, table_name: str, conditions: list[str], limits: list[int]) -> str:
+        """
+        Selects the failed rows for multiple conditions in a single pass over the table.  For each condition, two
+        columns are appended to the selected columns: a flag that is 1 if the row matches the condition and a
+        running count of the matching rows, which limits the rows per condition.
+        """
+        qualified_table_name = self.qualified_table_name(table_name)
+        columns_names = ", ".join(self.sql_select_all_column_names(table_name))
+
+        condition_fields = []
+        limit_filters = []
+        for index, (condition, limit) in enumerate(zip(conditions, limits)):
+            flag_expression = f"CASE WHEN {condition} THEN 1 ELSE 0 END"
+            condition_fields.append(f"{flag_expression} AS soda_failed_{index}")
+            condition_fields.append(
+                f"SUM({flag_expression}) OVER (ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS soda_failed_rank_{index}"
+            )
+            limit_filters.append(f"(soda_failed_{index} = 1 AND soda_failed_rank_{index} <= {limit})")
+
+        condition_fields_sql = ",\n    ".join(condition_fields)
+        any_condition_sql = " OR ".join(f"({condition})" for condition in conditions)
+        limit_filters_sql = "\n   OR ".join(limit_filters)
+        return (
+            f"SELECT * FROM (\n"
+            f"  SELECT {columns_names},\n"
+            f"    {condition_fields_sql}\n"
+            f"  FROM {qualified_table_name}\n"
+            f"  WHERE {any_condition_sql}\n"
+            f") failed_rows\n"
+            f"WHERE {limit_filters_sql}"
+        )
+
     def sql_select_all_column_names(self, table_name: str) -> list:
         selectable_columns = []
 
@@ -447,6 +585,7 @@ class DataSource:
             sql=self.sql_get_tables_columns_metadata(
                 include_patterns=include_patterns, exclude_patterns=exclude_patterns, table_names_only=table_names_only
             ),
+            memoize_results=True,
         )
         query.execute()
 
@@ -565,12 +704,17 @@ class DataSource:
         :return: A dict mapping column names to data source data types.  Like eg
         {"id": "varchar", "cst_size": "int8", ...}
         """
+        if included_columns is None and excluded_columns is None:
+            prefetched_rows = self.data_source_scan.get_prefetched_table_columns(table_name)
+            if prefetched_rows is not None:
+                return {row[0]: row[1] for row in prefetched_rows}
         query = Query(
             data_source_scan=self.data_source_scan,
             unqualified_query_name=query_name,
             sql=self.sql_get_table_columns(
                 table_name, included_columns=included_columns, excluded_columns=excluded_columns
             ),
+            memoize_results=True,
         )
         query.execute()
         if query.rows and len(query.rows) > 0:
@@ -631,6 +775,40 @@ class DataSource:
         )
         return sql
 
+    def get_tables_columns_key(self, table_name: str) -> str:
+        """
+        Returns the table name as it appears in the first column of the sql_get_tables_columns result.
+        """
+        table_name_default_case = self.default_casify_table_name(table_name)
+        return table_name_default_case[1:-1] if self.is_quoted(table_name_default_case) else table_name_default_case
+
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        """
+        Returns a single query for the columns of all given tables.  Like sql_get_table_columns, but with the table
+        name (see get_tables_columns_key) as the first column.  Data sources that cannot list the columns of
+        multiple tables at once return None, which makes each table fall back to sql_get_table_columns.
+        """
+        casify_function = self.default_casify_sql_function()
+        table_names_sql = ", ".join(f"'{self.get_tables_columns_key(table_name)}'" for table_name in table_names)
+        filter_clauses = [f"{casify_function}(table_name) IN ({table_names_sql})"]
+
+        if self.database:
+            filter_clauses.append(
+                f"{casify_function}({self.column_metadata_catalog_column()}) = '{self.default_casify_system_name(self.database)}'"
+            )
+
+        if self.schema:
+            filter_clauses.append(f"{casify_function}(table_schema) = '{self.default_casify_system_name(self.schema)}'")
+
+        where_filter = " \n  AND ".join(filter_clauses)
+        sql = (
+            f"SELECT {casify_function}(table_name), {', '.join(self.column_metadata_columns())} \n"
+            f"FROM {self.sql_information_schema_columns()} \n"
+            f"WHERE {where_filter}"
+            f"\nORDER BY {self.get_ordinal_position_name()}"
+        )
+        return sql
+
     ############################################
     # Get table names with count in one go
     ############################################
@@ -706,6 +884,16 @@ class DataSource:
 
         return sql
 
+    def sql_get_table_version(self, table_name: str) -> str | None:
+        """
+        Returns a cheap SQL query that returns a single row that changes whenever the data of the table changes,
+        like a row count and a last modified timestamp from the information schema.  Used to key the metric
+        cache.  The version must be updated with each committed change, so asynchronous or resettable statistics,
+        like the PostgreSQL pg_stat counters, do not qualify.  Data sources that cannot provide such a signal return
+        None, which disables the metric cache.
+        """
+        return None
+
     def sql_information_schema_tables(self) -> str:
         return "information_schema.tables"
 
@@ -737,6 +925,60 @@ class DataSource:
 
         return sql
 
+    def sql_get_duplicates_count_combined(
+        self,
+        table_name: str,
+        columns_and_filters: list[tuple[list[str], str]],
+    ) -> str | None:
+        """
+        Computes the duplicates count of multiple (column names, filter) pairs in a single pass over the table.
+        The frequencies of all column sets are computed with GROUP BY GROUPING SETS and the GROUPING flags of the
+        columns tell to which column set a frequency row belongs.  The result is a single row with a duplicates
+        count per pair, in the order of columns_and_filters.
+        """
+        qualified_table_name = self.qualified_table_name(table_name)
+        all_column_names = list(
+            dict.fromkeys(column for column_names, _ in columns_and_filters for column in column_names)
+        )
+        # Column sets are canonicalized, as the same columns in a different order give the same groups and the same
+        # GROUPING flags.  Duplicate grouping sets would count each duplicate group more than once.
+        canonical_column_sets = [tuple(sorted(set(column_names))) for column_names, _ in columns_and_filters]
+        grouping_sets = list(dict.fromkeys(canonical_column_sets))
+
+        grouping_fields = [
+            f"GROUPING({column_name}) AS grouping_{index}" for index, column_name in enumerate(all_column_names)
+        ]
+        frequency_fields = [
+            f"{self.expr_count_conditional(filter)} AS frequency_{index}"
+            for index, (_, filter) in enumerate(columns_and_filters)
+        ]
+        duplicates_count_fields = []
+        for index, column_set in enumerate(canonical_column_sets):
+            grouping_conditions = [
+                f"grouping_{column_index} = {0 if column_name in column_set else 1}"
+                for column_index, column_name in enumerate(all_column_names)
+            ]
+            condition = " AND ".join(grouping_conditions + [f"frequency_{index} > 1"])
+            duplicates_count_fields.append(self.expr_count_conditional(condition))
+
+        inner_fields = ",\n                       ".join(grouping_fields + frequency_fields)
+        grouping_sets_sql = ", ".join(f"({', '.join(grouping_set)})" for grouping_set in grouping_sets)
+        values_filter = " OR ".join(f"({filter})" for _, filter in columns_and_filters)
+        outer_fields = ",\n                   ".join(duplicates_count_fields)
+
+        sql = dedent(
+            f"""
+            WITH frequencies AS (
+                SELECT {inner_fields}
+                FROM {qualified_table_name}
+                WHERE {values_filter}
+                GROUP BY GROUPING SETS ({grouping_sets_sql}))
+            SELECT {outer_fields}
+            FROM frequencies"""
+        )
+
+        return sql
+
     def sql_get_duplicates_aggregated(
         self,
         column_names: str,
@@ -942,6 +1184,55 @@ class DataSource:
             """
         )
 
+    def profiling_sql_aggregates_numeric_fields(self, column_name: str) -> list[str]:
+        """
+        Aggregation fields for a numeric column in the same order as profiling_sql_aggregates_numeric, used to
+        profile multiple columns of a table in a single query.
+        """
+        column_name = self.quote_column(column_name)
+        return [
+            f"avg({column_name})",
+            f"sum({column_name})",
+            f"var_samp({column_name})",
+            f"stddev_samp({column_name})",
+            self.expr_count(f"distinct({column_name})"),
+            f"sum(case when {column_name} is null then 1 else 0 end)",
+        ]
+
+    def profiling_sql_aggregates_text_fields(self, column_name: str) -> list[str]:
+        """
+        Aggregation fields for a text column in the same order as profiling_sql_aggregates_text, used to
+        profile multiple columns of a table in a single query.
+        """
+        column_name = self.quote_column(column_name)
+        return [
+            self.expr_count(f"distinct({column_name})"),
+            f"sum(case when {column_name} is null then 1 else 0 end)",
+            f"avg({self.expr_length(column_name)})",
+            f"min({self.expr_length(column_name)})",
+            f"max({self.expr_length(column_name)})",
+        ]
+
+    def profiling_sql_histogram_fields(self, column_name: str, bins_list: list[int | float]) -> list[str]:
+        """
+        Histogram fields counting the values of a column per bin directly on the table, used to compute the
+        histograms of multiple columns of a table in a single query.
+        """
+        column_name = self.quote_column(column_name)
+        number_of_bins = len(bins_list)
+        field_clauses = []
+        for i in range(0, number_of_bins):
+            lower_bound = "" if i == 0 else f"{bins_list[i]} <= {column_name}"
+            upper_bound = "" if i == number_of_bins - 1 else f"{column_name} < {bins_list[i + 1]}"
+            optional_and = "" if lower_bound == "" or upper_bound == "" else " AND "
+            field_clauses.append(f"SUM(CASE WHEN {lower_bound}{optional_and}{upper_bound} THEN 1 END)")
+        return field_clauses
+
+    def profiling_sql_multi_column_aggregates(self, table_name: str, fields: list[str]) -> str:
+        qualified_table_name = self.qualified_table_name(table_name)
+        fields_sql = "\n    , ".join(fields)
+        return f"SELECT\n    {fields_sql}\nFROM {qualified_table_name}"
+
     def histogram_sql_and_boundaries(
         self,
         table_name: str,
@@ -951,6 +1242,40 @@ class DataSource:
         n_distinct: int,
         column_type: str,
     ) -> tuple[str | None, list[int | float]]:
+        bins_list = self.histogram_boundaries(table_name, column_name, min_value, max_value, n_distinct, column_type)
+        if not bins_list:
+            return None, []
+        number_of_bins = len(bins_list)
+
+        field_clauses = []
+        for i in range(0, number_of_bins):
+            lower_bound = "" if i == 0 else f"{bins_list[i]} <= value_"
+            upper_bound = "" if i == number_of_bins - 1 else f"value_ < {bins_list[i + 1]}"
+            optional_and = "" if lower_bound == "" or upper_bound == "" else " AND "
+            field_clauses.append(f"SUM(CASE WHEN {lower_bound}{optional_and}{upper_bound} THEN frequency_ END)")
+
+        fields = ",\n ".join(field_clauses)
+
+        value_frequencies_cte = self.profiling_sql_value_frequencies_cte(table_name, column_name)
+
+        sql = dedent(
+            f"""
+            WITH
+                {value_frequencies_cte}
+            SELECT {fields}
+            FROM value_frequencies"""
+        )
+        return sql, bins_list
+
+    def histogram_boundaries(
+        self,
+        table_name: str,
+        column_name: str,
+        min_value: int | float,
+        max_value: int | float,
+        n_distinct: int,
+        column_type: str,
+    ) -> list[int | float]:
         # TODO: make configurable or derive dynamically based on data quantiles etc.
         max_n_bins = 20
         number_of_bins: int = max(1, min(n_distinct, max_n_bins))
@@ -965,7 +1290,7 @@ class DataSource:
                     max_value=max_value,
                 )
             )
-            return None, []
+            return []
 
         bin_width = (max_value - min_value) / number_of_intervals
 
@@ -974,27 +1299,7 @@ class DataSource:
             min_value = int(min_value)
             max_value = int(max_value)
 
-        bins_list = [round(min_value + i * bin_width, 2) for i in range(0, number_of_bins)]
-
-        field_clauses = []
-        for i in range(0, number_of_bins):
-            lower_bound = "" if i == 0 else f"{bins_list[i]} <= value_"
-            upper_bound = "" if i == number_of_bins - 1 else f"value_ < {bins_list[i + 1]}"
-            optional_and = "" if lower_bound == "" or upper_bound == "" else " AND "
-            field_clauses.append(f"SUM(CASE WHEN {lower_bound}{optional_and}{upper_bound} THEN frequency_ END)")
-
-        fields = ",\n ".join(field_clauses)
-
-        value_frequencies_cte = self.profiling_sql_value_frequencies_cte(table_name, column_name)
-
-        sql = dedent(
-            f"""
-            WITH
-                {value_frequencies_cte}
-            SELECT {fields}
-            FROM value_frequencies"""
-        )
-        return sql, bins_list
+        return [round(min_value + i * bin_width, 2) for i in range(0, number_of_bins)]
 
     def sql_test_connection(self) -> str:
         return "SELECT 1"
@@ -1018,6 +1323,7 @@ class DataSource:
                 data_source_scan=self.data_source_scan,
                 unqualified_query_name=query_name or "get_row_counts_all_tables",
                 sql=sql,
+                memoize_results=True,
             )
             query.execute()
             return {self._optionally_quote_table_name_from_meta_data(row[0]): row[1] for row in query.rows}
@@ -1039,6 +1345,7 @@ class DataSource:
             data_source_scan=self.data_source_scan,
             unqualified_query_name=query_name_str,
             sql=self.sql_get_table_count(self.quote_table(table_name)),
+            memoize_results=True,
         )
         query.execute()
         if query.rows:
@@ -1059,6 +1366,7 @@ class DataSource:
             data_source_scan=self.data_source_scan,
             unqualified_query_name=query_name or "get_table_names",
             sql=sql,
+            memoize_results=True,
         )
         query.execute()
         table_names = [self._optionally_quote_table_name_from_meta_data(row[0]) for row in query.rows]
@@ -1417,5 +1725,51 @@ class DataSource:
         sql = f"SELECT \n" f"  {column_name} \n" f"FROM {table_name}{sample_clauses_str}{filter_clauses_str}{limit_str}"
         return sql
 
+    def sql_distribution_binned_counts(
+        self,
+        column_name: str,
+        table_name: str,
+        bins: list[Number],
+        filter_clause: str | None = None,
+        sample_clause: str | None = None,
+    ) -> str:
+        """
+        Returns a SQL query that counts the values of a column per bin of the given (sorted) bin edges,
+        following the numpy histogram semantics: bin i covers [bins[i-1], bins[i]) and the last bin also includes
+        its upper edge.  Bin 0 holds the values below the first edge, bin len(bins) the values above the last edge
+        and bin -1 the nulls.  Each result row contains the bin index, the count, the min and the max value.
+        """
+        last_bin_index = len(bins) - 1
+        bin_widths = [upper - lower for lower, upper in zip(bins, bins[1:])]
+        is_uniform = (
+            len(bin_widths) > 0
+            and bin_widths[0] > 0
+            and all(abs(bin_width - bin_widths[0]) <= 1e-9 * abs(bin_widths[0]) for bin_width in bin_widths)
+        )
+        case_clauses = [
+            f"WHEN {column_name} IS NULL THEN -1",
+            f"WHEN {column_name} < {bins[0]} THEN 0",
+            f"WHEN {column_name} > {bins[-1]} THEN {last_bin_index + 1}",
+            f"WHEN {column_name} = {bins[-1]} THEN {max(last_bin_index, 1)}",
+        ]
+        if is_uniform:
+            # Equal width bins, as generated by soda update-dro, are computed arithmetically
+            case_clauses.append(f"ELSE FLOOR(({column_name} - {bins[0]}) / {bin_widths[0]}) + 1")
+        else:
+            case_clauses.extend(f"WHEN {column_name} < {bins[i]} THEN {i}" for i in range(1, last_bin_index + 1))
+        case_sql = "\n    ".join(case_clauses)
+        values_sql = self.sql_select_column_with_filter_and_limit(
+            column_name=f"CASE\n    {case_sql}\n  END AS bin_index,\n  {column_name} AS bin_value",
+            table_name=table_name,
+            filter_clause=filter_clause,
+            sample_clause=sample_clause,
+        )
+        return (
+            f"SELECT bin_index, {self.expr_count_all()}, {self.expr_min('bin_value')}, {self.expr_max('bin_value')} \n"
+            f"FROM (\n{values_sql}\n) binned_values \n"
+            f"GROUP BY bin_index \n"
+            f"ORDER BY bin_index"
+        )
+
     def expr_false_condition(self):
         return "FALSE"
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from soda.execution.data_source import DataSource
 from soda.telemetry.soda_telemetry import SodaTelemetry
@@ -17,6 +17,8 @@ class DataSourceManager:
         self.data_source_properties_by_name: Dict[str, dict] = configuration.data_source_properties_by_name
         self.connections: Dict[str, object] = {}
         self.data_sources: Dict[str, DataSource] = {}
+        # Set by BatchScan to share the primary connections of data sources between the scans of a batch
+        self.batch_connection_pool: Optional["BatchConnectionPool"] = None
 
     def get_data_source_names(self) -> List[str]:
         return list(self.data_source_properties_by_name.keys())
@@ -45,7 +47,10 @@ class DataSourceManager:
                         )
 
                         try:
-                            data_source.connect()
+                            if self.batch_connection_pool is not None:
+                                self.batch_connection_pool.connect(data_source)
+                            else:
+                                data_source.connect()
                             self.data_sources[data_source_name] = data_source
                         except BaseException as e:
                             self.logs.error(f'Could not connect to data source "{data_source_name}": {e}', exception=e)
@@ -68,6 +73,9 @@ class DataSourceManager:
         return data_source.connection
 
     def close_all_connections(self):
+        if self.batch_connection_pool is not None:
+            for data_source in self.data_sources.values():
+                self.batch_connection_pool.release(data_source)
         for connection_name, connection in self.connections.items():
             try:
                 connection.close()
@@ -1,4 +1,8 @@
-from typing import TYPE_CHECKING, Dict, List
+from collections import defaultdict
+from concurrent.futures import Future
+from functools import partial
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, TypeVar
 
 from soda.execution.check.discover_tables_run import DiscoverTablesRun
 from soda.execution.check.profile_columns_run import ProfileColumnsRun
@@ -6,6 +10,7 @@ from soda.execution.check.sample_tables_run import SampleTablesRun
 from soda.execution.data_source import DataSource
 from soda.execution.metric.metric import Metric
 from soda.execution.query.query import Query
+from soda.execution.query.schema_query import TableColumnsQuery
 from soda.execution.table import Table
 from soda.sodacl.data_source_check_cfg import (
     AutomatedMonitoringCfg,
@@ -18,6 +23,8 @@ from soda.sodacl.data_source_scan_cfg import DataSourceScanCfg
 if TYPE_CHECKING:
     from soda.scan import Scan
 
+T = TypeVar("T")
+
 
 class DataSourceScan:
     def __init__(
@@ -35,6 +42,12 @@ class DataSourceScan:
         self.data_source: DataSource = data_source
         self.tables: Dict[str, Table] = {}
         self.queries: List[Query] = []
+        self.table_versions: Dict[str, Optional[str]] = {}
+        # Column metadata rows per table name, fetched in bulk by prefetch_table_columns
+        self.tables_columns_rows: Dict[str, List[tuple]] = {}
+        # Results of the read queries of this scan by (fetch method, resolved SQL), see get_memoized_query_result
+        self.query_results_memo: Dict[tuple, Future] = {}
+        self.query_results_memo_lock: Lock = Lock()
 
     def get_or_create_table(self, table_name: str) -> Table:
         table = self.tables.get(table_name)
@@ -43,6 +56,94 @@ class DataSourceScan:
             self.tables[table_name] = table
         return table
 
+    def get_memoized_query_result(
+        self, memo_key: tuple, execute_query: Callable[[], Optional[tuple]]
+    ) -> Optional[tuple]:
+        """
+        Returns the result of the identical query that ran earlier in this scan.  If there is none, execute_query runs
+        the query and None is returned.  execute_query returns the result to memoize or None if the query failed.
+        Failed queries are not memoized.  Identical queries that run concurrently wait for the first one so that each
+        distinct statement hits the data source only once.
+        """
+        with self.query_results_memo_lock:
+            future = self.query_results_memo.get(memo_key)
+            is_first_query = future is None
+            if is_first_query:
+                future = Future()
+                self.query_results_memo[memo_key] = future
+
+        if not is_first_query:
+            result = future.result()
+            if result is None:
+                # The first query failed, so this query runs too and reports its own error
+                execute_query()
+            return result
+
+        result = None
+        try:
+            result = execute_query()
+        finally:
+            if result is None:
+                with self.query_results_memo_lock:
+                    self.query_results_memo.pop(memo_key, None)
+            future.set_result(result)
+        return None
+
+    def get_table_version(self, table_name: str) -> Optional[str]:
+        """
+        Returns the version of the table as provided by DataSource.sql_get_table_version or None if the data source
+        does not support table versions.  Computed at most once per table per scan.
+        """
+        if table_name not in self.table_versions:
+            table_version = None
+            sql = self.data_source.sql_get_table_version(table_name)
+            if sql:
+                query = Query(
+                    data_source_scan=self,
+                    unqualified_query_name=f"get_table_version_{table_name}",
+                    sql=sql,
+                )
+                query.execute()
+                if query.rows:
+                    table_version = "|".join(str(value) for value in query.rows[0])
+            self.table_versions[table_name] = table_version
+        return self.table_versions[table_name]
+
+    def prefetch_table_columns(self, table_names: List[str]):
+        """
+        Fetches the columns of all given tables with a single metadata query.  For the rest of the scan,
+        TableColumnsQuery and DataSource.get_table_columns serve the columns of these tables from memory.  If the
+        data source does not support this or the query fails, each table falls back to its own metadata query.
+        """
+        table_names = [
+            table_name for table_name in dict.fromkeys(table_names) if table_name not in self.tables_columns_rows
+        ]
+        if len(table_names) <= 1:
+            return
+        sql = self.data_source.sql_get_tables_columns(table_names)
+        if not sql:
+            return
+        query = Query(
+            data_source_scan=self,
+            unqualified_query_name="get_tables_columns",
+            sql=sql,
+            memoize_results=True,
+        )
+        query.execute()
+        if query.rows is None:
+            return
+
+        rows_by_key: Dict[str, List[tuple]] = defaultdict(list)
+        for row in query.rows:
+            rows_by_key[row[0]].append(tuple(row[1:]))
+        for table_name in table_names:
+            self.tables_columns_rows[table_name] = rows_by_key.get(
+                self.data_source.get_tables_columns_key(table_name), []
+            )
+
+    def get_prefetched_table_columns(self, table_name: str) -> Optional[List[tuple]]:
+        return self.tables_columns_rows.get(table_name)
+
     def resolve_metric(self, metric: Metric) -> Metric:
         """
         If the metric is not added before, this method will:
@@ -68,8 +169,82 @@ class DataSourceScan:
                 all_data_source_queries.extend(partition_queries)
         all_data_source_queries.extend(self.queries)
 
-        for query in all_data_source_queries:
-            query.execute()
+        self.prefetch_table_columns(
+            [query.table.table_name for query in all_data_source_queries if isinstance(query, TableColumnsQuery)]
+        )
+
+        max_concurrent_queries = min(self.data_source.max_concurrent_queries, len(all_data_source_queries))
+        if max_concurrent_queries > 1:
+            self._execute_queries_concurrently(all_data_source_queries, max_concurrent_queries)
+        else:
+            for query in all_data_source_queries:
+                query.execute()
+
+        if self.data_source.combine_failed_rows_samples:
+            for table in self.tables.values():
+                for partition in table.partitions.values():
+                    partition.execute_failed_rows_sample_queries()
+
+    def _execute_queries_concurrently(self, queries: List[Query], max_concurrent_queries: int):
+        def execute_query(query: Query):
+            try:
+                query.execute()
+            except BaseException as e:
+                self.scan._logs.error(f"Query execution error in {query.query_name}: {e}", exception=e)
+
+        self.scan._logs.debug(
+            f"Executing {len(queries)} queries on data source {self.data_source.data_source_name} "
+            f"with {max_concurrent_queries} concurrent connections"
+        )
+        self.run_concurrently([partial(execute_query, query) for query in queries], max_concurrent_queries)
+
+    def run_concurrently(self, tasks: List[Callable[[], T]], max_workers: int) -> List[T]:
+        """
+        Runs the given tasks on a pool of connections and returns their results in the order of the tasks.  Logs
+        and the queries appended to scan._queries are captured per task and replayed in the original task order,
+        so the outcome does not depend on timing.  If a task raises, the exception is re-raised after the logs of
+        the preceding tasks and of the failing task have been replayed.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from soda.execution.connection_pool import ConnectionPool
+
+        if max_workers <= 1 or len(tasks) <= 1:
+            return [task() for task in tasks]
+
+        logs = self.scan._logs
+        max_workers = min(max_workers, len(tasks))
+        connection_pool = ConnectionPool(self.data_source, max_workers)
+
+        def run_task(task: Callable[[], T]):
+            result, exception = None, None
+            with logs.capture() as captured_logs, self.scan._capture_queries() as captured_queries:
+                with connection_pool.borrow():
+                    try:
+                        result = task()
+                    except BaseException as e:
+                        exception = e
+            return result, exception, captured_logs, captured_queries
+
+        results = []
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"soda-{self.data_source.data_source_name}"
+            ) as executor:
+                futures = [executor.submit(run_task, task) for task in tasks]
+                for future in futures:
+                    result, exception, captured_logs, captured_queries = future.result()
+                    logs.replay(captured_logs)
+                    for captured_query in captured_queries:
+                        self.scan._append_query(captured_query)
+                    if exception is not None:
+                        for pending_future in futures:
+                            pending_future.cancel()
+                        raise exception
+                    results.append(result)
+        finally:
+            connection_pool.close()
+        return results
 
     def run(self, data_source_check_cfg: DataSourceScanCfg, scan: "Scan"):
         if isinstance(data_source_check_cfg, AutomatedMonitoringCfg):
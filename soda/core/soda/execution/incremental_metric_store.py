@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from soda.common.logs import Logs
+from soda.execution.metric_result_cache import (
+    deserialize_metric_value,
+    serialize_metric_value,
+)
+
+DEFAULT_INCREMENTAL_METRICS_PATH = "~/.soda/incremental_metrics.db"
+DEFAULT_INCREMENTAL_METRICS_MAX_ENTRIES = 100_000
+
+# How the value of a metric on the new rows of a table is combined with the value on the rows of previous scans
+INCREMENTAL_METRIC_COMBINERS = {
+    "row_count": lambda stored_value, new_value: stored_value + new_value,
+    "missing_count": lambda stored_value, new_value: stored_value + new_value,
+    "invalid_count": lambda stored_value, new_value: stored_value + new_value,
+    "valid_count": lambda stored_value, new_value: stored_value + new_value,
+    "sum": lambda stored_value, new_value: stored_value + new_value,
+    "min": min,
+    "max": max,
+    "min_length": min,
+    "max_length": max,
+}
+
+
+def combine_incremental_metric_value(metric_name: str, stored_value: object, new_value: object) -> object:
+    # NULL is the value of sum, min and max on no rows
+    if stored_value is None:
+        return new_value
+    if new_value is None:
+        return stored_value
+    return INCREMENTAL_METRIC_COMBINERS[metric_name](stored_value, new_value)
+
+
+class IncrementalMetricStore:
+    """
+    Local SQLite store of the metric values and the high-watermark of append-only tables, so that aggregation
+    queries only have to aggregate the rows that were added since the previous scan.
+
+    A table is incremental if it has a watermark column whose value is higher for new rows than for all existing
+    rows, like an insertion timestamp or an auto-increment id.  Each scan aggregates the rows above the stored
+    watermark and combines the result with the stored values, which works for the counts, sum, min and max metrics
+    of INCREMENTAL_METRIC_COMBINERS.  Updates and deletes of existing rows are not detected.
+
+    States are keyed on the metric identities and the SQL of the aggregation query, so a changed metric or filter
+    starts over with a full aggregation.  The states that were least recently updated are evicted once there are
+    more than max_entries, which removes the states of changed metrics and filters.
+    """
+
+    def __init__(
+        self,
+        logs: Logs,
+        watermark_columns: dict[str, str],
+        path: str = DEFAULT_INCREMENTAL_METRICS_PATH,
+        max_entries: int = DEFAULT_INCREMENTAL_METRICS_MAX_ENTRIES,
+    ):
+        self.logs = logs
+        # Watermark column name by table name
+        self.watermark_columns: dict[str, str] = watermark_columns
+        self.path: str = os.path.expanduser(path)
+        self.max_entries: int = max_entries
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # Aggregation queries may be executed concurrently, access is serialized with self._lock
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS incremental_metrics ("
+                "  state_key TEXT PRIMARY KEY,"
+                "  watermark TEXT NOT NULL,"
+                "  metric_values TEXT NOT NULL,"
+                "  updated_at REAL NOT NULL"
+                ")"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS incremental_metrics_updated_at ON incremental_metrics (updated_at)"
+            )
+
+    def get_watermark_column(self, table_name: str) -> str | None:
+        return self.watermark_columns.get(table_name)
+
+    @staticmethod
+    def create_state_key(metric_identities: list[str], aggregation_sql: str, watermark_column: str) -> str:
+        key_parts = json.dumps([metric_identities, aggregation_sql, watermark_column])
+        return hashlib.sha256(key_parts.encode("utf-8")).hexdigest()
+
+    def get(self, state_key: str) -> tuple[object, list[object]] | None:
+        """
+        Returns a tuple (watermark, metric_values) or None if there is no state for the key.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT watermark, metric_values FROM incremental_metrics WHERE state_key = ?", (state_key,)
+            ).fetchone()
+        if row is None:
+            return None
+        watermark = deserialize_metric_value(row[0])
+        metric_values = [deserialize_metric_value(metric_value) for metric_value in json.loads(row[1])]
+        return watermark, metric_values
+
+    def put(self, state_key: str, watermark: object, metric_values: list[object]) -> None:
+        try:
+            serialized_watermark = serialize_metric_value(watermark)
+            serialized_metric_values = json.dumps([serialize_metric_value(value) for value in metric_values])
+        except TypeError as e:
+            self.logs.debug(f"Incremental metrics state not stored: {e}")
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO incremental_metrics (state_key, watermark, metric_values, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (state_key, serialized_watermark, serialized_metric_values, time.time()),
+            )
+            self._connection.execute(
+                "DELETE FROM incremental_metrics WHERE state_key IN ("
+                "  SELECT state_key FROM incremental_metrics ORDER BY updated_at DESC LIMIT -1 OFFSET ?"
+                ")",
+                (self.max_entries,),
+            )
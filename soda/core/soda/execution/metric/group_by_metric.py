@@ -1,3 +1,4 @@
+from soda.common.columnar_rows import ColumnarRows
 from soda.execution.metric.query_metric import QueryMetric
 from soda.execution.query.group_by_query import GroupByQuery
 
@@ -23,5 +24,17 @@ class GroupByMetric(QueryMetric):
                 metric=self,
                 location=location,
                 partition=self.partition,
+                group_limit=check.check_cfg.group_limit if check else 1000,
             )
         )
+
+    def get_cloud_dict(self):
+        return self._with_row_dicts(super().get_cloud_dict())
+
+    def get_dict(self):
+        return self._with_row_dicts(super().get_dict())
+
+    def _with_row_dicts(self, metric_dict: dict) -> dict:
+        if isinstance(self.value, ColumnarRows):
+            metric_dict["value"] = self.value.to_dicts()
+        return metric_dict
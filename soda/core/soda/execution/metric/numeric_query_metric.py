@@ -337,6 +337,7 @@ class NumericQueryMetric(QueryMetric):
             # whole Failed Rows Analysis is tied to existence of a failed rows sample file.
             if self.samples_limit > 0:
                 sample_query = SampleQuery(self.data_source_scan, self, "failed_rows", sql)
+                sample_query.failed_rows_condition = where_sql
 
                 sample_query.passing_sql = self.data_source_scan.data_source.sql_select_all(
                     self.partition.table.table_name, filter=passing_where_sql
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from decimal import Decimal
+
+from soda.common.logs import Logs
+
+DEFAULT_METRIC_CACHE_PATH = "~/.soda/metric_cache.db"
+DEFAULT_METRIC_CACHE_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_METRIC_CACHE_MAX_ENTRIES = 100_000
+
+
+class MetricResultCache:
+    """
+    Local SQLite store of metric values so that aggregation queries on tables that did not change since the
+    previous scan can be skipped.
+
+    Entries are keyed on the metric identity, the SQL that computes the metric and a table version.  The table
+    version is a cheap signal provided by the data source (see DataSource.sql_get_table_version) that changes
+    whenever the table data changes, like a row count combined with a last modified timestamp.  Entries expire
+    after ttl_seconds and the oldest entries are evicted once there are more than max_entries.
+    """
+
+    def __init__(
+        self,
+        logs: Logs,
+        path: str = DEFAULT_METRIC_CACHE_PATH,
+        ttl_seconds: int = DEFAULT_METRIC_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_METRIC_CACHE_MAX_ENTRIES,
+    ):
+        self.logs = logs
+        self.path: str = os.path.expanduser(path)
+        self.ttl_seconds: int = ttl_seconds
+        self.max_entries: int = max_entries
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # Aggregation queries may be executed concurrently, access is serialized with self._lock
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS metric_results ("
+                "  cache_key TEXT PRIMARY KEY,"
+                "  metric_identity TEXT NOT NULL,"
+                "  value TEXT NOT NULL,"
+                "  created_at REAL NOT NULL"
+                ")"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS metric_results_created_at ON metric_results (created_at)"
+            )
+            self._connection.execute(
+                "DELETE FROM metric_results WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+
+    @staticmethod
+    def create_cache_key(metric_identity: str, metric_sql: str, table_version: str) -> str:
+        key_parts = json.dumps([metric_identity, metric_sql, table_version])
+        return hashlib.sha256(key_parts.encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str) -> tuple[bool, object]:
+        """
+        Returns a tuple (is_hit, value) as None is a valid metric value.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM metric_results WHERE cache_key = ? AND created_at >= ?",
+                (cache_key, time.time() - self.ttl_seconds),
+            ).fetchone()
+        if row is None:
+            return False, None
+        return True, deserialize_metric_value(row[0])
+
+    def put(self, cache_key: str, metric_identity: str, value: object) -> None:
+        try:
+            serialized_value = serialize_metric_value(value)
+        except TypeError as e:
+            self.logs.debug(f"Metric {metric_identity} not cached: {e}")
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO metric_results (cache_key, metric_identity, value, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (cache_key, metric_identity, serialized_value, time.time()),
+            )
+            self._connection.execute(
+                "DELETE FROM metric_results WHERE cache_key IN ("
+                "  SELECT cache_key FROM metric_results ORDER BY created_at DESC LIMIT -1 OFFSET ?"
+                ")",
+                (self.max_entries,),
+            )
+
+
+def serialize_metric_value(value: object) -> str:
+    # Values are stored with their type so that they are restored exactly as the data source returned them
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return json.dumps({"type": "json", "value": value})
+    if isinstance(value, Decimal):
+        return json.dumps({"type": "decimal", "value": str(value)})
+    if isinstance(value, datetime.datetime):
+        return json.dumps({"type": "datetime", "value": value.isoformat()})
+    if isinstance(value, datetime.date):
+        return json.dumps({"type": "date", "value": value.isoformat()})
+    raise TypeError(f"Unsupported metric value type {type(value).__name__}")
+
+
+def deserialize_metric_value(serialized_value: str) -> object:
+    typed_value = json.loads(serialized_value)
+    value_type = typed_value["type"]
+    value = typed_value["value"]
+    if value_type == "decimal":
+        return Decimal(value)
+    if value_type == "datetime":
+        return datetime.datetime.fromisoformat(value)
+    if value_type == "date":
+        return datetime.date.fromisoformat(value)
+    return value
@@ -56,15 +56,19 @@ class Partition:
                 sql_aggregation_expression = metric.get_sql_aggregation_expression()
                 if sql_aggregation_expression:
                     max_aggregation_fields = self.data_source_scan.data_source.get_max_aggregation_fields()
-                    if (
-                        len(self.aggregation_queries) == 0
-                        or len(self.aggregation_queries[-1].metrics) >= max_aggregation_fields
-                    ):
+                    # Incrementally aggregated metrics get their own aggregation queries
+                    watermark_column = self.get_incremental_watermark_column(metric)
+                    aggregation_queries = [
+                        aggregation_query
+                        for aggregation_query in self.aggregation_queries
+                        if aggregation_query.watermark_column == watermark_column
+                    ]
+                    if len(aggregation_queries) == 0 or len(aggregation_queries[-1].metrics) >= max_aggregation_fields:
                         aggregation_query_index = len(self.aggregation_queries)
-                        aggregation_query = AggregationQuery(self, aggregation_query_index)
+                        aggregation_query = AggregationQuery(self, aggregation_query_index, watermark_column)
                         self.aggregation_queries.append(aggregation_query)
                     else:
-                        aggregation_query = self.aggregation_queries[-1]
+                        aggregation_query = aggregation_queries[-1]
                     aggregation_query.add_metric(sql_aggregation_expression, metric)
                     metric.queries.append(aggregation_query)
                 else:
@@ -72,14 +76,50 @@ class Partition:
         else:
             self.logs.error(f"Unsupported metric {metric.name} ({type(metric).__name__})")
 
+    def get_incremental_watermark_column(self, metric: NumericQueryMetric) -> str | None:
+        """
+        Returns the watermark column of the table if the metric can be aggregated incrementally, see
+        IncrementalMetricStore.  Custom aggregation expressions are never aggregated incrementally.
+        """
+        from soda.execution.incremental_metric_store import INCREMENTAL_METRIC_COMBINERS
+
+        incremental_metric_store = self.data_source_scan.data_source.incremental_metric_store
+        if incremental_metric_store is None or metric.name not in INCREMENTAL_METRIC_COMBINERS or metric.aggregation:
+            return None
+        return incremental_metric_store.get_watermark_column(self.table.table_name)
+
     def collect_queries(self) -> list[Query]:
         queries: list[Query] = []
         if self.schema_query:
             queries.append(self.schema_query)
         queries.extend(self.aggregation_queries)
-        queries.extend(self.duplicate_queries)
+        if len(self.duplicate_queries) > 1 and self.data_source_scan.data_source.SUPPORTS_GROUPING_SETS:
+            from soda.execution.query.combined_duplicates_query import (
+                CombinedDuplicatesQuery,
+            )
+
+            queries.append(CombinedDuplicatesQuery(self, self.duplicate_queries))
+        else:
+            queries.extend(self.duplicate_queries)
         return queries
 
+    def execute_failed_rows_sample_queries(self):
+        """
+        Executes the failed rows sample queries that the aggregation queries deferred, in a single query if there
+        are multiple.
+        """
+        from soda.execution.query.combined_sample_query import CombinedSampleQuery
+
+        sample_queries = [
+            sample_query
+            for aggregation_query in self.aggregation_queries
+            for sample_query in aggregation_query.deferred_sample_queries
+        ]
+        if len(sample_queries) == 1:
+            sample_queries[0].execute()
+        elif len(sample_queries) > 1:
+            CombinedSampleQuery(self, sample_queries).execute()
+
     @classmethod
     def get_partition_name(cls, partition):
         return partition.partition_name if isinstance(partition, Partition) else None
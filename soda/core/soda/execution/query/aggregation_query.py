@@ -1,20 +1,26 @@
-from typing import List
+from typing import List, Optional
 
 from soda.execution.query.query import Query
+from soda.execution.query.sample_query import SampleQuery
 
 
 class AggregationQuery(Query):
-    def __init__(self, partition: "Partition", aggregation_query_index: int):
+    def __init__(self, partition: "Partition", aggregation_query_index: int, watermark_column: Optional[str] = None):
         super().__init__(
             data_source_scan=partition.data_source_scan,
             table=partition.table,
             partition=partition,
             unqualified_query_name=f"aggregation[{aggregation_query_index}]",
+            memoize_results=True,
         )
         from soda.execution.metric.query_metric import QueryMetric
 
         self.select_expressions: List[str] = []
         self.metrics: List[QueryMetric] = []
+        # Failed rows sample queries that Partition.execute_failed_rows_sample_queries combines in a single query
+        self.deferred_sample_queries: List[SampleQuery] = []
+        # Set if the metrics are aggregated incrementally, see IncrementalMetricStore
+        self.watermark_column: Optional[str] = watermark_column
 
     def add_metric(self, sql_expression: str, metric: "Metric"):
         self.select_expressions.append(sql_expression)
@@ -22,22 +28,129 @@ class AggregationQuery(Query):
 
     def execute(self):
         scan = self.data_source_scan.scan
-        select_expression_sql = f",\n  ".join(self.select_expressions)
-        self.sql = f"SELECT \n" f"  {select_expression_sql} \n" f"FROM {self.partition.table.qualified_table_name}"
-
+        select_expressions = self.select_expressions
         partition_filter = self.partition.sql_partition_filter
-        if partition_filter:
-            resolved_filter = scan.jinja_resolve(definition=partition_filter)
-            self.sql += f"\nWHERE {resolved_filter}"
-        self.sql = self.data_source_scan.scan.jinja_resolve(self.sql)
+        resolved_filter = scan.jinja_resolve(definition=partition_filter) if partition_filter else None
+        self.sql = self._build_sql(select_expressions, resolved_filter)
+
+        cache_keys = None
+        incremental_state_key = None
+        incremental_state = None
+        if self.watermark_column:
+            incremental_metric_store = self.data_source_scan.data_source.incremental_metric_store
+            incremental_state_key = incremental_metric_store.create_state_key(
+                [metric.identity for metric in self.metrics], self.sql, self.watermark_column
+            )
+            incremental_state = incremental_metric_store.get(incremental_state_key)
+            select_expressions = select_expressions + [f"MAX({self.watermark_column})"]
+            if incremental_state:
+                watermark_literal = self.data_source_scan.data_source.literal(incremental_state[0])
+                watermark_filter = f"{self.watermark_column} > {watermark_literal}"
+                resolved_filter = f"({resolved_filter}) AND {watermark_filter}" if resolved_filter else watermark_filter
+                self.logs.info(
+                    f"Incremental aggregation for query {self.query_name}, aggregating rows {watermark_filter}"
+                )
+            self.sql = self._build_sql(select_expressions, resolved_filter)
+        else:
+            cache_keys = self._get_metric_cache_keys(resolved_filter)
+            if cache_keys and self._set_cached_metric_values(cache_keys):
+                return
+
         self.fetchone()
         if self.row:
-            for i in range(0, len(self.row)):
+            fetched_values = self.row
+            if self.watermark_column:
+                fetched_values = self._combine_incremental_metric_values(incremental_state_key, incremental_state)
+            for i in range(0, len(self.metrics)):
                 metric = self.metrics[i]
-                fetched_value = self.row[i]
+                fetched_value = fetched_values[i]
                 metric.set_value(fetched_value)
+                if cache_keys:
+                    self.data_source_scan.data_source.metric_cache.put(cache_keys[i], metric.identity, fetched_value)
+
+                self._execute_failed_rows_sample_query(metric)
+
+    def _build_sql(self, select_expressions: List[str], resolved_filter: Optional[str]) -> str:
+        select_expression_sql = f",\n  ".join(select_expressions)
+        sql = f"SELECT \n" f"  {select_expression_sql} \n" f"FROM {self.partition.table.qualified_table_name}"
+        if resolved_filter:
+            sql += f"\nWHERE {resolved_filter}"
+        return self.data_source_scan.scan.jinja_resolve(sql)
+
+    def _combine_incremental_metric_values(
+        self, incremental_state_key: str, incremental_state: Optional[tuple]
+    ) -> List[object]:
+        """
+        Combines the metric values of the new rows in self.row with the stored metric values and stores the result
+        with the new watermark.  The last value of self.row is the maximum watermark column value of the new rows.
+        """
+        from soda.execution.incremental_metric_store import (
+            combine_incremental_metric_value,
+        )
+
+        metric_values = list(self.row[:-1])
+        watermark = self.row[-1]
+        if incremental_state:
+            stored_watermark, stored_metric_values = incremental_state
+            metric_values = [
+                combine_incremental_metric_value(metric.name, stored_metric_value, metric_value)
+                for metric, stored_metric_value, metric_value in zip(self.metrics, stored_metric_values, metric_values)
+            ]
+            if watermark is None:
+                # No new rows
+                watermark = stored_watermark
+        if watermark is not None:
+            self.data_source_scan.data_source.incremental_metric_store.put(
+                incremental_state_key, watermark, metric_values
+            )
+        return metric_values
+
+    def _get_metric_cache_keys(self, resolved_filter: Optional[str]) -> Optional[List[str]]:
+        """
+        Returns the metric cache key for each metric or None if the metric cache is not enabled or the data source
+        cannot provide a version for the table.
+        """
+        metric_cache = self.data_source_scan.data_source.metric_cache
+        if metric_cache is None:
+            return None
+        table_version = self.data_source_scan.get_table_version(self.partition.table.table_name)
+        if table_version is None:
+            return None
+        # The table and the filter are part of the key so that a changed partition filter is not served from cache
+        scan = self.data_source_scan.scan
+        from_sql = f"FROM {self.partition.table.qualified_table_name} WHERE {resolved_filter}"
+        return [
+            metric_cache.create_cache_key(
+                metric.identity, f"{scan.jinja_resolve(select_expression)} {from_sql}", table_version
+            )
+            for metric, select_expression in zip(self.metrics, self.select_expressions)
+        ]
+
+    def _set_cached_metric_values(self, cache_keys: List[str]) -> bool:
+        """
+        Sets the metric values from the metric cache if all of them are cached.  Returns True if the query can be
+        skipped.
+        """
+        metric_cache = self.data_source_scan.data_source.metric_cache
+        cached_values = []
+        for cache_key in cache_keys:
+            is_hit, cached_value = metric_cache.get(cache_key)
+            if not is_hit:
+                self.logs.debug(f"Metric cache miss for query {self.query_name}")
+                return False
+            cached_values.append(cached_value)
+
+        self.logs.info(f"Metric cache hit for query {self.query_name}, skipped query on unchanged table")
+        for metric, cached_value in zip(self.metrics, cached_values):
+            metric.set_value(cached_value)
+            self._execute_failed_rows_sample_query(metric)
+        return True
 
-                sample_query = metric.create_failed_rows_sample_query()
-                if sample_query:
-                    metric.queries.append(sample_query)
-                    sample_query.execute()
+    def _execute_failed_rows_sample_query(self, metric: "Metric"):
+        sample_query = metric.create_failed_rows_sample_query()
+        if sample_query:
+            metric.queries.append(sample_query)
+            if self.data_source_scan.data_source.combine_failed_rows_samples and sample_query.failed_rows_condition:
+                self.deferred_sample_queries.append(sample_query)
+            else:
+                sample_query.execute()
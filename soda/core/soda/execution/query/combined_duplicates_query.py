@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from soda.execution.query.duplicates_query import DuplicatesQuery
+from soda.execution.query.query import Query
+
+
+class CombinedDuplicatesQuery(Query):
+    """
+    Computes the duplicate_count metrics of a partition in a single pass over the table instead of a GROUP BY
+    query per metric, see DataSource.sql_get_duplicates_count_combined.  Failed rows samples are still fetched
+    per metric by the original DuplicatesQuery.
+    """
+
+    def __init__(self, partition: Partition, duplicates_queries: list[DuplicatesQuery]):
+        super().__init__(
+            data_source_scan=partition.data_source_scan,
+            table=partition.table,
+            partition=partition,
+            unqualified_query_name="duplicate_count_combined",
+        )
+        self.duplicates_queries: list[DuplicatesQuery] = duplicates_queries
+
+        data_source = self.data_source_scan.data_source
+        self.sql = self.data_source_scan.scan.jinja_resolve(
+            data_source.sql_get_duplicates_count_combined(
+                table_name=partition.table.table_name,
+                columns_and_filters=[
+                    (duplicates_query.metric.metric_args, duplicates_query.values_filter)
+                    for duplicates_query in duplicates_queries
+                ],
+            )
+        )
+
+    def execute(self):
+        self.fetchone()
+        if self.row:
+            for duplicates_query, duplicates_count in zip(self.duplicates_queries, self.row):
+                duplicates_query.set_duplicates_count(duplicates_count)
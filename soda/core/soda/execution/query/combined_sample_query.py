@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from soda.common.memory_safe_cursor_fetcher import MemorySafeCursorFetcher
+from soda.execution.query.query import Query
+from soda.execution.query.sample_query import SampleQuery
+from soda.sampler.memory_sample import MemorySample
+
+
+class CombinedSampleQuery(Query):
+    """
+    Fetches the failed rows samples of multiple metrics of a partition in a single pass over the table.  Each row
+    is tagged with the metrics for which it is a failed row, see DataSource.sql_select_failed_rows_combined.  The
+    rows are then split in a sample per metric, which is stored through the original SampleQuery.
+    """
+
+    def __init__(self, partition: Partition, sample_queries: list[SampleQuery]):
+        super().__init__(
+            data_source_scan=partition.data_source_scan,
+            partition=partition,
+            unqualified_query_name="failed_rows_combined",
+        )
+        self.sample_queries: list[SampleQuery] = sample_queries
+
+    def execute(self):
+        data_source = self.data_source_scan.data_source
+        self.sql = data_source.sql_select_failed_rows_combined(
+            table_name=self.partition.table.table_name,
+            conditions=[sample_query.failed_rows_condition for sample_query in self.sample_queries],
+            limits=[sample_query.samples_limit for sample_query in self.sample_queries],
+        )
+        self.sql = self.data_source_scan.scan.jinja_resolve(self.sql)
+
+        for cursor in self._execute_cursor():
+            safe_fetcher = MemorySafeCursorFetcher(
+                cursor,
+                limit=sum(sample_query.samples_limit for sample_query in self.sample_queries),
+                logs=self.logs,
+            )
+            self.rows = safe_fetcher.get_rows()
+            self.row_count = safe_fetcher.get_row_count()
+
+        if self.rows is None:
+            return
+
+        # The last two columns per sample query are its failed row flag and rank, see sql_select_failed_rows_combined
+        sample_column_count = len(self.description) - 2 * len(self.sample_queries)
+        sample_description = self.description[:sample_column_count]
+        for index, sample_query in enumerate(self.sample_queries):
+            flag_index = sample_column_count + 2 * index
+            # Rows beyond the samples limit of this query are selected because they fail another query
+            sample_rows = [
+                tuple(row[:sample_column_count])
+                for row in self.rows
+                if row[flag_index] == 1 and row[flag_index + 1] <= sample_query.samples_limit
+            ]
+            sample_query.store_sample(MemorySample(sample_rows, sample_description, data_source))
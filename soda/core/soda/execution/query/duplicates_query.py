@@ -26,6 +26,7 @@ class DuplicatesQuery(Query):
             values_filter_clauses.append(metric.filter)
 
         values_filter = " \n  AND ".join(values_filter_clauses)
+        self.values_filter: str = values_filter
 
         column_names = ", ".join(self.metric.metric_args)
 
@@ -83,28 +84,34 @@ class DuplicatesQuery(Query):
     def execute(self):
         self.fetchone()
         if self.row:
-            duplicates_count = self.row[0]
-            self.metric.set_value(duplicates_count)
-
-            if duplicates_count and self.samples_limit > 0:
-                # TODO: Sample Query execute implicitly stores the failed rows file reference in the passed on metric.
-                sample_query = SampleQuery(
-                    self.data_source_scan,
-                    self.metric,
-                    "failed_rows",
-                    self.failed_rows_sql,
-                )
-                sample_query.execute()
-
-            # TODO: This should be a second failed rows file, refactor failed rows to support multiple files.
-            if self.failing_rows_sql_aggregated and self.samples_limit > 0:
-                aggregate_sample_query = Query(
-                    self.data_source_scan,
-                    self.partition.table,
-                    self.partition,
-                    unqualified_query_name=f"duplicate_count[{'-'.join(self.metric.metric_args)}].failed_rows.aggregated",
-                    sql=self.failing_rows_sql_aggregated,
-                    samples_limit=self.samples_limit,
-                )
-                aggregate_sample_query.execute()
-                self.aggregated_failed_rows_data = aggregate_sample_query.rows
+            self.set_duplicates_count(self.row[0])
+
+    def set_duplicates_count(self, duplicates_count: int):
+        """
+        Sets the metric value and fetches the failed rows samples.  Also used by CombinedDuplicatesQuery, which
+        computes the duplicates count of multiple metrics in a single query.
+        """
+        self.metric.set_value(duplicates_count)
+
+        if duplicates_count and self.samples_limit > 0:
+            # TODO: Sample Query execute implicitly stores the failed rows file reference in the passed on metric.
+            sample_query = SampleQuery(
+                self.data_source_scan,
+                self.metric,
+                "failed_rows",
+                self.failed_rows_sql,
+            )
+            sample_query.execute()
+
+        # TODO: This should be a second failed rows file, refactor failed rows to support multiple files.
+        if self.failing_rows_sql_aggregated and self.samples_limit > 0:
+            aggregate_sample_query = Query(
+                self.data_source_scan,
+                self.partition.table,
+                self.partition,
+                unqualified_query_name=f"duplicate_count[{'-'.join(self.metric.metric_args)}].failed_rows.aggregated",
+                sql=self.failing_rows_sql_aggregated,
+                samples_limit=self.samples_limit,
+            )
+            aggregate_sample_query.execute()
+            self.aggregated_failed_rows_data = aggregate_sample_query.rows
@@ -21,10 +21,7 @@ class GroupByQuery(Query):
         self.metric = metric
 
     def execute(self):
-        self.fetchall()
-
-        results = []
-        columns = [column[0] for column in self.description]
-        for row in self.rows:
-            results.append(dict(zip(columns, row)))
-        self.metric.set_value(results)
+        # One row more than the group limit is fetched so that the group check can detect that the limit is exceeded
+        self.fetchall_columnar(limit=self.group_limit + 1)
+        if self.rows is not None:
+            self.metric.set_value(self.rows)
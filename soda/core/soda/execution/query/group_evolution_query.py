@@ -23,6 +23,7 @@ class GroupEvolutionQuery(Query):
         self.metric = metric
 
     def execute(self):
-        self.fetchall()
-        # Only single value per group is supported and we skip nulls
-        self.metric.set_value([r[0] for r in self.rows if r[0] is not None])
+        self.fetchall_columnar()
+        if self.rows is not None:
+            # Only single value per group is supported and we skip nulls
+            self.metric.set_value([group for group in self.rows.get_column(0) if group is not None])
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from typing import Callable
 
+from soda.common.columnar_rows import ColumnarRows
 from soda.common.exception_helper import get_exception_stacktrace
 from soda.common.memory_safe_cursor_fetcher import MemorySafeCursorFetcher
 from soda.common.query_helper import parse_columns_from_query
 from soda.common.string_helper import strip_quotes
 from soda.common.undefined_instance import undefined
 from soda.sampler.db_sample import DbSample
+from soda.sampler.sample import Sample
 from soda.sampler.sample_context import SampleContext
 from soda.sampler.sampler import Sampler
 
@@ -24,6 +27,7 @@ class Query:
         sample_name: str = "failed_rows",
         location: Location | None = None,
         samples_limit: int | None = None,
+        memoize_results: bool = False,
     ):
         self.logs = data_source_scan.scan._logs
         self.data_source_scan = data_source_scan
@@ -36,6 +40,10 @@ class Query:
         self.column: Column | None = column
         self.location: Location | None = location
         self.samples_limit: int | None = samples_limit
+        # Whether fetchone and fetchall can be served from the results of an identical query that ran earlier in the
+        # scan, see DataSourceScan.get_memoized_query_result.  Only enabled for the metadata, row count and
+        # aggregation queries that Soda generates, as user provided SQL is not guaranteed to be free of side effects.
+        self.memoize_results: bool = memoize_results
 
         # The SQL query that is used _fetchone or _fetchall or _store
         # This field can also be initialized in the execute method before any of _fetchone,
@@ -50,11 +58,13 @@ class Query:
         # Following fields are initialized in execute method
         self.description: tuple | None = None
         self.row: tuple | None = None
-        self.rows: list[tuple] | None = None
+        self.rows: list[tuple] | ColumnarRows | None = None
         self.row_count: int | None = None
         self.sample_ref: SampleRef | None = None
         self.exception: BaseException | None = None
         self.duration: timedelta | None = None
+        # True if the results were served from the query results memo of the scan instead of the data source
+        self.is_memoized: bool = False
 
     def get_cloud_dicts(self) -> list(dict(str, any)):
         dicts = [self.get_dict()]
@@ -149,6 +159,9 @@ class Query:
         DataSource query execution exceptions will be caught and result in the
         self.exception being populated.
         """
+        self._fetch_memoized("fetchone", self._fetchone)
+
+    def _fetchone(self):
         for cursor in self._execute_cursor():
             self.row = cursor.fetchone()
             self.row_count = 1 if self.row is not None else 0
@@ -158,30 +171,55 @@ class Query:
         DataSource query execution exceptions will be caught and result in the
         self.exception being populated.
         """
+        self._fetch_memoized("fetchall", self._fetchall)
+
+    def _fetchall(self):
         for cursor in self._execute_cursor():
-            safe_fetcher = MemorySafeCursorFetcher(cursor)
+            safe_fetcher = MemorySafeCursorFetcher(cursor, logs=self.logs)
             self.rows = safe_fetcher.get_rows()
             self.row_count = safe_fetcher.get_row_count()
 
+    def fetchall_columnar(self, limit: int | None = None):
+        """
+        Like fetchall, but stores at most limit rows in self.rows as ColumnarRows, which keeps a list per column
+        instead of a tuple per row.  Use for results that can have many rows and that are processed per column.
+        """
+        self._fetch_memoized(f"fetchall_columnar[{limit}]", lambda: self._fetchall_columnar(limit))
+
+    def _fetchall_columnar(self, limit: int | None):
+        for cursor in self._execute_cursor():
+            self.rows = ColumnarRows.from_cursor(cursor, limit)
+            self.row_count = len(self.rows)
+
+    def _fetch_memoized(self, fetch_method_name: str, fetch: Callable[[], None]):
+        if not self.memoize_results or not self.sql:
+            fetch()
+            return
+
+        def execute_query() -> tuple | None:
+            fetch()
+            return None if self.exception else (self.description, self.row, self.rows, self.row_count)
+
+        memoized_result = self.data_source_scan.get_memoized_query_result((fetch_method_name, self.sql), execute_query)
+        if memoized_result is not None:
+            self.description, self.row, rows, self.row_count = memoized_result
+            # A copy, so that queries that modify their rows do not affect each other.  ColumnarRows are not modified.
+            self.rows = list(rows) if isinstance(rows, list) else rows
+            self.is_memoized = True
+            self.duration = timedelta(0)
+            self.__append_to_scan()
+            self.logs.debug(f"Query {self.query_name} served from the query results memo:\n{self.sql}")
+
     def store(self):
         """
         DataSource query execution exceptions will be caught and result in the
         self.exception being populated.
         """
-        sampler: Sampler = self.data_source_scan.scan._configuration.sampler
         for cursor in self._execute_cursor(False):
             # Check if query does not contain forbidden columns and only create sample if it does not.
             # Query still needs to execute in case this is a query that also sets a metric value. (e.g. reference check)
-            allow_samples = True
-            offending_columns = []
-
-            if self.partition and self.partition.table:
-                query_columns = parse_columns_from_query(self.sql)
-
-                for column in query_columns:
-                    if self.data_source_scan.data_source.is_column_excluded(self.partition.table.table_name, column):
-                        allow_samples = False
-                        offending_columns.append(column)
+            offending_columns = self._get_excluded_columns()
+            allow_samples = not offending_columns
 
             # A bit of a hacky workaround for queries that also set the metric in one go.
             # TODO: revisit after decoupling getting metric values and storing samples. This can be dangerous, it sets the metric value
@@ -200,29 +238,44 @@ class Query:
                 self.metric.set_value(db_sample.get_rows_count())
 
             if allow_samples:
-                # TODO Hacky way to get the check name, check name isn't there when dataset samples are taken
-                check_name = next(iter(self.metric.checks)).name if hasattr(self, "metric") else None
-                sample_context = SampleContext(
-                    sample=db_sample,
-                    sample_name=self.sample_name,
-                    query=self.sql,
-                    data_source=self.data_source_scan.data_source,
-                    partition=self.partition,
-                    column=self.column,
-                    scan=self.data_source_scan.scan,
-                    logs=self.data_source_scan.scan._logs,
-                    samples_limit=self.samples_limit,
-                    passing_sql=self.passing_sql,
-                    check_name=check_name,
-                )
-
-                self.sample_ref = sampler.store_sample(sample_context)
+                self._store_sample(db_sample)
             else:
                 self.logs.info(
                     f"Skipping samples from query '{self.query_name}'. Excluded column(s) present: {offending_columns}."
                 )
 
+    def _get_excluded_columns(self) -> list[str]:
+        """
+        Returns the columns selected by self.sql that are excluded from samples.
+        """
+        offending_columns = []
+        if self.partition and self.partition.table:
+            query_columns = parse_columns_from_query(self.sql)
+
+            for column in query_columns:
+                if self.data_source_scan.data_source.is_column_excluded(self.partition.table.table_name, column):
+                    offending_columns.append(column)
+        return offending_columns
+
+    def _store_sample(self, sample: Sample):
+        sampler: Sampler = self.data_source_scan.scan._configuration.sampler
+        # TODO Hacky way to get the check name, check name isn't there when dataset samples are taken
+        check_name = next(iter(self.metric.checks)).name if hasattr(self, "metric") else None
+        sample_context = SampleContext(
+            sample=sample,
+            sample_name=self.sample_name,
+            query=self.sql,
+            data_source=self.data_source_scan.data_source,
+            partition=self.partition,
+            column=self.column,
+            scan=self.data_source_scan.scan,
+            logs=self.data_source_scan.scan._logs,
+            samples_limit=self.samples_limit,
+            passing_sql=self.passing_sql,
+            check_name=check_name,
+        )
+
+        self.sample_ref = sampler.store_sample(sample_context)
+
     def __append_to_scan(self):
-        scan = self.data_source_scan.scan
-        self.index = len(scan._queries)
-        scan._queries.append(self)
+        self.data_source_scan.scan._append_query(self)
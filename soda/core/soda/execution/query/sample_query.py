@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from soda.execution.query.query import Query
+from soda.sampler.sample import Sample
 
 
 class SampleQuery(Query):
@@ -17,7 +18,23 @@ class SampleQuery(Query):
             samples_limit=metric.samples_limit,
         )
         self.metric = metric
+        # Condition that selects the failed rows, only set for samples that a CombinedSampleQuery can fetch
+        self.failed_rows_condition: str | None = None
 
     def execute(self):
         self.store()
         self.metric.failed_rows_sample_ref = self.sample_ref
+
+    def store_sample(self, sample: Sample):
+        """
+        Stores a sample that was fetched by a CombinedSampleQuery instead of executing self.sql.
+        """
+        self.data_source_scan.scan._append_query(self)
+        offending_columns = self._get_excluded_columns()
+        if offending_columns:
+            self.logs.info(
+                f"Skipping samples from query '{self.query_name}'. Excluded column(s) present: {offending_columns}."
+            )
+            return
+        self._store_sample(sample)
+        self.metric.failed_rows_sample_ref = self.sample_ref
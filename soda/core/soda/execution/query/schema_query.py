@@ -8,6 +8,7 @@ class TableColumnsQuery(Query):
             table=partition.table,
             partition=partition,
             unqualified_query_name=f"schema[{partition.table.table_name}]",
+            memoize_results=True,
         )
         self.metric = schema_metric
 
@@ -21,6 +22,11 @@ class TableColumnsQuery(Query):
         A column description is a list (or tuple) of column name on index 0 and column data type (str) on index 1
         Eg [["col_name_one", "data_type_of_col_name_one"], ...]
         """
+        prefetched_rows = self.data_source_scan.get_prefetched_table_columns(self.table.table_name)
+        if prefetched_rows is not None:
+            self.rows = prefetched_rows
+            return
+
         data_source = self.data_source_scan.data_source
         self.sql = data_source.sql_get_table_columns(self.table.table_name)
         self.sql = self.data_source_scan.scan.jinja_resolve(self.sql)
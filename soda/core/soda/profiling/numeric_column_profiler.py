@@ -32,16 +32,16 @@ class NumericColumnProfiler:
         self.logs.debug(f"Profiling column {self.column_name} of {self.table_name}")
 
         # mins, maxs, min, max, frequent values
-        self._set_result_column_value_frequency_attributes()
+        self.profile_value_frequencies()
 
         # Average, sum, variance, standard deviation, distinct values, missing values
-        self._set_result_column_aggregation_attributes()
+        self.set_aggregated_metrics(self._compute_aggregated_metrics())
 
         # histogram
         self._set_result_column_histogram_attributes()
         return self.result_column
 
-    def _set_result_column_value_frequency_attributes(self) -> None:
+    def profile_value_frequencies(self) -> None:
         value_frequencies = self._compute_value_frequency()
         if value_frequencies:
             self.result_column.set_min_max_metrics(value_frequencies=value_frequencies)
@@ -52,8 +52,10 @@ class NumericColumnProfiler:
                 f"frequent values in table: {self.table_name}, columns: {self.column_name}"
             )
 
-    def _set_result_column_aggregation_attributes(self) -> None:
-        aggregated_metrics = self._compute_aggregated_metrics()
+    def get_aggregation_fields(self) -> list[str]:
+        return self.data_source.profiling_sql_aggregates_numeric_fields(self.column_name)
+
+    def set_aggregated_metrics(self, aggregated_metrics: list[tuple] | None) -> None:
         if aggregated_metrics:
             self.result_column.set_numeric_aggregation_metrics(aggregated_metrics=aggregated_metrics)
         else:
@@ -61,15 +63,58 @@ class NumericColumnProfiler:
                 f"Database returned no results for aggregates in table: {self.table_name}, columns: {self.column_name}"
             )
 
-    def _set_result_column_histogram_attributes(self) -> None:
-        histogram_values = self._compute_histogram()
+    def get_histogram_boundaries(self) -> list[int | float] | None:
+        """
+        Requires the min, max and distinct values metrics. Returns None if the histogram cannot be computed.
+        """
+        if self.result_column.min is None:
+            self.logs.warning("Min cannot be None, make sure the min metric is derived before histograms")
+        if self.result_column.max is None:
+            self.logs.warning("Max cannot be None, make sure the min metric is derived before histograms")
+        if self.result_column.distinct_values is None:
+            self.logs.warning(
+                "Distinct values cannot be None, make sure the distinct values metric is derived before histograms"
+            )
+        if (
+            self.result_column.min is None
+            or self.result_column.max is None
+            or self.result_column.distinct_values is None
+        ):
+            self.logs.warning(
+                f"Histogram query for {self.table_name}, column {self.column_name} skipped. See earlier warnings."
+            )
+            return None
+
+        bins_list = self.data_source.histogram_boundaries(
+            table_name=self.table_name,
+            column_name=self.column_name,
+            min_value=self.result_column.min,
+            max_value=self.result_column.max,
+            n_distinct=self.result_column.distinct_values,
+            column_type=self.column_data_type,
+        )
+        return bins_list or None
+
+    def set_histogram_frequencies(self, bins_list: list[int | float], histogram_values: list[tuple] | None) -> None:
         if histogram_values:
-            self.result_column.set_histogram(histogram_values=histogram_values)
+            histogram = {}
+            histogram["boundaries"] = bins_list
+            histogram["frequencies"] = [int(freq) if freq is not None else 0 for freq in histogram_values[0]]
+            self.result_column.set_histogram(histogram_values=histogram)
         else:
             self.logs.error(
                 f"Database returned no results for histograms in table: {self.table_name}, columns: {self.column_name}"
             )
 
+    def _set_result_column_histogram_attributes(self) -> None:
+        bins_list = self.get_histogram_boundaries()
+        if bins_list is None:
+            self.logs.error(
+                f"Database returned no results for histograms in table: {self.table_name}, columns: {self.column_name}"
+            )
+            return
+        self.set_histogram_frequencies(bins_list, self._compute_histogram())
+
     def _compute_value_frequency(self) -> list[tuple] | None:
         value_frequencies_sql = self.data_source.profiling_sql_values_frequencies_query(
             "numeric",
@@ -99,26 +144,8 @@ class NumericColumnProfiler:
         rows = aggregates_query.rows
         return rows
 
-    def _compute_histogram(self) -> None | dict[str, list]:
-        if self.result_column.min is None:
-            self.logs.warning("Min cannot be None, make sure the min metric is derived before histograms")
-        if self.result_column.max is None:
-            self.logs.warning("Max cannot be None, make sure the min metric is derived before histograms")
-        if self.result_column.distinct_values is None:
-            self.logs.warning(
-                "Distinct values cannot be None, make sure the distinct values metric is derived before histograms"
-            )
-        if (
-            self.result_column.min is None
-            or self.result_column.max is None
-            or self.result_column.distinct_values is None
-        ):
-            self.logs.warning(
-                f"Histogram query for {self.table_name}, column {self.column_name} skipped. See earlier warnings."
-            )
-            return None
-
-        histogram_sql, bins_list = self.data_source.histogram_sql_and_boundaries(
+    def _compute_histogram(self) -> list[tuple] | None:
+        histogram_sql, _ = self.data_source.histogram_sql_and_boundaries(
             table_name=self.table_name,
             column_name=self.column_name,
             min_value=self.result_column.min,
@@ -135,11 +162,4 @@ class NumericColumnProfiler:
             sql=histogram_sql,
         )
         histogram_query.execute()
-        histogram_values = histogram_query.rows
-
-        if histogram_values is None:
-            return None
-        histogram = {}
-        histogram["boundaries"] = bins_list
-        histogram["frequencies"] = [int(freq) if freq is not None else 0 for freq in histogram_values[0]]
-        return histogram
+        return histogram_query.rows
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Union
+
+from soda.execution.query.query import Query
+from soda.profiling.numeric_column_profiler import NumericColumnProfiler
+from soda.profiling.profile_columns_result import ProfileColumnsResultTable
+from soda.profiling.text_column_profiler import TextColumnProfiler
+
+if TYPE_CHECKING:
+    from soda.execution.data_source_scan import DataSourceScan
+    from soda.sodacl.data_source_check_cfg import ProfileColumnsCfg
+
+ColumnProfiler = Union[NumericColumnProfiler, TextColumnProfiler]
+
+
+class TableProfiler:
+    """
+    Profiles all columns of a table.  The row count and the aggregates of all columns are computed in a single
+    wide aggregation query, and so are the histograms of all numeric columns.  Like for aggregation metrics, queries
+    are split so that none has more than DataSource.get_max_aggregation_fields fields.  Value frequencies are
+    grouped by column and still require a query per column.
+
+    Errors are isolated per column like in per column profiling: if a wide query fails, its columns are queried one
+    by one, and a column that fails is left out of the result while the other columns are still profiled.
+    """
+
+    def __init__(
+        self,
+        data_source_scan: DataSourceScan,
+        profile_columns_cfg: ProfileColumnsCfg,
+        table_name: str,
+        columns_metadata: dict[str, str],
+    ) -> None:
+        self.data_source_scan = data_source_scan
+        self.data_source = data_source_scan.data_source
+        self.logs = data_source_scan.scan._logs
+        self.profile_columns_cfg = profile_columns_cfg
+        self.table_name = table_name
+        self.columns_metadata = columns_metadata
+        self.result_table = ProfileColumnsResultTable(
+            table_name=table_name, data_source=self.data_source.data_source_name
+        )
+        self.failed_column_profilers: list[ColumnProfiler] = []
+
+    def profile(self) -> ProfileColumnsResultTable:
+        column_profilers = self._create_column_profilers()
+
+        for column_profiler in column_profilers:
+            # min and max of numeric columns are derived from the value frequencies
+            self._run_isolated(column_profiler, column_profiler.profile_value_frequencies)
+
+        self._profile_aggregates(self._get_profiled_column_profilers(column_profilers))
+        self._profile_histograms(
+            [
+                column_profiler
+                for column_profiler in self._get_profiled_column_profilers(column_profilers)
+                if isinstance(column_profiler, NumericColumnProfiler)
+            ]
+        )
+
+        for column_profiler in self._get_profiled_column_profilers(column_profilers):
+            self.result_table.append_column(column_profiler.result_column)
+        return self.result_table
+
+    def _get_profiled_column_profilers(self, column_profilers: list[ColumnProfiler]) -> list[ColumnProfiler]:
+        return [
+            column_profiler
+            for column_profiler in column_profilers
+            if column_profiler not in self.failed_column_profilers
+        ]
+
+    def _run_isolated(self, column_profiler: ColumnProfiler, profile_step: Callable, *args) -> None:
+        if column_profiler in self.failed_column_profilers:
+            return
+        try:
+            profile_step(*args)
+        except Exception as e:
+            self._fail_column(column_profiler, e)
+
+    def _fail_column(self, column_profiler: ColumnProfiler, e: Exception) -> None:
+        self.failed_column_profilers.append(column_profiler)
+        profiling_column_type = "numeric" if isinstance(column_profiler, NumericColumnProfiler) else "text"
+        self.logs.error(
+            f"Problem profiling {profiling_column_type} column '{self.table_name}.{column_profiler.column_name}' "
+            f"with data type '{column_profiler.column_data_type}': {e}"
+        )
+
+    def _create_column_profilers(self) -> list[ColumnProfiler]:
+        column_profilers = []
+        for column_name, column_data_type in self.columns_metadata.items():
+            if column_data_type.startswith(tuple(self.data_source.NUMERIC_TYPES_FOR_PROFILING)):
+                column_profiler_class = NumericColumnProfiler
+            elif column_data_type.startswith(tuple(self.data_source.TEXT_TYPES_FOR_PROFILING)):
+                column_profiler_class = TextColumnProfiler
+            else:
+                self.logs.warning(
+                    f"Column '{self.table_name}.{column_name}' was not profiled because column data "
+                    f"type '{column_data_type}' is not in supported profiling data types"
+                )
+                continue
+            column_profilers.append(
+                column_profiler_class(
+                    data_source_scan=self.data_source_scan,
+                    profile_columns_cfg=self.profile_columns_cfg,
+                    table_name=self.table_name,
+                    column_name=column_name,
+                    column_data_type=column_data_type,
+                )
+            )
+        return column_profilers
+
+    def _profile_aggregates(self, column_profilers: list[ColumnProfiler]) -> None:
+        # The row count is computed in the first aggregation query
+        row_count_field = self.data_source.expr_count_all()
+        columns_fields = [(None, [row_count_field])] + [
+            (column_profiler, column_profiler.get_aggregation_fields()) for column_profiler in column_profilers
+        ]
+        for index, chunk in enumerate(self._split_in_chunks(columns_fields)):
+            for column_profiler, column_values in self._execute_chunk(
+                f"profiling-{self.table_name}-aggregates-{index}", chunk
+            ):
+                if column_profiler is None:
+                    self.result_table.row_count = column_values[0][0] if column_values else None
+                else:
+                    self._run_isolated(column_profiler, column_profiler.set_aggregated_metrics, column_values)
+
+    def _profile_histograms(self, numeric_column_profilers: list[NumericColumnProfiler]) -> None:
+        columns_fields = []
+        bins_lists = {}
+        for column_profiler in numeric_column_profilers:
+            try:
+                bins_list = column_profiler.get_histogram_boundaries()
+            except Exception as e:
+                self._fail_column(column_profiler, e)
+                continue
+            if bins_list is None:
+                self._run_isolated(column_profiler, column_profiler.set_histogram_frequencies, [], None)
+                continue
+            bins_lists[column_profiler.column_name] = bins_list
+            columns_fields.append(
+                (
+                    column_profiler,
+                    self.data_source.profiling_sql_histogram_fields(column_profiler.column_name, bins_list),
+                )
+            )
+        for index, chunk in enumerate(self._split_in_chunks(columns_fields)):
+            for column_profiler, column_values in self._execute_chunk(
+                f"profiling-{self.table_name}-histograms-{index}", chunk
+            ):
+                self._run_isolated(
+                    column_profiler,
+                    column_profiler.set_histogram_frequencies,
+                    bins_lists[column_profiler.column_name],
+                    column_values,
+                )
+
+    def _execute_chunk(self, query_name: str, chunk: list[tuple]) -> list[tuple]:
+        """
+        Executes the multi column query of a chunk and returns a (column profiler, column values) tuple per column.
+        If the query fails, eg because an aggregate is not supported for the data type of one of the columns, the
+        columns of the chunk are queried one by one so that only the failing column is affected.
+        """
+        rows = self._execute_multi_column_query(
+            query_name=query_name, fields=[field for _, fields in chunk for field in fields]
+        )
+        if rows is not None or len(chunk) == 1:
+            return self._split_row(rows, chunk)
+        self.logs.info(f"Profiling the columns of '{self.table_name}' one by one as query {query_name} failed")
+        column_values = []
+        for column_index, column_fields in enumerate(chunk):
+            column_rows = self._execute_multi_column_query(
+                query_name=f"{query_name}-{column_index}", fields=column_fields[1]
+            )
+            column_values.extend(self._split_row(column_rows, [column_fields]))
+        return column_values
+
+    def _split_in_chunks(self, columns_fields: list[tuple]) -> list[list[tuple]]:
+        """
+        Groups (column profiler, fields) tuples so that the fields of a chunk do not exceed the max aggregation
+        fields.  The fields of a single column are never split over multiple chunks.
+        """
+        max_aggregation_fields = self.data_source.get_max_aggregation_fields()
+        chunks = []
+        chunk_field_count = 0
+        for column_fields in columns_fields:
+            field_count = len(column_fields[1])
+            if len(chunks) == 0 or chunk_field_count + field_count > max_aggregation_fields:
+                chunks.append([])
+                chunk_field_count = 0
+            chunks[-1].append(column_fields)
+            chunk_field_count += field_count
+        return chunks
+
+    @staticmethod
+    def _split_row(rows: list[tuple] | None, chunk: list[tuple]) -> list[tuple]:
+        """
+        Splits the single result row of a multi column query in a list of rows per column, which is what the
+        column profilers expect.  Columns get None if the query did not return a result.
+        """
+        column_values = []
+        offset = 0
+        for column_profiler, fields in chunk:
+            if rows:
+                column_values.append((column_profiler, [tuple(rows[0][offset : offset + len(fields)])]))
+            else:
+                column_values.append((column_profiler, None))
+            offset += len(fields)
+        return column_values
+
+    def _execute_multi_column_query(self, query_name: str, fields: list[str]) -> list[tuple] | None:
+        query = Query(
+            data_source_scan=self.data_source_scan,
+            unqualified_query_name=query_name,
+            sql=self.data_source.profiling_sql_multi_column_aggregates(self.table_name, fields),
+        )
+        try:
+            query.execute()
+        except Exception as e:
+            # The query error is already logged, this is eg the rollback after the failed query that failed
+            self.logs.debug(f"Problem after query {query.query_name} failed: {e}")
+        return query.rows
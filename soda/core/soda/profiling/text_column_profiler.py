@@ -32,14 +32,14 @@ class TextColumnProfiler:
         self.logs.debug(f"Profiling column {self.column_name} of {self.table_name}")
 
         # frequent values for text column
-        self._set_result_column_value_frequency_attribute()
+        self.profile_value_frequencies()
 
         # pure text aggregates
-        self._set_result_column_text_aggregation_attributes()
+        self.set_aggregated_metrics(self._compute_text_aggregates())
 
         return self.result_column
 
-    def _set_result_column_value_frequency_attribute(self) -> None:
+    def profile_value_frequencies(self) -> None:
         value_frequencies = self._compute_value_frequency()
         if value_frequencies:
             self.result_column.set_frequency_metric(value_frequencies)
@@ -48,8 +48,10 @@ class TextColumnProfiler:
                 f"Database returned no results for textual frequent values in {self.table_name}, column: {self.column_name}"
             )
 
-    def _set_result_column_text_aggregation_attributes(self) -> None:
-        text_aggregates = self._compute_text_aggregates()
+    def get_aggregation_fields(self) -> list[str]:
+        return self.data_source.profiling_sql_aggregates_text_fields(self.column_name)
+
+    def set_aggregated_metrics(self, text_aggregates: list[tuple] | None) -> None:
         if text_aggregates:
             self.result_column.set_text_aggregation_metrics(text_aggregates)
         else:
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Iterator, Optional, Tuple
 
 from soda.common.memory_safe_cursor_fetcher import MemorySafeCursorFetcher
 from soda.sampler.sample import Sample
@@ -8,7 +8,7 @@ from soda.sampler.sample_schema import SampleColumn, SampleSchema
 class DbSample(Sample):
     def __init__(self, cursor, data_source, limit=None):
         self.cursor = cursor
-        self.safe_fetcher = MemorySafeCursorFetcher(cursor)
+        self.safe_fetcher = MemorySafeCursorFetcher(cursor, logs=data_source.logs)
         self.data_source = data_source
         self.rows = None
         self._limit = limit
@@ -16,6 +16,9 @@ class DbSample(Sample):
     def get_rows(self) -> Tuple[Tuple]:
         return self.safe_fetcher.get_rows()
 
+    def get_rows_iter(self, limit: Optional[int] = None) -> Iterator[Tuple]:
+        return self.safe_fetcher.iter_rows(limit)
+
     def get_rows_count(self) -> int:
         return self.safe_fetcher.get_row_count()
 
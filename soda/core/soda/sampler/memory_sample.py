@@ -0,0 +1,24 @@
+from typing import Tuple
+
+from soda.sampler.sample import Sample
+from soda.sampler.sample_schema import SampleColumn, SampleSchema
+
+
+class MemorySample(Sample):
+    """
+    Sample of rows that were already fetched, eg split from the result of a CombinedSampleQuery.
+    """
+
+    def __init__(self, rows: list, dbapi_description: tuple, data_source):
+        self.rows = rows
+        self.dbapi_description = dbapi_description
+        self.data_source = data_source
+
+    def get_rows(self) -> Tuple[Tuple]:
+        return self.rows
+
+    def get_rows_count(self) -> int:
+        return len(self.rows)
+
+    def get_schema(self) -> SampleSchema:
+        return SampleSchema(columns=SampleColumn.create_sample_columns(self.dbapi_description, self.data_source))
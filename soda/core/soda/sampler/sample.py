@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Iterator, Optional, Tuple
 
 from soda.sampler.sample_schema import SampleSchema
 
@@ -21,3 +21,8 @@ class Sample(ABC):
     @abstractmethod
     def get_schema(self) -> SampleSchema:
         pass
+
+    def get_rows_iter(self, limit: Optional[int] = None) -> Iterator[Tuple]:
+        # Yields the first limit rows of get_rows.  Samples that can fetch their rows lazily override this
+        # so that samplers can stream rows without materializing all of them first.
+        return iter(self.get_rows()[:limit])
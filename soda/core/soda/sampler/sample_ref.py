@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
+
 from soda.sampler.sample_schema import SampleSchema
 
 
@@ -14,7 +16,8 @@ class SampleRef:
         total_row_count: int,
         stored_row_count: int,
         type: str,
-        soda_cloud_file_id: str | None = None,
+        # A Future for samples that are still being uploaded, see SodaCloud.upload_sample_async
+        soda_cloud_file_id: str | Future | None = None,
         message: str | None = None,
         link: str | None = None,
         link_text: str | None = None,
@@ -24,11 +27,18 @@ class SampleRef:
         self.total_row_count: int = total_row_count
         self.stored_row_count: int = stored_row_count
         self.type: str = type
-        self.soda_cloud_file_id: str | None = soda_cloud_file_id
+        self._soda_cloud_file_id: str | Future | None = soda_cloud_file_id
         self.message: str | None = message
         self.link: str | None = link
         self.link_text: str = link_text
 
+    @property
+    def soda_cloud_file_id(self) -> str | None:
+        # Waits for the upload to finish if the sample is still being uploaded
+        if isinstance(self._soda_cloud_file_id, Future):
+            self._soda_cloud_file_id = self._soda_cloud_file_id.result()
+        return self._soda_cloud_file_id
+
     def __str__(self) -> str:
         column_count = f"{len(self.schema.columns)}x" if self.schema else ""
         sample_dimension = f"{column_count}({self.stored_row_count}/{self.total_row_count})"
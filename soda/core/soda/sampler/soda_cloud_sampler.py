@@ -8,7 +8,15 @@ from soda.sampler.sampler import Sampler
 class SodaCloudSampler(Sampler):
     def store_sample(self, sample_context: SampleContext) -> SampleRef | None:
         self.logs.info(f"Sending failed row samples to Soda Cloud")
-        sample_rows = sample_context.sample.get_rows()
+        scan = sample_context.scan
+        soda_cloud = scan._configuration.soda_cloud
+        # Rows are streamed from the sample into the upload, so the row count is only known afterwards
+        soda_cloud_file_id = soda_cloud.upload_sample_async(
+            scan=scan,
+            sample_rows=sample_context.sample.get_rows_iter(sample_context.samples_limit),
+            sample_file_name=sample_context.get_sample_file_name(),
+            samples_limit=sample_context.samples_limit,
+        )
         row_count = sample_context.sample.get_rows_count()
         sample_schema = sample_context.sample.get_schema()
 
@@ -17,14 +25,6 @@ class SodaCloudSampler(Sampler):
             soda_cloud_file_id = None
         else:
             type = "soda_cloud"
-            scan = sample_context.scan
-            soda_cloud = scan._configuration.soda_cloud
-            soda_cloud_file_id = soda_cloud.upload_sample(
-                scan=scan,
-                sample_rows=sample_rows,
-                sample_file_name=sample_context.get_sample_file_name(),
-                samples_limit=sample_context.samples_limit,
-            )
         if sample_context.samples_limit is not None:
             stored_row_count = row_count if row_count < sample_context.samples_limit else sample_context.samples_limit
         else:
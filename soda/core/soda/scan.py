@@ -4,6 +4,9 @@ import json
 import logging
 import os
 import textwrap
+import threading
+from contextlib import contextmanager
+from copy import deepcopy
 from datetime import datetime, timezone
 
 from soda.__version__ import SODA_CORE_VERSION
@@ -25,6 +28,7 @@ from soda.sampler.default_sampler import DefaultSampler
 from soda.sampler.sampler import Sampler
 from soda.sodacl.check_cfg import CheckCfg
 from soda.sodacl.location import Location
+from soda.sodacl.sodacl_cache import DEFAULT_SODACL_CACHE_DIR, SodaCLCache
 from soda.sodacl.sodacl_cfg import SodaCLCfg
 from soda.telemetry.soda_telemetry import SodaTelemetry
 
@@ -52,6 +56,9 @@ class Scan:
         self._configuration: Configuration = Configuration(scan=self)
         self._sodacl_cfg: SodaCLCfg = SodaCLCfg(scan=self)
         self._file_paths: set[str] = set()
+        self._sodacl_cache: SodaCLCache | None = None
+        # (file path, SodaCL YAML string) tuples of which parsing is deferred to execute, see enable_sodacl_cache
+        self._sodacl_inputs: list[tuple[str, str]] = []
         self._data_timestamp: datetime = now
         self._scan_start_timestamp: datetime = now
         # FIXME: this attribute cannot be None if typed as `datetime`
@@ -59,9 +66,12 @@ class Scan:
         self._data_source_manager = DataSourceManager(self._logs, self._configuration)
         self._data_source_scans: list[DataSourceScan] = []
         self._metrics: set[Metric] = set()
+        # Index on the metric identity used to resolve metrics in constant time. See _find_existing_metric
+        self._metrics_by_identity: dict[tuple[type, str], Metric] = {}
         self._checks_configs: list[CheckCfg] = []
         self._checks: list[Check] = []
         self._queries: list[Query] = []
+        self._thread_query_captures = threading.local()
         self._profile_columns_result_tables: list[ProfileColumnsResultTable] = []
         self._discover_tables_result_tables: list[DiscoverTablesResultTable] = []
         self._sample_tables_result_tables: list[SampleTablesResultTable] = []
@@ -127,6 +137,17 @@ class Scan:
     def set_scan_results_file(self, scan_results_file: str):
         self._scan_results_file = scan_results_file
 
+    def enable_sodacl_cache(self, cache_dir: str = DEFAULT_SODACL_CACHE_DIR):
+        """
+        Stores the parsed SodaCL files in cache_dir so that subsequent scans with the same SodaCL files, variables and
+        data source configuration skip parsing.  Must be called before SodaCL files are added.  When enabled, SodaCL
+        files are parsed when the scan is executed.
+        """
+        if self._sodacl_cfg.data_source_scan_cfgs or self._sodacl_cfg.for_each_dataset_cfgs:
+            self._logs.error("The SodaCL cache must be enabled before SodaCL files are added")
+            return
+        self._sodacl_cache = SodaCLCache(logs=self._logs, cache_dir=cache_dir)
+
     def add_configuration_yaml_file(self, file_path: str):
         """
         Adds configurations from a YAML file on the given path.
@@ -340,6 +361,12 @@ class Scan:
             self._logs.error("Could not add SodaCL string", exception=e)
 
     def _parse_sodacl_yaml_str(self, sodacl_yaml_str: str, file_path: str = None):
+        if self._sodacl_cache:
+            self._sodacl_inputs.append((file_path, sodacl_yaml_str))
+        else:
+            self.__parse_sodacl(sodacl_yaml_str=sodacl_yaml_str, file_path=file_path)
+
+    def __parse_sodacl(self, sodacl_yaml_str: str, file_path: str):
         from soda.sodacl.sodacl_parser import SodaCLParser
 
         sodacl_parser = SodaCLParser(
@@ -350,6 +377,41 @@ class Scan:
         )
         sodacl_parser.parse_sodacl_yaml_str(sodacl_yaml_str)
 
+    def __parse_sodacl_inputs(self):
+        """
+        Parses the SodaCL inputs that were added while the SodaCL cache was enabled, or loads their parse result from
+        the cache.  Parse results with errors or warnings are not cached so that these are reported on every scan.
+        """
+        sodacl_inputs = self._sodacl_inputs
+        self._sodacl_inputs = []
+        cache_key = SodaCLCache.create_cache_key(
+            sodacl_inputs=sodacl_inputs,
+            data_source_name=self._data_source_name,
+            data_source_properties_by_name=self._configuration.data_source_properties_by_name,
+            variables=self._variables,
+        )
+        cache_entry = self._sodacl_cache.get(cache_key)
+        if cache_entry:
+            sodacl_cfg, declared_variables = cache_entry
+            sodacl_cfg.scan = self
+            self._sodacl_cfg = sodacl_cfg
+            self._variables.update(declared_variables)
+            self._logs.debug(f"Loaded {len(sodacl_inputs)} parsed SodaCL files from the SodaCL cache")
+            return
+
+        previous_variables = dict(self._variables)
+        log_count = len(self._logs.logs)
+        for file_path, sodacl_yaml_str in sodacl_inputs:
+            self.__parse_sodacl(sodacl_yaml_str=sodacl_yaml_str, file_path=file_path)
+
+        if not any(log.level in [LogLevel.ERROR, LogLevel.WARNING] for log in self._logs.logs[log_count:]):
+            declared_variables = {
+                variable_name: variable_value
+                for variable_name, variable_value in self._variables.items()
+                if variable_name not in previous_variables or previous_variables[variable_name] != variable_value
+            }
+            self._sodacl_cache.put(cache_key, self._sodacl_cfg, declared_variables)
+
     def _read_file(self, file_type: str, file_path: str) -> str:
         file_location = Location(file_path)
         file_system = self._configuration.file_system
@@ -402,11 +464,6 @@ class Scan:
         self._logs.debug("Scan execution starts")
         exit_value = 0
         try:
-            from soda.execution.column import Column
-            from soda.execution.metric.column_metrics import ColumnMetrics
-            from soda.execution.partition import Partition
-            from soda.execution.table import Table
-
             # Disable Soda Cloud if it is not properly configured
             if self._configuration.soda_cloud:
                 if not isinstance(self._scan_definition_name, str):
@@ -428,48 +485,16 @@ class Scan:
                 # ensure the sampler is configured with the scan logs
                 self._configuration.sampler.logs = self._logs
 
+            if self._sodacl_inputs:
+                self.__parse_sodacl_inputs()
+
             # Resolve the for each table checks and add them to the scan_cfg data structures
             self.__resolve_for_each_dataset_checks()
             # Resolve the for each column checks and add them to the scan_cfg data structures
             self.__resolve_for_each_column_checks()
 
             # For each data_source, build up the DataSourceScan data structures
-            for data_source_scan_cfg in self._sodacl_cfg.data_source_scan_cfgs.values():
-                # This builds up the data structures that correspond to the cfg model
-                data_source_scan = self._get_or_create_data_source_scan(data_source_scan_cfg.data_source_name)
-                if data_source_scan:
-                    for check_cfg in data_source_scan_cfg.check_cfgs:
-                        # Data source checks are created here, i.e. no dataset associated (e.g. failed rows check)
-                        self.__create_check(check_cfg, data_source_scan)
-
-                    for table_cfg in data_source_scan_cfg.tables_cfgs.values():
-                        table: Table = data_source_scan.get_or_create_table(table_cfg.table_name)
-
-                        for column_configurations_cfg in table_cfg.column_configurations_cfgs.values():
-                            column: Column = table.get_or_create_column(column_configurations_cfg.column_name)
-                            column.set_column_configuration_cfg(column_configurations_cfg)
-
-                        for partition_cfg in table_cfg.partition_cfgs:
-                            partition: Partition = table.get_or_create_partition(partition_cfg.partition_name)
-                            partition.set_partition_cfg(partition_cfg)
-
-                            for check_cfg in partition_cfg.check_cfgs:
-                                self.__create_check(check_cfg, data_source_scan, partition)
-
-                            if partition_cfg.column_checks_cfgs:
-                                for column_checks_cfg in partition_cfg.column_checks_cfgs.values():
-                                    column_metrics: ColumnMetrics = partition.get_or_create_column_metrics(
-                                        column_checks_cfg.column_name
-                                    )
-                                    column_metrics.set_column_check_cfg(column_checks_cfg)
-                                    if column_checks_cfg.check_cfgs:
-                                        for check_cfg in column_checks_cfg.check_cfgs:
-                                            self.__create_check(
-                                                check_cfg,
-                                                data_source_scan,
-                                                partition,
-                                                column_metrics.column,
-                                            )
+            self._create_checks()
 
             # Handle check attributes before proceeding.
             invalid_check_attributes = None
@@ -524,6 +549,16 @@ class Scan:
                         for metric_dep in metric.derived_formula.metric_dependencies.values():
                             metric.queries += metric_dep.queries
 
+                # Fetches the historic data of all checks at once
+                historic_data = self.__get_historic_data_from_soda_cloud_metric_store(
+                    [
+                        historic_descriptor
+                        for check in self._checks
+                        if check.historic_descriptors
+                        for historic_descriptor in check.historic_descriptors.values()
+                    ]
+                )
+
                 # Evaluates the checks based on all the metric values
                 for check in self._checks:
                     # First get the metric values for this check
@@ -539,7 +574,8 @@ class Scan:
                     # For each check get the historic data
                     if check.historic_descriptors:
                         for hd_key, hd in check.historic_descriptors.items():
-                            check_historic_data[hd_key] = self.__get_historic_data_from_soda_cloud_metric_store(hd)
+                            # Checks append to the historic data, so checks sharing a descriptor each get a copy
+                            check_historic_data[hd_key] = deepcopy(historic_data.get(hd, {}))
 
                     if not missing_value_metrics:
                         try:
@@ -661,6 +697,53 @@ class Scan:
 
         return exit_value
 
+    def _create_checks(self):
+        """
+        Builds up the DataSourceScan data structures (tables, partitions, columns) that correspond to the
+        SodaCL cfg model and creates the checks, metrics and queries.
+        """
+        from soda.execution.column import Column
+        from soda.execution.metric.column_metrics import ColumnMetrics
+        from soda.execution.partition import Partition
+        from soda.execution.table import Table
+
+        for data_source_scan_cfg in self._sodacl_cfg.data_source_scan_cfgs.values():
+            # This builds up the data structures that correspond to the cfg model
+            data_source_scan = self._get_or_create_data_source_scan(data_source_scan_cfg.data_source_name)
+            if data_source_scan:
+                for check_cfg in data_source_scan_cfg.check_cfgs:
+                    # Data source checks are created here, i.e. no dataset associated (e.g. failed rows check)
+                    self.__create_check(check_cfg, data_source_scan)
+
+                for table_cfg in data_source_scan_cfg.tables_cfgs.values():
+                    table: Table = data_source_scan.get_or_create_table(table_cfg.table_name)
+
+                    for column_configurations_cfg in table_cfg.column_configurations_cfgs.values():
+                        column: Column = table.get_or_create_column(column_configurations_cfg.column_name)
+                        column.set_column_configuration_cfg(column_configurations_cfg)
+
+                    for partition_cfg in table_cfg.partition_cfgs:
+                        partition: Partition = table.get_or_create_partition(partition_cfg.partition_name)
+                        partition.set_partition_cfg(partition_cfg)
+
+                        for check_cfg in partition_cfg.check_cfgs:
+                            self.__create_check(check_cfg, data_source_scan, partition)
+
+                        if partition_cfg.column_checks_cfgs:
+                            for column_checks_cfg in partition_cfg.column_checks_cfgs.values():
+                                column_metrics: ColumnMetrics = partition.get_or_create_column_metrics(
+                                    column_checks_cfg.column_name
+                                )
+                                column_metrics.set_column_check_cfg(column_checks_cfg)
+                                if column_checks_cfg.check_cfgs:
+                                    for check_cfg in column_checks_cfg.check_cfgs:
+                                        self.__create_check(
+                                            check_cfg,
+                                            data_source_scan,
+                                            partition,
+                                            column_metrics.column,
+                                        )
+
     def run_data_source_scan(self):
         for data_source_scan in self._data_source_scans:
             for data_source_cfg in data_source_scan.data_source_scan_cfg.data_source_cfgs:
@@ -768,9 +851,10 @@ class Scan:
         if isinstance(definition, str) and "${" in definition:
             from soda.common.jinja import Jinja
 
-            jinja_variables = self._variables.copy()
-            if isinstance(variables, dict):
-                jinja_variables.update(variables)
+            # Rendering does not modify the variables, so they are only copied when extra variables are merged in
+            jinja_variables = self._variables
+            if isinstance(variables, dict) and variables:
+                jinja_variables = {**self._variables, **variables}
             try:
                 return Jinja.resolve(definition, jinja_variables)
             except BaseException as e:
@@ -783,21 +867,43 @@ class Scan:
             return definition
 
     def __get_historic_data_from_soda_cloud_metric_store(
-        self, historic_descriptor: HistoricDescriptor
-    ) -> dict[str, object]:
+        self, historic_descriptors: list[HistoricDescriptor]
+    ) -> dict[HistoricDescriptor, dict[str, object]]:
+        if not historic_descriptors:
+            return {}
         if self._configuration.soda_cloud:
-            return self._configuration.soda_cloud.get_historic_data(historic_descriptor)
+            return self._configuration.soda_cloud.get_historic_data_batch(historic_descriptors)
         else:
             self._logs.error("Soda Core must be configured to connect to Soda Cloud to use change-over-time checks.")
         return {}
 
+    def _append_query(self, query: Query):
+        captured_queries = getattr(self._thread_query_captures, "queries", None)
+        if captured_queries is not None:
+            captured_queries.append(query)
+        else:
+            query.index = len(self._queries)
+            self._queries.append(query)
+
+    @contextmanager
+    def _capture_queries(self):
+        """
+        Collects the queries executed by the current thread instead of appending them to self._queries.
+        Used by concurrent query execution to append the queries in a deterministic order afterwards.
+        """
+        captured_queries: list[Query] = []
+        self._thread_query_captures.queries = captured_queries
+        try:
+            yield captured_queries
+        finally:
+            self._thread_query_captures.queries = None
+
     def _find_existing_metric(self, metric) -> Metric:
-        return next(
-            (existing_metric for existing_metric in self._metrics if existing_metric == metric),
-            None,
-        )
+        return self._metrics_by_identity.get((type(metric), metric.identity))
 
     def _add_metric(self, metric):
+        # Metric equality is based on type and identity, the first added metric is kept, just like in self._metrics
+        self._metrics_by_identity.setdefault((type(metric), metric.identity), metric)
         self._metrics.add(metric)
 
     def __log_queries(self, having_exception: bool) -> int:
@@ -808,7 +914,8 @@ class Scan:
             self._logs.debug(f"{count}/{len(self._queries)} {queries_text} {status_text}")
             for query in self._queries:
                 query_text = f"\n{query.sql}" if query.exception else ""
-                self._logs.debug(f"  {query.query_name} [{status_text}] {query.duration}{query_text}")
+                memoized_text = " (memoized)" if query.is_memoized else ""
+                self._logs.debug(f"  {query.query_name} [{status_text}{memoized_text}] {query.duration}{query_text}")
                 if query.exception:
                     exception_str = str(query.exception)
                     exception_str = textwrap.indent(text=exception_str, prefix="    ")
@@ -103,6 +103,7 @@ class ProphetParameterGrid(ADBaseModel):
 class ProphetDynamicHyperparameters(ADBaseModel):
     objective_metric: Union[str, List[str]]
     parallelize_cross_validation: bool = True
+    early_stopping: bool = False
     cross_validation_folds: int = 5
     frequency: int = 10
     parameter_grid: ProphetParameterGrid = ProphetParameterGrid()
@@ -6,6 +6,22 @@ class ChangeOverTimeCfg:
         self.same_day_last_month: bool = False
         self.percent: bool = False
 
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ChangeOverTimeCfg) and self.__key() == other.__key()
+
+    def __hash__(self) -> int:
+        return hash(self.__key())
+
+    def __key(self) -> tuple:
+        # Equal configurations lead to the same historic data request, see SodaCloud.get_historic_data_batch
+        return (
+            self.last_measurements,
+            self.last_aggregation,
+            self.same_day_last_week,
+            self.same_day_last_month,
+            self.percent,
+        )
+
     def to_jsonnable(self):
         jsonnable = {}
         if self.last_measurements:
@@ -21,6 +21,7 @@ class DistributionCheckCfg(CheckCfg):
         fail_threshold_cfg: ThresholdCfg | None,
         warn_threshold_cfg: ThresholdCfg | None,
         method: str,
+        pushdown: bool = False,
     ):
         super().__init__(
             source_header=source_header,
@@ -37,6 +38,8 @@ class DistributionCheckCfg(CheckCfg):
         self.fail_threshold_cfg = fail_threshold_cfg
         self.warn_threshold_cfg = warn_threshold_cfg
         self.method = method
+        # Compute binned counts of continuous columns in the data source instead of fetching the values
+        self.pushdown = pushdown
 
     def get_column_name(self) -> str | None:
         return self.column_name
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import tempfile
+
+from soda.__version__ import SODA_CORE_VERSION
+from soda.common.logs import Logs
+from soda.sodacl.sodacl_cfg import SodaCLCfg
+
+DEFAULT_SODACL_CACHE_DIR = "~/.soda/sodacl_cache"
+DEFAULT_SODACL_CACHE_MAX_ENTRIES = 100
+
+# Names that SodaCL files can refer to in Jinja templates: ${ NAME } and ${ env_var('NAME') }
+REFERENCED_NAME_PATTERN = re.compile(r"\$\{\s*([A-Za-z_][A-Za-z0-9_]*)|env_var\(\s*['\"]([A-Za-z_][A-Za-z0-9_]*)['\"]")
+
+
+class SodaCLCache:
+    """
+    Local file store of parsed SodaCL so that scans that run the same SodaCL files over and over skip parsing.
+
+    Entries are keyed on everything the parse result depends on: the SodaCL texts and file paths, the default data
+    source name and configuration, the values of the variables and environment variables that the SodaCL texts
+    refer to and the Soda Core version.  Any change in these gives a new key, so entries never have to be
+    invalidated explicitly.  Only the max_entries most recently used entries are kept.
+
+    Entries are pickled, so the cache directory must only be writable by trusted users.
+    """
+
+    def __init__(
+        self,
+        logs: Logs,
+        cache_dir: str = DEFAULT_SODACL_CACHE_DIR,
+        max_entries: int = DEFAULT_SODACL_CACHE_MAX_ENTRIES,
+    ):
+        self.logs = logs
+        self.cache_dir: str = os.path.expanduser(cache_dir)
+        self.max_entries: int = max_entries
+
+    @staticmethod
+    def create_cache_key(
+        sodacl_inputs: list[tuple[str, str]],
+        data_source_name: str | None,
+        data_source_properties_by_name: dict[str, dict],
+        variables: dict[str, object],
+    ) -> str:
+        referenced_names = sorted(
+            {
+                name
+                for _, sodacl_yaml_str in sodacl_inputs
+                for match in REFERENCED_NAME_PATTERN.finditer(sodacl_yaml_str)
+                for name in match.groups()
+                if name
+            }
+        )
+        key_parts = json.dumps(
+            [
+                SODA_CORE_VERSION,
+                sodacl_inputs,
+                data_source_name,
+                data_source_properties_by_name,
+                # Environment variables take precedence over variables, see OsContext
+                [(name, os.environ.get(name), variables.get(name)) for name in referenced_names],
+            ],
+            default=str,
+        )
+        return hashlib.sha256(key_parts.encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str) -> tuple[SodaCLCfg, dict[str, object]] | None:
+        """
+        Returns a tuple (sodacl_cfg, variables) with the variables that were declared in the SodaCL files, or None
+        if there is no valid entry for the key.
+        """
+        cache_file_path = self._get_cache_file_path(cache_key)
+        if not os.path.exists(cache_file_path):
+            return None
+        try:
+            with open(cache_file_path, "rb") as cache_file:
+                sodacl_cfg, variables = pickle.load(cache_file)
+            # Marks the entry as recently used for the eviction in put
+            os.utime(cache_file_path)
+            return sodacl_cfg, variables
+        except Exception as e:
+            self.logs.debug(f"Could not read SodaCL cache entry {cache_file_path}: {e}")
+            return None
+
+    def put(self, cache_key: str, sodacl_cfg: SodaCLCfg, variables: dict[str, object]) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Written to a temporary file first so that concurrent scans never read a partially written entry
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix=".tmp", delete=False) as cache_file:
+                pickle.dump((sodacl_cfg, variables), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(cache_file.name, self._get_cache_file_path(cache_key))
+        except Exception as e:
+            self.logs.debug(f"Could not write SodaCL cache entry {cache_key}: {e}")
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        cache_file_paths = [
+            os.path.join(self.cache_dir, file_name)
+            for file_name in os.listdir(self.cache_dir)
+            if file_name.endswith(".pickle")
+        ]
+        if len(cache_file_paths) > self.max_entries:
+            cache_file_paths.sort(key=os.path.getmtime, reverse=True)
+            for cache_file_path in cache_file_paths[self.max_entries :]:
+                try:
+                    os.remove(cache_file_path)
+                except OSError:
+                    pass
+
+    def _get_cache_file_path(self, cache_key: str) -> str:
+        return os.path.join(self.cache_dir, f"{cache_key}.pickle")
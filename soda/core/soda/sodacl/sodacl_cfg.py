@@ -12,6 +12,12 @@ class SodaCLCfg:
         self.for_each_dataset_cfgs: List[ForEachDatasetCfg] = []
         self.for_each_column_cfgs: List[ForEachColumnCfg] = []
 
+    def __getstate__(self) -> dict:
+        # The scan is not part of the parsed SodaCL, see SodaCLCache
+        state = self.__dict__.copy()
+        state["scan"] = None
+        return state
+
     def get_or_create_data_source_scan_cfgs(self, data_source_name):
         data_source_scan_cfgs = self.data_source_scan_cfgs.get(data_source_name)
         if not data_source_scan_cfgs:
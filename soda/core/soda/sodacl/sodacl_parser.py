@@ -102,6 +102,40 @@ ALL_SCHEMA_VALIDATIONS = [
     WHEN_SCHEMA_CHANGES,
 ]
 
+# Max number of section header, check and threshold texts for which the ANTLR parse result is kept, see antlr_parse
+ANTLR_PARSE_CACHE_SIZE = 10_000
+
+# Words that the SodaCL grammar lexes as keywords, a simple metric check using them is left to ANTLR
+SODACL_KEYWORDS = {
+    "and",
+    "between",
+    "change",
+    "default",
+    "fail",
+    "filter",
+    "for",
+    "in",
+    "last",
+    "must",
+    "not",
+    "pass",
+    "percent",
+    "warn",
+    "with",
+}
+SIMPLE_IDENTIFIER = r'[a-zA-Z_][a-zA-Z0-9_.]*|"[^",\\]+"'
+SIMPLE_SIGNED_NUMBER = r"[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)"
+# The most common form of metric checks, like "row_count > 0", "missing_count(id) = 0" or
+# "avg(size) between 10 and 20", which are parsed without ANTLR, see parse_simple_metric_check
+SIMPLE_METRIC_CHECK_PATTERN = re.compile(
+    rf"(?P<metric_name>[a-zA-Z_][a-zA-Z0-9_]*)"
+    rf"(?:\((?P<metric_args>(?:{SIMPLE_IDENTIFIER}|{SIMPLE_SIGNED_NUMBER})"
+    rf"(?:, (?:{SIMPLE_IDENTIFIER}|{SIMPLE_SIGNED_NUMBER}))*)\))?"
+    rf"(?: (?P<comparator><=|>=|!=|<>|<|>|=) (?P<threshold_value>{SIMPLE_SIGNED_NUMBER})"
+    rf"| (?P<between>(?P<not>not )?between (?P<lower_bracket>[\[(])?(?P<lower_bound>{SIMPLE_SIGNED_NUMBER})"
+    rf" and (?P<upper_bound>{SIMPLE_SIGNED_NUMBER})(?P<upper_bracket>[\])])?))?"
+)
+
 # Generic log messages for SODACL parser
 QUOTE_CHAR_ERROR_LOG = """It looks like quote characters are present in one of more of your {dataset_type}
 dataset identifiers. This may result in erroneous or no matches as most data sources do not
@@ -312,6 +346,15 @@ class SodaCLParser(Parser):
             return self.parse_group_by_cfg(check_configurations, check_str, header_str)
 
         else:
+            simple_metric_check_match = parse_simple_metric_check(check_str)
+            if simple_metric_check_match:
+                return self.__parse_simple_metric_check(
+                    simple_metric_check_match,
+                    header_str,
+                    check_str,
+                    check_configurations,
+                )
+
             antlr_parser = self.antlr_parse_check(check_str)
             if antlr_parser.is_ok():
                 antlr_check = antlr_parser.result
@@ -359,6 +402,15 @@ class SodaCLParser(Parser):
             return self.parse_failed_rows_data_source_query_check(header_str, check_str, check_configurations)
 
         else:
+            simple_metric_check_match = parse_simple_metric_check(check_str)
+            if simple_metric_check_match:
+                return self.__parse_simple_metric_check(
+                    simple_metric_check_match,
+                    header_str,
+                    check_str,
+                    check_configurations,
+                )
+
             antlr_parser = self.antlr_parse_check(check_str)
             if antlr_parser.is_ok():
                 antlr_check = antlr_parser.result
@@ -577,8 +629,6 @@ class SodaCLParser(Parser):
         check_str: str,
         check_configurations: dict | None,
     ) -> CheckCfg:
-        from soda.sodacl.metric_check_cfg import MetricCheckCfg
-
         antlr_metric = antlr_metric_check.metric()
         metric_name = antlr_metric.metric_name().getText()
         metric_args = None
@@ -599,10 +649,101 @@ class SodaCLParser(Parser):
             return None
 
         antlr_threshold = antlr_metric_check.threshold()
+        pass_threshold_cfg = self.__antlr_parse_threshold_condition(antlr_threshold) if antlr_threshold else None
+
+        change_over_time_cfg = None
+        antlr_change_over_time = antlr_metric_check.change_over_time()
+        if antlr_change_over_time:
+            change_over_time_cfg = ChangeOverTimeCfg()
+            antlr_change_over_time_config = antlr_change_over_time.change_over_time_config()
+
+            if antlr_change_over_time.percent():
+                change_over_time_cfg.percent = True
+
+            if antlr_change_over_time_config:
+                if antlr_change_over_time_config.LAST():
+                    change_over_time_cfg.last_measurements = int(antlr_change_over_time_config.integer().getText())
+                    change_over_time_cfg.last_aggregation = antlr_change_over_time_config.change_aggregation().getText()
+                elif antlr_change_over_time_config.same_day_last_week():
+                    change_over_time_cfg.same_day_last_week = True
+            else:
+                change_over_time_cfg.last_measurements = 1
+                change_over_time_cfg.last_aggregation = "min"
+
+        return self.__parse_metric_check_cfg(
+            header_str=header_str,
+            check_str=check_str,
+            check_configurations=check_configurations,
+            metric_name=metric_name,
+            metric_args=metric_args,
+            pass_threshold_cfg=pass_threshold_cfg,
+            change_over_time_cfg=change_over_time_cfg,
+            is_anomaly_score=antlr_metric_check.anomaly_score() is not None,
+            is_anomaly_detection=antlr_metric_check.anomaly_detection() is not None,
+            is_default_anomaly_threshold=antlr_metric_check.default_anomaly_threshold() is not None,
+        )
+
+    def __parse_simple_metric_check(
+        self,
+        simple_metric_check_match: re.Match,
+        header_str: str,
+        check_str: str,
+        check_configurations: dict | None,
+    ) -> CheckCfg:
+        metric_args = None
+        if simple_metric_check_match.group("metric_args"):
+            metric_args = [
+                float(metric_arg.lstrip("+")) if re.fullmatch(SIMPLE_SIGNED_NUMBER, metric_arg) else metric_arg
+                for metric_arg in simple_metric_check_match.group("metric_args").split(", ")
+            ]
+
+        pass_threshold_cfg = None
+        if simple_metric_check_match.group("comparator"):
+            pass_threshold_cfg = self.__create_comparator_threshold(
+                simple_metric_check_match.group("comparator"),
+                float(simple_metric_check_match.group("threshold_value").lstrip("+")),
+            )
+        elif simple_metric_check_match.group("between"):
+            pass_threshold_cfg = self.__create_between_threshold(
+                lower_bound=float(simple_metric_check_match.group("lower_bound").lstrip("+")),
+                lower_included=simple_metric_check_match.group("lower_bracket") != "(",
+                upper_bound=float(simple_metric_check_match.group("upper_bound").lstrip("+")),
+                upper_included=simple_metric_check_match.group("upper_bracket") != ")",
+                is_not=simple_metric_check_match.group("not") is not None,
+                threshold_text=simple_metric_check_match.group("between"),
+            )
+
+        return self.__parse_metric_check_cfg(
+            header_str=header_str,
+            check_str=check_str,
+            check_configurations=check_configurations,
+            metric_name=simple_metric_check_match.group("metric_name"),
+            metric_args=metric_args,
+            pass_threshold_cfg=pass_threshold_cfg,
+        )
+
+    def __parse_metric_check_cfg(
+        self,
+        header_str: str,
+        check_str: str,
+        check_configurations: dict | None,
+        metric_name: str,
+        metric_args: list | None,
+        pass_threshold_cfg: ThresholdCfg | None,
+        change_over_time_cfg: ChangeOverTimeCfg | None = None,
+        is_anomaly_score: bool = False,
+        is_anomaly_detection: bool = False,
+        is_default_anomaly_threshold: bool = False,
+    ) -> CheckCfg:
+        """
+        Creates the check cfg of a metric check from its parsed check line, either parsed by ANTLR or by
+        parse_simple_metric_check, and its configurations.
+        """
+        from soda.sodacl.metric_check_cfg import MetricCheckCfg
+
         fail_threshold_cfg = None
         warn_threshold_cfg = None
-        if antlr_threshold:
-            pass_threshold_cfg = self.__antlr_parse_threshold_condition(antlr_threshold)
+        if pass_threshold_cfg is not None:
             fail_threshold_cfg = pass_threshold_cfg.get_inverse()
         elif isinstance(check_configurations, dict):
             self._push_path_element(check_str, check_configurations)
@@ -623,10 +764,10 @@ class SodaCLParser(Parser):
         failed_rows_query = None
         samples_limit = None
         samples_columns = None
-        training_dataset_params: TrainingDatasetParameters = TrainingDatasetParameters()
-        model_cfg: ModelConfigs = ModelConfigs()
+        training_dataset_params: TrainingDatasetParameters | None = None
+        model_cfg: ModelConfigs | None = None
         take_over_existing_anomaly_score_check = False
-        severity_level_params: SeverityLevelParameters = SeverityLevelParameters()
+        severity_level_params: SeverityLevelParameters | None = None
 
         if isinstance(check_configurations, dict):
             for configuration_key in check_configurations:
@@ -765,36 +906,19 @@ class SodaCLParser(Parser):
 
         metric_check_cfg_class = MetricCheckCfg
 
-        change_over_time_cfg = None
-        if antlr_metric_check.change_over_time():
+        if change_over_time_cfg is not None:
             from soda.sodacl.change_over_time_metric_check_cfg import (
                 ChangeOverTimeMetricCheckCfg,
             )
 
             metric_check_cfg_class = ChangeOverTimeMetricCheckCfg
-            change_over_time_cfg = ChangeOverTimeCfg()
-            antlr_change_over_time = antlr_metric_check.change_over_time()
-            antlr_change_over_time_config = antlr_change_over_time.change_over_time_config()
-
-            if antlr_change_over_time.percent():
-                change_over_time_cfg.percent = True
 
-            if antlr_change_over_time_config:
-                if antlr_change_over_time_config.LAST():
-                    change_over_time_cfg.last_measurements = int(antlr_change_over_time_config.integer().getText())
-                    change_over_time_cfg.last_aggregation = antlr_change_over_time_config.change_aggregation().getText()
-                elif antlr_change_over_time_config.same_day_last_week():
-                    change_over_time_cfg.same_day_last_week = True
-            else:
-                change_over_time_cfg.last_measurements = 1
-                change_over_time_cfg.last_aggregation = "min"
-
-        if antlr_metric_check.anomaly_score():
+        if is_anomaly_score:
             from soda.sodacl.anomaly_metric_check_cfg import AnomalyMetricCheckCfg
 
             metric_check_cfg_class = AnomalyMetricCheckCfg
 
-            if not antlr_metric_check.default_anomaly_threshold():
+            if not is_default_anomaly_threshold:
                 return metric_check_cfg_class(
                     source_header=header_str,
                     source_line=check_str,
@@ -812,19 +936,19 @@ class SodaCLParser(Parser):
                     fail_threshold_cfg=None,
                     warn_threshold_cfg=None,
                 )
-            if antlr_metric_check.default_anomaly_threshold():
+            if is_default_anomaly_threshold:
                 warn_threshold_cfg = ThresholdCfg(gt=0.9)
 
             # NOTE: Right now we are not using this parsing as we require '< default' syntax but when that changes
             # this section will come in handy to parse user-provided thresholds for anomaly detection.
-            elif antlr_threshold:
+            elif pass_threshold_cfg is not None:
                 warn_threshold_cfg = fail_threshold_cfg
                 fail_threshold_cfg = None
 
             if (fail_threshold_cfg and not fail_threshold_cfg.is_valid_anomaly_threshold()) or (
                 warn_threshold_cfg and not warn_threshold_cfg.is_valid_anomaly_threshold()
             ):
-                if antlr_threshold:
+                if pass_threshold_cfg is not None:
                     self.logs.error(
                         'Invalid anomaly threshold.  Only "< default" or "< {threshold-value}" '
                         "are allowed where threshold-value must be between 0 (ok) and 1 (anomaly)",
@@ -837,7 +961,16 @@ class SodaCLParser(Parser):
                         location=self.location,
                     )
 
-        elif antlr_metric_check.anomaly_detection():
+        elif is_anomaly_detection:
+            # Defaults are only created for anomaly detection checks as creating them is relatively slow
+            configuration_keys = check_configurations.keys() if isinstance(check_configurations, dict) else []
+            if ANOMALY_DETECTION_CONFIGS not in configuration_keys:
+                model_cfg = ModelConfigs()
+            if ANOMALY_DETECTION_TRAINING_DATASET_CONFIGS not in configuration_keys:
+                training_dataset_params = TrainingDatasetParameters()
+            if ANOMALY_DETECTION_SEVERITY_LEVEL_PARAMETERS not in configuration_keys:
+                severity_level_params = SeverityLevelParameters()
+
             if model_cfg is None or training_dataset_params is None or severity_level_params is None:
                 return None
 
@@ -866,7 +999,7 @@ class SodaCLParser(Parser):
             )
             return anomaly_detection_check_cfg
 
-        elif antlr_metric_check.default_anomaly_threshold():
+        elif is_default_anomaly_threshold:
             self.logs.error(
                 'Threshold "< default" only allowed for anomaly checks that start with: "anomaly score '
                 "{metric} < {threshold}",
@@ -876,6 +1009,13 @@ class SodaCLParser(Parser):
             column_name: str = metric_args[0]
             distribution_name: str | None = metric_args[1] if len(metric_args) > 1 else None
             sample_clause = check_configurations.get("sample")
+            pushdown = check_configurations.get("pushdown", False)
+            if not isinstance(pushdown, bool):
+                self.logs.error(
+                    f"Distribution check configuration 'pushdown' must be a boolean, but was {type(pushdown).__name__}",
+                    location=self.location,
+                )
+                pushdown = False
 
             if check_configurations.get("distribution reference file"):
                 reference_file_path: str = os.path.join(
@@ -906,6 +1046,7 @@ class SodaCLParser(Parser):
                 filter=filter,
                 sample_clause=sample_clause,
                 method=method,
+                pushdown=pushdown,
                 reference_file_path=reference_file_path,
                 fail_threshold_cfg=fail_threshold_cfg,
                 warn_threshold_cfg=warn_threshold_cfg,
@@ -927,10 +1068,6 @@ class SodaCLParser(Parser):
                 f"Invalid syntax used in '{check_str}'. More than one check attribute is not supported. A check like this will be skipped in future versions of Soda Core"
             )
 
-        def takes_keyword_argument(cls, keyword):
-            signature = inspect.signature(cls.__init__)
-            return keyword in signature.parameters
-
         # Some arguments make no sense for certain metric checks, so we only pass the ones that are supported by the given class constructor.
         # Do this instead of accepting kwargs and passing all arguments to the constructor, because it's easier to see what arguments are supported and they do not disappear in the constructor.
         all_args = {
@@ -956,7 +1093,7 @@ class SodaCLParser(Parser):
         use_args = {}
 
         for arg in all_args.keys():
-            if takes_keyword_argument(metric_check_cfg_class, arg):
+            if arg in get_init_parameter_names(metric_check_cfg_class):
                 use_args[arg] = all_args[arg]
 
         return metric_check_cfg_class(**use_args)
@@ -1524,52 +1661,66 @@ class SodaCLParser(Parser):
             comparator = antlr_comparator_threshold.comparator().getText()
             antlr_threshold_value = antlr_comparator_threshold.threshold_value()
             threshold_value = self.__antlr_threshold_value(antlr_threshold_value)
-
-            if comparator == "<":
-                return ThresholdCfg(lt=threshold_value)
-            if comparator == "<=":
-                return ThresholdCfg(lte=threshold_value)
-            if comparator == ">":
-                return ThresholdCfg(gt=threshold_value)
-            if comparator == ">=":
-                return ThresholdCfg(gte=threshold_value)
-            if comparator == "=":
-                return ThresholdCfg(lte=threshold_value, gte=threshold_value)
-            if comparator in ["!=", "<>"]:
-                return ThresholdCfg(lt=threshold_value, gt=threshold_value, is_split_zone=True)
-            self.logs.error(f"Unsupported comparator {comparator}", location=self.location)
-            return None
+            return self.__create_comparator_threshold(comparator, threshold_value)
 
         antlr_between_threshold: SodaCLAntlrParser.Between_thresholdContext = antlr_threshold.between_threshold()
         if antlr_between_threshold:
-            lower_included = antlr_between_threshold.ROUND_LEFT() is None
-            antlr_lower_value = antlr_between_threshold.threshold_value(0)
-            lower_bound = self.__antlr_threshold_value(antlr_lower_value)
-            upper_included = antlr_between_threshold.ROUND_RIGHT() is None
-            antlr_upper_value = antlr_between_threshold.threshold_value(1)
-            upper_bound = self.__antlr_threshold_value(antlr_upper_value)
-            if lower_bound > upper_bound:
-                self.logs.error(
-                    f"Left lower bound should be less than the upper bound on the right {antlr_between_threshold.getText()}",
-                    location=self.location,
-                )
-            threshold_condition_cfg = ThresholdCfg(
-                lt=upper_bound if not upper_included else None,
-                lte=upper_bound if upper_included else None,
-                gt=lower_bound if not lower_included else None,
-                gte=lower_bound if lower_included else None,
+            return self.__create_between_threshold(
+                lower_bound=self.__antlr_threshold_value(antlr_between_threshold.threshold_value(0)),
+                lower_included=antlr_between_threshold.ROUND_LEFT() is None,
+                upper_bound=self.__antlr_threshold_value(antlr_between_threshold.threshold_value(1)),
+                upper_included=antlr_between_threshold.ROUND_RIGHT() is None,
+                is_not=antlr_between_threshold.NOT() is not None,
+                threshold_text=antlr_between_threshold.getText(),
             )
 
-            if antlr_between_threshold.NOT():
-                threshold_condition_cfg = threshold_condition_cfg.get_inverse()
-
-            return threshold_condition_cfg
-
         if antlr_threshold.anomaly_threshold():
             return AnomalyThresholdCfg()
 
         self.logs.error(f'Unknown threshold "{antlr_threshold.getText()}"', location=self.location)
 
+    def __create_comparator_threshold(self, comparator: str, threshold_value) -> ThresholdCfg | None:
+        if comparator == "<":
+            return ThresholdCfg(lt=threshold_value)
+        if comparator == "<=":
+            return ThresholdCfg(lte=threshold_value)
+        if comparator == ">":
+            return ThresholdCfg(gt=threshold_value)
+        if comparator == ">=":
+            return ThresholdCfg(gte=threshold_value)
+        if comparator == "=":
+            return ThresholdCfg(lte=threshold_value, gte=threshold_value)
+        if comparator in ["!=", "<>"]:
+            return ThresholdCfg(lt=threshold_value, gt=threshold_value, is_split_zone=True)
+        self.logs.error(f"Unsupported comparator {comparator}", location=self.location)
+        return None
+
+    def __create_between_threshold(
+        self,
+        lower_bound,
+        lower_included: bool,
+        upper_bound,
+        upper_included: bool,
+        is_not: bool,
+        threshold_text: str,
+    ) -> ThresholdCfg:
+        if lower_bound > upper_bound:
+            self.logs.error(
+                f"Left lower bound should be less than the upper bound on the right {threshold_text}",
+                location=self.location,
+            )
+        threshold_condition_cfg = ThresholdCfg(
+            lt=upper_bound if not upper_included else None,
+            lte=upper_bound if upper_included else None,
+            gt=lower_bound if not lower_included else None,
+            gte=lower_bound if lower_included else None,
+        )
+
+        if is_not:
+            threshold_condition_cfg = threshold_condition_cfg.get_inverse()
+
+        return threshold_condition_cfg
+
     def __antlr_threshold_value(self, antlr_threshold_value: SodaCLAntlrParser.Threshold_valueContext):
         if antlr_threshold_value.signed_number():
             return self.__antlr_parse_signed_number(antlr_threshold_value.signed_number())
@@ -1957,16 +2108,16 @@ class SodaCLParser(Parser):
         return check_str, check_configurations
 
     def antlr_parse_check(self, text: str) -> AntlrParser:
-        return AntlrParser(text, lambda p: p.check())
+        return antlr_parse(text, "check")
 
     def antlr_parse_section_header(self, text: str) -> AntlrParser:
-        return AntlrParser(text, lambda p: p.section_header())
+        return antlr_parse(text, "section_header")
 
     def antlr_parse_column_configuration(self, text: str) -> AntlrParser:
         return AntlrParser(text, lambda p: p.configuration())
 
     def antlr_parse_threshold(self, text: str) -> AntlrParser:
-        return AntlrParser(text, lambda p: p.threshold())
+        return antlr_parse(text, "threshold")
 
     def get_data_source_scan_cfgs(self):
         return self.sodacl_cfg.get_or_create_data_source_scan_cfgs(self.data_source_name)
@@ -1998,3 +2149,35 @@ class AntlrParser(ErrorListener):
     def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
         self.error_message = msg
         self.exception = e
+
+
+@functools.lru_cache(maxsize=ANTLR_PARSE_CACHE_SIZE)
+def antlr_parse(text: str, rule_name: str) -> AntlrParser:
+    """
+    Parses the text with the given grammar rule.  Generated SodaCL files repeat the same section headers, checks
+    and thresholds many times and the Python ANTLR runtime is slow, so parse results are memoized on the raw text.
+    Parse trees are only read after parsing, so they can be shared.
+    """
+    return AntlrParser(text, lambda parser: getattr(parser, rule_name)())
+
+
+@functools.lru_cache(maxsize=None)
+def get_init_parameter_names(cls) -> frozenset[str]:
+    # Memoized as inspecting a signature costs more than parsing a simple check
+    return frozenset(inspect.signature(cls.__init__).parameters)
+
+
+def parse_simple_metric_check(check_str: str) -> re.Match | None:
+    """
+    Matches the check line against SIMPLE_METRIC_CHECK_PATTERN, a subset of the metric_check grammar rule that can
+    be parsed without ANTLR.  Returns None for all other checks, which are parsed with ANTLR.
+    """
+    simple_metric_check_match = SIMPLE_METRIC_CHECK_PATTERN.fullmatch(check_str)
+    if simple_metric_check_match is None:
+        return None
+    identifiers = [simple_metric_check_match.group("metric_name")]
+    if simple_metric_check_match.group("metric_args"):
+        identifiers.extend(simple_metric_check_match.group("metric_args").split(", "))
+    if any(identifier in SODACL_KEYWORDS for identifier in identifiers):
+        return None
+    return simple_metric_check_match
@@ -1,20 +1,13 @@
 import logging
 import os
 import platform
-from distutils.util import strtobool
 from typing import Dict
 
 from opentelemetry import trace
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
-from opentelemetry.semconv.resource import ResourceAttributes
 from soda.__version__ import SODA_CORE_VERSION
 from soda.common.config_helper import ConfigHelper
 
 # from soda.execution.data_source import DataSource
-from soda.telemetry.memory_span_exporter import MemorySpanExporter
-from soda.telemetry.soda_exporter import SodaConsoleSpanExporter, SodaOTLPSpanExporter
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +51,11 @@ class SodaTelemetry:
         self.__send = self.soda_config.send_anonymous_usage_stats or test_mode
 
         if self.__send:
+            # The Open Telemetry SDK and exporters are slow to import, so they are only imported if telemetry is sent
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.semconv.resource import ResourceAttributes
+
             logger.info("Setting up usage telemetry.")
 
             self.__provider = TracerProvider(
@@ -85,10 +83,17 @@ class SodaTelemetry:
 
     def __setup(self):
         """Set up Open Telemetry processors and exporters for normal use."""
-        local_debug_mode = self.soda_config.get_value("telemetry_local_debug_mode") or bool(
-            strtobool(os.getenv("telemetry_local_debug_mode", "false"))
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from soda.telemetry.soda_exporter import (
+            SodaConsoleSpanExporter,
+            SodaOTLPSpanExporter,
         )
 
+        # Same truth values as distutils.util.strtobool, distutils is slow to import and removed in Python 3.12
+        local_debug_mode = self.soda_config.get_value("telemetry_local_debug_mode") or os.getenv(
+            "telemetry_local_debug_mode", "false"
+        ).lower() in ("y", "yes", "t", "true", "on", "1")
+
         if local_debug_mode or logger.getEffectiveLevel() == logging.DEBUG:
             self.__provider.add_span_processor(BatchSpanProcessor(SodaConsoleSpanExporter()))
 
@@ -101,6 +106,9 @@ class SodaTelemetry:
 
     def __setup_for_test(self):
         """Set up Open Telemetry processors and exporters for usage in tests."""
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from soda.telemetry.memory_span_exporter import MemorySpanExporter
+
         self.__provider.add_span_processor(SimpleSpanProcessor(MemorySpanExporter.get_instance()))
 
         trace.set_tracer_provider(self.__provider)
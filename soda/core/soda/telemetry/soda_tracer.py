@@ -1,20 +1,27 @@
 import ast
 import inspect
 import textwrap
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Dict, Optional
 
-from opentelemetry import trace
-from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
-from opentelemetry.trace.span import Span
-from opentelemetry.trace.status import Status, StatusCode
-from soda.telemetry.soda_telemetry import SodaTelemetry
-
-trace_context_propagator = TraceContextTextMapPropagator()
 trace_context_carrier = {}
 
-soda_telemetry = SodaTelemetry.get_instance()
-tracer = trace.get_tracer_provider().get_tracer(__name__)
+
+@lru_cache(maxsize=None)
+def get_soda_tracing():
+    """
+    Returns a tuple (soda_telemetry, tracer, trace_context_propagator).  Set up on the first traced call instead of
+    on import, so that importing the CLI does not import Open Telemetry and commands like soda --help start fast.
+    """
+    from opentelemetry import trace
+    from opentelemetry.trace.propagation.tracecontext import (
+        TraceContextTextMapPropagator,
+    )
+    from soda.telemetry.soda_telemetry import SodaTelemetry
+
+    soda_telemetry = SodaTelemetry.get_instance()
+    tracer = trace.get_tracer_provider().get_tracer(__name__)
+    return soda_telemetry, tracer, TraceContextTextMapPropagator()
 
 
 def get_decorators(function):
@@ -51,10 +58,13 @@ def get_decorators(function):
 
 
 def soda_trace(fn: callable):
-    def _before_exec(span: Span, fn: callable):
+    def _before_exec(span: "Span", fn: callable):
+        soda_telemetry, _, _ = get_soda_tracing()
         span.set_attribute("user_cookie_id", soda_telemetry.user_cookie_id)
 
-    def _after_exec(span: Span, error: Optional[BaseException] = None):
+    def _after_exec(span: "Span", error: Optional[BaseException] = None):
+        from opentelemetry.trace.status import Status, StatusCode
+
         span.set_status(Status(StatusCode.OK))
         if str(error) == "3":
             # Only error code 3 means actual execution error, 1 and 2 are reserved for other use.
@@ -62,6 +72,9 @@ def soda_trace(fn: callable):
 
     @wraps(fn)
     def wrapper(*original_args, **original_kwargs):
+        from opentelemetry.trace.status import Status, StatusCode
+
+        _, tracer, trace_context_propagator = get_soda_tracing()
         ctx = trace_context_propagator.extract(carrier=trace_context_carrier)
         with tracer.start_as_current_span(f"{fn.__module__}.{fn.__name__}", context=ctx) as span:
             trace_context_propagator.inject(carrier=trace_context_carrier)
@@ -82,6 +95,7 @@ def soda_trace(fn: callable):
 
 
 def span_setup_function_args(args: Dict):
+    soda_telemetry, _, _ = get_soda_tracing()
     for prefix, values in args.items():
         for key, value in values.items():
             soda_telemetry.set_attribute(f"{prefix}_{key}", value or "")
@@ -0,0 +1,79 @@
+"""
+Benchmark for building checks, metrics and queries from parsed SodaCL.
+
+Measures Scan._create_checks for a generated set of column checks. No queries are executed, an in-memory
+duckdb data source is only used to instantiate the data source scan.
+
+Usage:
+    python soda/core/tests/benchmarks/benchmark_check_building.py [check counts...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from soda.scan import Scan
+
+COLUMNS_PER_TABLE = 100
+METRIC_TEMPLATES = [
+    "missing_count({column}) = 0",
+    "invalid_count({column}) = 0:\n      valid min: 0",
+    "max({column}) < 100",
+    "duplicate_count({column}) = 0",
+]
+
+
+def generate_sodacl(check_count: int) -> str:
+    lines = []
+    checks_per_table = COLUMNS_PER_TABLE * len(METRIC_TEMPLATES)
+    table_count = (check_count + checks_per_table - 1) // checks_per_table
+    remaining = check_count
+    for table_index in range(table_count):
+        lines.append(f"checks for table_{table_index}:")
+        for template in METRIC_TEMPLATES:
+            for column_index in range(COLUMNS_PER_TABLE):
+                if remaining == 0:
+                    break
+                check_line = template.format(column=f"column_{column_index}")
+                lines.append(f"  - {check_line}")
+                remaining -= 1
+    return "\n".join(lines)
+
+
+def benchmark_check_building(check_count: int) -> tuple[float, float]:
+    scan = Scan()
+    scan.set_data_source_name("benchmark")
+    scan.add_configuration_yaml_str(
+        """
+        data_source benchmark:
+          type: duckdb
+          path: ":memory:"
+        """
+    )
+
+    start = time.perf_counter()
+    scan.add_sodacl_yaml_str(generate_sodacl(check_count))
+    parse_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scan._create_checks()
+    build_seconds = time.perf_counter() - start
+
+    assert len(scan._checks) == check_count, f"Expected {check_count} checks, got {len(scan._checks)}"
+    scan._close()
+    return parse_seconds, build_seconds
+
+
+def main(check_counts: list[int]):
+    print(f"{'checks':>10} {'parse (s)':>12} {'build (s)':>12} {'build (us/check)':>18}")
+    for check_count in check_counts:
+        parse_seconds, build_seconds = benchmark_check_building(check_count)
+        print(
+            f"{check_count:>10} {parse_seconds:>12.2f} {build_seconds:>12.2f} "
+            f"{build_seconds / check_count * 1_000_000:>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 50_000, 100_000])
@@ -0,0 +1,89 @@
+"""
+Benchmark for the startup time of the soda CLI.
+
+Measures the import time with python -X importtime of soda --help, which only imports the CLI module, and of
+soda scan with a single Postgres data source, which also imports the Scan and parses a configuration and a checks
+file.  The Postgres data source module is only imported if soda-core-postgres and psycopg2 are installed.  Each
+scenario runs in a new python process, the fastest of the runs is reported together with the slowest imports.
+
+See tests/unit/test_cli_startup.py for the test that guards which modules the CLI imports.
+
+Usage:
+    python soda/core/tests/benchmarks/benchmark_cli_startup.py [runs]
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+HELP_CODE = "import soda.cli.cli"
+
+POSTGRES_SCAN_CODE = '''
+import importlib
+import soda.cli.cli
+from soda.scan import Scan
+
+scan = Scan()
+scan.set_data_source_name("postgres_ds")
+scan.add_configuration_yaml_str("""
+data_source postgres_ds:
+  type: postgres
+  host: localhost
+  username: soda
+  database: soda
+""")
+scan.add_sodacl_yaml_str("""
+checks for orders:
+  - row_count > 0
+  - missing_count(id) = 0
+""")
+try:
+    importlib.import_module("soda.data_sources.postgres_data_source")
+except ImportError:
+    pass
+'''
+
+SCENARIOS = {
+    "soda --help": HELP_CODE,
+    "soda scan (postgres)": POSTGRES_SCAN_CODE,
+}
+
+
+def run_with_importtime(code: str) -> tuple[float, dict[str, int]]:
+    """
+    Returns a tuple (wall clock seconds, cumulative import microseconds by top level module).
+    """
+    start = time.perf_counter()
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    seconds = time.perf_counter() - start
+    cumulative_micros_by_module = {}
+    for line in completed_process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_micros, module_name = line[len("import time:") :].split("|")
+        # Nested imports are indented with 2 spaces per level
+        if not module_name.startswith("  "):
+            cumulative_micros_by_module[module_name.strip()] = int(cumulative_micros)
+    return seconds, cumulative_micros_by_module
+
+
+def benchmark_cli_startup(code: str, runs: int) -> tuple[float, dict[str, int]]:
+    return min((run_with_importtime(code) for _ in range(runs)), key=lambda result: result[0])
+
+
+def main(runs: int):
+    for scenario_name, code in SCENARIOS.items():
+        seconds, cumulative_micros_by_module = benchmark_cli_startup(code, runs)
+        import_seconds = sum(cumulative_micros_by_module.values()) / 1_000_000
+        print(f"{scenario_name}: {seconds:.2f}s process, {import_seconds:.2f}s imports")
+        slowest_modules = sorted(cumulative_micros_by_module.items(), key=lambda item: item[1], reverse=True)[:10]
+        for module_name, cumulative_micros in slowest_modules:
+            print(f"  {cumulative_micros / 1000:>10.1f}ms {module_name}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
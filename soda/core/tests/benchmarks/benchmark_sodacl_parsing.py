@@ -0,0 +1,83 @@
+"""
+Benchmark for parsing a large generated SodaCL file.
+
+Measures Scan.add_sodacl_yaml_str with ANTLR only, with the memoized ANTLR parse results and with the simple
+metric check fast path on top of that.  The generated file mixes simple metric checks, which the fast path
+handles, with change over time and freshness checks, which are always parsed with ANTLR.
+
+Usage:
+    python soda/core/tests/benchmarks/benchmark_sodacl_parsing.py [check counts...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from soda.scan import Scan
+from soda.sodacl import sodacl_parser
+
+COLUMNS_PER_TABLE = 100
+CHECK_TEMPLATES = [
+    "missing_count({column}) = 0",
+    "duplicate_count({column}, id) = 0",
+    "avg({column}) between 0 and 100",
+    "change for max({column}) < 10",
+    "freshness({column}) < 1d",
+]
+TABLE_CHECKS = [
+    "row_count > 0",
+    "change for row_count between -100 and 100",
+]
+
+
+def generate_sodacl(check_count: int) -> str:
+    lines = []
+    checks_per_table = COLUMNS_PER_TABLE * len(CHECK_TEMPLATES) + len(TABLE_CHECKS)
+    table_count = (check_count + checks_per_table - 1) // checks_per_table
+    remaining = check_count
+    for table_index in range(table_count):
+        lines.append(f"checks for table_{table_index}:")
+        check_lines = TABLE_CHECKS + [
+            template.format(column=f"column_{column_index}")
+            for template in CHECK_TEMPLATES
+            for column_index in range(COLUMNS_PER_TABLE)
+        ]
+        for check_line in check_lines[:remaining]:
+            lines.append(f"  - {check_line}")
+        remaining -= min(remaining, len(check_lines))
+    return "\n".join(lines)
+
+
+def benchmark_sodacl_parsing(sodacl_yaml_str: str, use_cache: bool, use_fast_path: bool) -> float:
+    parse_simple_metric_check = sodacl_parser.parse_simple_metric_check
+    antlr_parse = sodacl_parser.antlr_parse
+    if not use_fast_path:
+        sodacl_parser.parse_simple_metric_check = lambda check_str: None
+    if not use_cache:
+        sodacl_parser.antlr_parse = antlr_parse.__wrapped__
+    antlr_parse.cache_clear()
+    try:
+        scan = Scan()
+        start = time.perf_counter()
+        scan.add_sodacl_yaml_str(sodacl_yaml_str)
+        seconds = time.perf_counter() - start
+        scan.assert_no_error_nor_warning_logs()
+        return seconds
+    finally:
+        sodacl_parser.parse_simple_metric_check = parse_simple_metric_check
+        sodacl_parser.antlr_parse = antlr_parse
+
+
+def main(check_counts: list[int]):
+    print(f"{'checks':>10} {'antlr (s)':>12} {'cached (s)':>12} {'fast path (s)':>14}")
+    for check_count in check_counts:
+        sodacl_yaml_str = generate_sodacl(check_count)
+        antlr_seconds = benchmark_sodacl_parsing(sodacl_yaml_str, use_cache=False, use_fast_path=False)
+        cached_seconds = benchmark_sodacl_parsing(sodacl_yaml_str, use_cache=True, use_fast_path=False)
+        fast_path_seconds = benchmark_sodacl_parsing(sodacl_yaml_str, use_cache=True, use_fast_path=True)
+        print(f"{check_count:>10} {antlr_seconds:>12.2f} {cached_seconds:>12.2f} {fast_path_seconds:>14.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 40_000])
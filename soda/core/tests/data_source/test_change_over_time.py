@@ -101,3 +101,44 @@ def test_change_over_time_last_x(data_source_fixture: DataSourceFixture):
     scan.execute()
 
     scan.assert_all_checks_pass()
+
+
+def test_change_over_time_historic_data_fetched_once_per_descriptor(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+
+    scan = data_source_fixture.create_test_scan()
+
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks for {table_name}:
+            - change for row_count between -10 and +50
+            - change for row_count < 50
+            - change avg last 7 for row_count < 50
+            - change avg last 7 for row_count > -50
+            - change min last 7 for duplicate_count(cst_size) < 50
+        """
+    )
+
+    scan.mock_historic_values(
+        metric_identity=f"metric-{scan._scan_definition_name}-{scan._data_source_name}-{table_name}-row_count",
+        metric_values=[10, 10, 10, 9, 8, 8, 8, 0, 0, 0],
+    )
+    scan.mock_historic_values(
+        metric_identity=f"metric-{scan._scan_definition_name}-{scan._data_source_name}-{table_name}-cst_size-duplicate_count",
+        metric_values=[0, 0, 0, 10, 10, 10, 10, 5, 0, 10],
+    )
+
+    mock_soda_cloud = scan.enable_mock_soda_cloud()
+    fetched_historic_descriptors = []
+    get_historic_data = mock_soda_cloud.get_historic_data
+
+    def get_historic_data_spy(historic_descriptor):
+        fetched_historic_descriptors.append(historic_descriptor)
+        return get_historic_data(historic_descriptor)
+
+    mock_soda_cloud.get_historic_data = get_historic_data_spy
+
+    scan.execute()
+
+    scan.assert_all_checks_pass()
+    assert len(fetched_historic_descriptors) == 3
@@ -0,0 +1,143 @@
+import re
+from functools import partial
+
+from helpers.common_test_tables import (
+    customers_profiling,
+    customers_test_table,
+    orders_test_table,
+)
+from helpers.data_source_fixture import DataSourceFixture
+from soda.execution.data_source import DataSource
+
+DURATION_PATTERN = re.compile(r"\d+:\d{2}:\d{2}(\.\d+)?")
+
+
+def _execute_scan(data_source_fixture: DataSourceFixture, max_concurrent_queries: int):
+    customers_table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    orders_table_name = data_source_fixture.ensure_test_table(orders_test_table)
+
+    data_source = data_source_fixture.data_source
+    original_max_concurrent_queries = data_source.max_concurrent_queries
+    data_source.max_concurrent_queries = max_concurrent_queries
+    try:
+        scan = data_source_fixture.create_test_scan()
+        scan.add_sodacl_yaml_str(
+            f"""
+              checks for {customers_table_name}:
+                - row_count = 10
+                - missing_count(id) = 1
+                - duplicate_count(cat) = 1
+                - duplicate_count(country) = 2
+              checks for {orders_table_name}:
+                - row_count > 0
+                - duplicate_count(customer_id_nok) >= 0
+            """
+        )
+        scan.execute()
+    finally:
+        data_source.max_concurrent_queries = original_max_concurrent_queries
+    return scan
+
+
+def test_concurrent_queries(data_source_fixture: DataSourceFixture):
+    sequential_scan = _execute_scan(data_source_fixture, max_concurrent_queries=1)
+    concurrent_scan = _execute_scan(data_source_fixture, max_concurrent_queries=4)
+
+    concurrent_scan.assert_all_checks_pass()
+    assert [check.outcome for check in concurrent_scan._checks] == [check.outcome for check in sequential_scan._checks]
+    assert [query.query_name for query in concurrent_scan._queries] == [
+        query.query_name for query in sequential_scan._queries
+    ]
+    assert [query.index for query in concurrent_scan._queries] == list(range(len(concurrent_scan._queries)))
+
+
+def test_concurrent_queries_connect_returns_none(data_source_fixture: DataSourceFixture, monkeypatch):
+    data_source = data_source_fixture.data_source
+    primary_connection = data_source.connection
+    original_connect = data_source.connect
+    original_create_pooled_connection = data_source.create_pooled_connection
+    pooled_connections = []
+
+    def open_connection():
+        if type(data_source).create_pooled_connection is not DataSource.create_pooled_connection:
+            # Eg in-memory DuckDB, where a new connection would open an empty database
+            return original_create_pooled_connection()
+        original_connect()
+        return data_source.connection
+
+    def connect():
+        # Like most data sources, only assign self.connection and return None
+        connection = open_connection()
+        pooled_connections.append(connection)
+        data_source.connection = connection
+
+    monkeypatch.setattr(data_source, "connect", connect)
+    monkeypatch.setattr(
+        data_source, "create_pooled_connection", partial(DataSource.create_pooled_connection, data_source)
+    )
+    sequential_scan = _execute_scan(data_source_fixture, max_concurrent_queries=1)
+    concurrent_scan = _execute_scan(data_source_fixture, max_concurrent_queries=4)
+
+    concurrent_scan.assert_all_checks_pass()
+    assert [check.outcome for check in concurrent_scan._checks] == [check.outcome for check in sequential_scan._checks]
+    assert len(pooled_connections) > 0
+    assert primary_connection not in pooled_connections
+    assert data_source.connection is primary_connection
+
+
+def _execute_table_runs(data_source_fixture: DataSourceFixture, max_concurrent_tables: int):
+    table_names = [
+        data_source_fixture.ensure_test_table(test_table)
+        for test_table in [customers_test_table, orders_test_table, customers_profiling]
+    ]
+
+    data_source = data_source_fixture.data_source
+    original_max_concurrent_tables = data_source.max_concurrent_tables
+    data_source.max_concurrent_tables = max_concurrent_tables
+    # Table columns are cached per data source, make sure both runs query them
+    DataSource.get_table_columns.cache_clear()
+    try:
+        scan = data_source_fixture.create_test_scan()
+        mock_soda_cloud = scan.enable_mock_soda_cloud()
+        scan.enable_mock_sampler()
+        profile_columns = ", ".join(f"{table_name}.%" for table_name in table_names)
+        datasets = "\n".join(f"                  - include {table_name}" for table_name in table_names)
+        scan.add_sodacl_yaml_str(
+            f"""
+              profile columns:
+                columns: [{profile_columns}]
+              discover datasets:
+                datasets:
+{datasets}
+              sample datasets:
+                datasets:
+{datasets}
+            """
+        )
+        scan.execute(allow_warnings_only=True)
+    finally:
+        data_source.max_concurrent_tables = original_max_concurrent_tables
+    return scan, mock_soda_cloud.pop_scan_result()
+
+
+def _get_log_messages(scan) -> list[str]:
+    # Query durations differ between runs
+    return [DURATION_PATTERN.sub("<duration>", log.message) for log in scan._logs.logs]
+
+
+def test_concurrent_tables(data_source_fixture: DataSourceFixture):
+    sequential_scan, sequential_scan_result = _execute_table_runs(data_source_fixture, max_concurrent_tables=1)
+    concurrent_scan, concurrent_scan_result = _execute_table_runs(data_source_fixture, max_concurrent_tables=4)
+
+    assert len(concurrent_scan_result["profiling"]) > 0
+    assert [
+        {key: value for key, value in table_result.items() if key != "sampleFile"}
+        for table_result in concurrent_scan_result["profiling"]
+    ] == [
+        {key: value for key, value in table_result.items() if key != "sampleFile"}
+        for table_result in sequential_scan_result["profiling"]
+    ]
+    assert [query.query_name for query in concurrent_scan._queries] == [
+        query.query_name for query in sequential_scan._queries
+    ]
+    assert _get_log_messages(concurrent_scan) == _get_log_messages(sequential_scan)
@@ -511,3 +511,46 @@ def test_continuous_distribution_check_large_sample_size(data_source_fixture: Da
         "'cst_size' column to ensure more accurate distribution insights."
     )
     assert log_message in [log.message for log in scan._logs.logs]
+
+
+def test_continuous_distribution_check_pushdown(data_source_fixture: DataSourceFixture, mock_file_system):
+    table_name = data_source_fixture.ensure_test_table(customers_dist_check_test_table)
+    table_name = data_source_fixture.data_source.default_casify_table_name(table_name)
+
+    scan = data_source_fixture.create_test_scan()
+
+    user_home_dir = mock_file_system.user_home_dir()
+
+    mock_file_system.files = {
+        f"{user_home_dir}/customers_cst_size_distribution_reference.yml": dedent(
+            f"""
+            dataset: {table_name}
+            column: cst_size
+            distribution_type: continuous
+            distribution_reference:
+                bins: [1, 2, 3]
+                weights: [0.5, 0.2, 0.3]
+        """
+        ).strip(),
+    }
+
+    scan.add_sodacl_yaml_str(
+        f"""
+        checks for {table_name}:
+            - distribution_difference(cst_size) >= 0.05:
+                distribution reference file: {user_home_dir}/customers_cst_size_distribution_reference.yml
+                method: ks
+                pushdown: true
+    """
+    )
+
+    scan.enable_mock_soda_cloud()
+    scan.execute()
+    scan.assert_all_checks_pass()
+
+    # Only the binned counts are fetched: (bin index, count, min, max)
+    distro_check: DistributionCheck = scan._checks[0]
+    assert [tuple(float(value) for value in row) for row in distro_check.query.rows] == [
+        (1.0, 12.0, 1.0, 1.0),
+        (2.0, 18.0, 2.0, 3.0),
+    ]
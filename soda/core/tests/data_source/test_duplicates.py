@@ -70,3 +70,61 @@ def test_duplicates_with_filter(data_source_fixture: DataSourceFixture):
 
     scan.assert_all_checks_pass()
     scan.assert_log("AND country = 'NL'")
+
+
+def test_duplicates_combined(data_source_fixture: DataSourceFixture, monkeypatch):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    data_source = data_source_fixture.data_source
+
+    def execute_scan():
+        scan = data_source_fixture.create_test_scan()
+        scan.add_sodacl_yaml_str(
+            f"""
+          checks for {table_name}:
+            - duplicate_count(cat) = 1
+            - duplicate_count(cat, country) = 1
+            - duplicate_count(country) >= 0
+            - duplicate_count(id) >= 0
+            - duplicate_count(cat) = 0:
+                filter: country = 'NL'
+        """
+        )
+        scan.execute()
+        return scan
+
+    monkeypatch.setattr(data_source, "SUPPORTS_GROUPING_SETS", False)
+    separate_scan = execute_scan()
+    separate_scan.assert_all_checks_pass()
+
+    monkeypatch.setattr(data_source, "SUPPORTS_GROUPING_SETS", True)
+    combined_scan = execute_scan()
+    combined_scan.assert_all_checks_pass()
+
+    duplicate_count_query_names = [
+        query.query_name for query in combined_scan._queries if query.query_name.endswith("duplicate_count_combined")
+    ]
+    assert len(duplicate_count_query_names) == 1
+    assert [check.check_value for check in combined_scan._checks] == [
+        check.check_value for check in separate_scan._checks
+    ]
+
+
+def test_duplicates_combined_permuted_columns(data_source_fixture: DataSourceFixture, monkeypatch):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    monkeypatch.setattr(data_source_fixture.data_source, "SUPPORTS_GROUPING_SETS", True)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.add_sodacl_yaml_str(
+        f"""
+      checks for {table_name}:
+        - duplicate_count(cat, country) = 1
+        - duplicate_count(country, cat) = 1
+    """
+    )
+    scan.execute()
+
+    scan.assert_all_checks_pass()
+    # Permuted columns give the same grouping set, which must only be grouped once
+    combined_query = next(query for query in scan._queries if query.query_name.endswith("duplicate_count_combined"))
+    assert combined_query.sql.count("(cat, country)") == 1
+    assert "(country, cat)" not in combined_query.sql
@@ -2,6 +2,7 @@ import pytest
 from helpers.common_test_tables import customers_test_table
 from helpers.data_source_fixture import DataSourceFixture
 from helpers.fixtures import test_data_source
+from soda.execution.check_outcome import CheckOutcome
 
 
 @pytest.mark.skipif(
@@ -37,3 +38,78 @@ def test_group_by(data_source_fixture: DataSourceFixture):
     scan.execute()
 
     scan.assert_all_checks_pass()
+
+
+@pytest.mark.skipif(
+    test_data_source not in ["postgres", "bigquery", "spark_df", "duckdb"],
+    reason="Need to make tests work with lower and upper case values for column names",
+)
+def test_group_by_checks_per_group(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.add_sodacl_yaml_str(
+        f"""
+            checks for {table_name}:
+              - group by:
+                  query: |
+                    SELECT country, COUNT(*) as customer_count, MAX(distance) as max_distance
+                    FROM {table_name}
+                    GROUP BY country
+                  fields:
+                    - country
+                  checks:
+                    - customer_count:
+                        fail: when < 5
+                        name: Row count
+                    - max_distance:
+                        fail: when > 999
+                        name: Max distance
+    """
+    )
+    scan.execute()
+
+    group_checks = {check.name: check for check in scan._checks if check.name.startswith(("Row count", "Max distance"))}
+    assert sorted(group_checks) == ["Max distance [BE]", "Max distance [NL]", "Row count [BE]", "Row count [NL]"]
+    assert group_checks["Row count [BE]"].check_value == 6
+    assert group_checks["Row count [NL]"].check_value == 4
+    assert group_checks["Row count [NL]"].outcome == CheckOutcome.FAIL
+    assert group_checks["Max distance [NL]"].outcome == CheckOutcome.PASS
+    # The group check configurations are not shared with the original configuration
+    assert group_checks["Row count [BE]"].check_cfg.source_configurations["group_value"] == "[BE]"
+    assert group_checks["Row count [NL]"].check_cfg.source_configurations["group_value"] == "[NL]"
+
+
+@pytest.mark.skipif(
+    test_data_source not in ["postgres", "bigquery", "spark_df", "duckdb"],
+    reason="Need to make tests work with lower and upper case values for column names",
+)
+def test_group_by_group_limit_exceeded(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.add_sodacl_yaml_str(
+        f"""
+            checks for {table_name}:
+              - group by:
+                  group_limit: 1
+                  query: |
+                    SELECT country, COUNT(*) as customer_count
+                    FROM {table_name}
+                    GROUP BY country
+                  fields:
+                    - country
+                  checks:
+                    - customer_count:
+                        fail: when < 5
+                        name: Row count
+    """
+    )
+    scan.execute(allow_error_warning=True)
+
+    group_by_query = next(
+        query for query in scan._data_source_scans[0].queries if query.query_name.endswith("group_by[group by]")
+    )
+    # Only one row more than the group limit is fetched
+    assert len(group_by_query.rows) == 2
+    scan.assert_has_error("Total number of groups exceeds configured group limit: 1")
@@ -0,0 +1,99 @@
+from datetime import datetime
+
+import pytest
+from helpers.data_source_fixture import DataSourceFixture
+from helpers.test_table import TestTable
+from soda.execution.data_type import DataType
+from soda.execution.incremental_metric_store import IncrementalMetricStore
+
+incremental_orders_test_table = TestTable(
+    name="IncrementalOrders",
+    columns=[
+        ("id", DataType.INTEGER),
+        ("amount", DataType.DECIMAL),
+        ("ts", DataType.TIMESTAMP),
+    ],
+    # fmt: off
+    values=[
+        (1, 10,   datetime(2020, 6, 23, 0, 0, 10)),
+        (2, 20,   datetime(2020, 6, 23, 0, 1, 10)),
+        (3, None, datetime(2020, 6, 23, 0, 2, 10)),
+    ]
+    # fmt: on
+)
+
+
+def _execute_scan(data_source_fixture: DataSourceFixture, table_name: str):
+    scan = data_source_fixture.create_test_scan()
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks for {table_name}:
+            - row_count > 0
+            - missing_count(amount) >= 0
+            - sum(amount) > 0
+            - max(amount) > 0
+            - avg(amount) > 0
+        """
+    )
+    scan.execute()
+    return scan
+
+
+def _check_values(scan) -> list:
+    return [check.check_value for check in scan._checks]
+
+
+def _incremental_aggregation_sqls(scan) -> list:
+    return [query.sql for query in scan._queries if "aggregation" in query.query_name and "MAX(ts)" in query.sql]
+
+
+def test_incremental_metrics(data_source_fixture: DataSourceFixture, monkeypatch):
+    table_name = data_source_fixture.ensure_test_table(incremental_orders_test_table)
+    data_source = data_source_fixture.data_source
+    incremental_metric_store = IncrementalMetricStore(
+        logs=data_source.logs, watermark_columns={table_name: "ts"}, path=":memory:"
+    )
+    monkeypatch.setattr(data_source, "incremental_metric_store", incremental_metric_store)
+
+    try:
+        first_scan = _execute_scan(data_source_fixture, table_name)
+        first_scan.assert_all_checks_pass()
+        assert _check_values(first_scan) == [3, 1, 30, 20, 15]
+        # The first scan aggregates all rows, avg is not incremental and gets its own aggregation query
+        incremental_sqls = _incremental_aggregation_sqls(first_scan)
+        assert len(incremental_sqls) == 1
+        assert "WHERE" not in incremental_sqls[0]
+
+        qualified_table_name = data_source.qualified_table_name(table_name)
+        data_source_fixture._update(
+            f"INSERT INTO {qualified_table_name} VALUES "
+            f"(4, 40, {data_source.literal(datetime(2020, 6, 24, 0, 0, 10))}), "
+            f"(5, NULL, {data_source.literal(datetime(2020, 6, 24, 0, 1, 10))})"
+        )
+
+        incremental_scan = _execute_scan(data_source_fixture, table_name)
+        incremental_scan.assert_all_checks_pass()
+        assert _check_values(incremental_scan)[:4] == [5, 2, 70, 40]
+        assert _check_values(incremental_scan)[4] == pytest.approx(70 / 3)
+        incremental_sqls = _incremental_aggregation_sqls(incremental_scan)
+        assert len(incremental_sqls) == 1
+        assert "WHERE ts >" in incremental_sqls[0]
+
+        # Without new rows, the stored values are used as they are
+        unchanged_scan = _execute_scan(data_source_fixture, table_name)
+        assert _check_values(unchanged_scan) == _check_values(incremental_scan)
+    finally:
+        # The inserted rows make the test table differ from its definition
+        data_source_fixture._drop_test_table(table_name)
+
+
+def test_incremental_metric_store_eviction(data_source_fixture: DataSourceFixture):
+    incremental_metric_store = IncrementalMetricStore(
+        logs=data_source_fixture.data_source.logs, watermark_columns={}, path=":memory:", max_entries=2
+    )
+    for i in range(3):
+        incremental_metric_store.put(f"key-{i}", i, [i])
+
+    assert incremental_metric_store.get("key-0") is None
+    assert incremental_metric_store.get("key-1") == (1, [1])
+    assert incremental_metric_store.get("key-2") == (2, [2])
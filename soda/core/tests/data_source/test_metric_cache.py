@@ -0,0 +1,56 @@
+from helpers.common_test_tables import customers_test_table
+from helpers.data_source_fixture import DataSourceFixture
+from soda.execution.metric_result_cache import MetricResultCache
+
+
+def _execute_scan(data_source_fixture: DataSourceFixture, table_name: str):
+    scan = data_source_fixture.create_test_scan()
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks for {table_name}:
+            - row_count = 10
+            - missing_count(id) = 1
+            - avg(cst_size) between 0 and 10000
+        """
+    )
+    scan.execute()
+    return scan
+
+
+def _aggregation_query_names(scan) -> list:
+    return [query.query_name for query in scan._queries if "aggregation" in query.query_name]
+
+
+def test_metric_cache(data_source_fixture: DataSourceFixture, monkeypatch):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    data_source = data_source_fixture.data_source
+
+    monkeypatch.setattr(data_source, "metric_cache", MetricResultCache(logs=data_source.logs, path=":memory:"))
+    monkeypatch.setattr(data_source, "sql_get_table_version", lambda table_name: "SELECT 1")
+
+    first_scan = _execute_scan(data_source_fixture, table_name)
+    first_scan.assert_all_checks_pass()
+    assert len(_aggregation_query_names(first_scan)) == 1
+    first_scan.assert_no_log("Metric cache hit")
+
+    cached_scan = _execute_scan(data_source_fixture, table_name)
+    cached_scan.assert_all_checks_pass()
+    assert len(_aggregation_query_names(cached_scan)) == 0
+    cached_scan.assert_log_info("Metric cache hit")
+    assert [check.check_value for check in cached_scan._checks] == [check.check_value for check in first_scan._checks]
+
+    # A new table version invalidates the cached metric values
+    monkeypatch.setattr(data_source, "sql_get_table_version", lambda table_name: "SELECT 2")
+    changed_scan = _execute_scan(data_source_fixture, table_name)
+    changed_scan.assert_all_checks_pass()
+    assert len(_aggregation_query_names(changed_scan)) == 1
+
+
+def test_metric_cache_eviction(data_source_fixture: DataSourceFixture):
+    metric_cache = MetricResultCache(logs=data_source_fixture.data_source.logs, path=":memory:", max_entries=2)
+    for i in range(3):
+        metric_cache.put(f"key-{i}", f"metric-{i}", i)
+
+    assert metric_cache.get("key-0") == (False, None)
+    assert metric_cache.get("key-1") == (True, 1)
+    assert metric_cache.get("key-2") == (True, 2)
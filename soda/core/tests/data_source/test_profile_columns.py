@@ -10,6 +10,7 @@ from helpers.common_test_tables import (
 )
 from helpers.data_source_fixture import DataSourceFixture
 from soda.execution.check.profile_columns_run import ProfileColumnsRun
+from soda.profiling.numeric_column_profiler import NumericColumnProfiler
 
 
 def test_profile_columns_numeric(data_source_fixture: DataSourceFixture):
@@ -475,3 +476,95 @@ def test_profile_columns_capitalized(data_source_fixture: DataSourceFixture):
     assert len(column_profiles) == 2
     assert column_profiles[0]["columnName"] == column_casify("ITEMS_SOLD")
     assert column_profiles[1]["columnName"] == column_casify("CST_Size")
+
+
+def test_profile_columns_single_pass_aggregates(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_profiling)
+    data_source = data_source_fixture.data_source
+
+    def profile_all_columns(supports_multi_column_profiling: bool):
+        original_supports_multi_column_profiling = data_source.SUPPORTS_MULTI_COLUMN_PROFILING
+        data_source.SUPPORTS_MULTI_COLUMN_PROFILING = supports_multi_column_profiling
+        try:
+            scan = data_source_fixture.create_test_scan()
+            mock_soda_cloud = scan.enable_mock_soda_cloud()
+            scan.add_sodacl_yaml_str(
+                f"""
+                  profile columns:
+                    columns: [{table_name}.%]
+                """
+            )
+            scan.execute(allow_warnings_only=True)
+        finally:
+            data_source.SUPPORTS_MULTI_COLUMN_PROFILING = original_supports_multi_column_profiling
+        query_names = [query.query_name for query in scan._queries]
+        return mock_soda_cloud.pop_scan_result()["profiling"], query_names
+
+    multi_column_profiling, multi_column_query_names = profile_all_columns(supports_multi_column_profiling=True)
+    per_column_profiling, per_column_query_names = profile_all_columns(supports_multi_column_profiling=False)
+
+    assert multi_column_profiling == per_column_profiling
+    assert multi_column_profiling[0]["rowCount"] == 10
+
+    # Row count and aggregates of all columns in one query, histograms of all numeric columns in another one
+    assert len([name for name in multi_column_query_names if "aggregates" in name]) == 1
+    assert len([name for name in multi_column_query_names if "histogram" in name]) == 1
+    assert not [name for name in multi_column_query_names if "get_row_count" in name]
+    assert len(multi_column_query_names) < len(per_column_query_names)
+
+
+def test_profile_columns_single_pass_column_errors(data_source_fixture: DataSourceFixture, monkeypatch):
+    table_name = data_source_fixture.ensure_test_table(customers_profiling)
+    data_source = data_source_fixture.data_source
+    monkeypatch.setattr(data_source, "SUPPORTS_MULTI_COLUMN_PROFILING", True)
+
+    def profile_all_columns():
+        scan = data_source_fixture.create_test_scan()
+        mock_soda_cloud = scan.enable_mock_soda_cloud()
+        scan.add_sodacl_yaml_str(
+            f"""
+              profile columns:
+                columns: [{table_name}.%]
+            """
+        )
+        scan.execute(allow_error_warning=True)
+        query_names = [query.query_name for query in scan._queries]
+        return mock_soda_cloud.pop_scan_result()["profiling"][0], query_names
+
+    def get_column_profiles(profiling: dict) -> dict[str, dict]:
+        return {column["columnName"].lower(): column["profile"] for column in profiling["columnProfiles"]}
+
+    column_profiles = get_column_profiles(profile_all_columns()[0])
+
+    # An invalid aggregate of one column fails the wide query, so its columns are queried one by one
+    get_aggregation_fields = NumericColumnProfiler.get_aggregation_fields
+    monkeypatch.setattr(
+        NumericColumnProfiler,
+        "get_aggregation_fields",
+        lambda self: (
+            ["unknown_function(cst_size)"] if self.column_name.lower() == "cst_size" else get_aggregation_fields(self)
+        ),
+    )
+    profiling, query_names = profile_all_columns()
+    assert profiling["rowCount"] == 10
+    failed_query_column_profiles = get_column_profiles(profiling)
+    failed_query_column_profiles.pop("cst_size")
+    column_profiles_without_cst_size = {
+        name: profile for name, profile in column_profiles.items() if name != "cst_size"
+    }
+    assert failed_query_column_profiles == column_profiles_without_cst_size
+    assert len([name for name in query_names if "aggregates-0-" in name]) == len(column_profiles) + 1
+    monkeypatch.setattr(NumericColumnProfiler, "get_aggregation_fields", get_aggregation_fields)
+
+    # An error while profiling one column only leaves out that column
+    set_histogram_frequencies = NumericColumnProfiler.set_histogram_frequencies
+
+    def fail_for_cst_size(self, bins_list, histogram_values):
+        if self.column_name.lower() == "cst_size":
+            raise ValueError("Histogram failure")
+        set_histogram_frequencies(self, bins_list, histogram_values)
+
+    monkeypatch.setattr(NumericColumnProfiler, "set_histogram_frequencies", fail_for_cst_size)
+    profiling, _ = profile_all_columns()
+    assert profiling["rowCount"] == 10
+    assert get_column_profiles(profiling) == column_profiles_without_cst_size
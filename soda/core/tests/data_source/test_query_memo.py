@@ -0,0 +1,38 @@
+from helpers.common_test_tables import customers_profiling
+from helpers.data_source_fixture import DataSourceFixture
+
+
+def test_query_memo(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_profiling)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.enable_mock_soda_cloud()
+    scan.add_sodacl_yaml_str(
+        f"""
+          discover datasets:
+            datasets:
+              - include {table_name}
+          sample datasets:
+            datasets:
+              - include {table_name}
+          checks for {table_name}:
+            - first_count = 10:
+                first_count query: SELECT COUNT(*) FROM {table_name}
+            - second_count = 10:
+                second_count query: SELECT COUNT(*) FROM {table_name}
+            - group by:
+                query: SELECT cat, COUNT(*) AS cat_count FROM {table_name} GROUP BY cat
+                fields:
+                  - cat
+                checks:
+                  - cat_count > 0:
+                      name: Cat count
+        """
+    )
+    scan.execute(allow_warnings_only=True)
+
+    memoized_query_names = [query.query_name.split(".")[-1] for query in scan._queries if query.is_memoized]
+    # Both runs look up the same tables with the same metadata query, user defined queries are never memoized
+    assert memoized_query_names == ["sample-datasets-find-datasets"]
+    group_by_queries = [query for query in scan._queries if "group_by" in query.query_name]
+    assert group_by_queries and not any(query.memoize_results for query in group_by_queries)
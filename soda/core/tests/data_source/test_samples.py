@@ -9,6 +9,7 @@ from helpers.common_test_tables import (
 )
 from helpers.data_source_fixture import DataSourceFixture
 from helpers.utils import replace_tokens
+from soda.sampler.db_sample import DbSample
 from soda.sampler.default_sampler import DefaultSampler
 from soda.sampler.sampler import DEFAULT_FAILED_ROWS_SAMPLE_LIMIT
 
@@ -123,6 +124,104 @@ def test_various_valid_invalid_sample_combinations(data_source_fixture: DataSour
     assert mock_soda_cloud.find_failed_rows_line_count(7) == 2
 
 
+def _execute_failed_rows_samples_scan(
+    data_source_fixture: DataSourceFixture, table_name: str, compress_sample_uploads: bool = False
+):
+    scan = data_source_fixture.create_test_scan()
+    mock_soda_cloud = scan.enable_mock_soda_cloud()
+    mock_soda_cloud.compress_sample_uploads = compress_sample_uploads
+    scan.enable_mock_sampler()
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks for {table_name}:
+            - missing_count(cat) > 0
+            - missing_count(cat) > 0:
+                missing values: ['HIGH']
+            - invalid_count(cat) > 0:
+                valid values: ['HIGH']
+            - missing_count(id) > 0
+            - missing_count(country) > 0:
+                missing values: ['NL']
+                samples limit: 2
+        """
+    )
+    scan.execute_unchecked()
+    return scan, mock_soda_cloud
+
+
+def test_combined_failed_rows_samples(data_source_fixture: DataSourceFixture, monkeypatch):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+
+    separate_scan, separate_mock_soda_cloud = _execute_failed_rows_samples_scan(data_source_fixture, table_name)
+    monkeypatch.setattr(data_source_fixture.data_source, "combine_failed_rows_samples", True)
+    combined_scan, combined_mock_soda_cloud = _execute_failed_rows_samples_scan(
+        data_source_fixture, table_name, compress_sample_uploads=True
+    )
+
+    line_counts = [combined_mock_soda_cloud.find_failed_rows_line_count(index) for index in range(5)]
+    assert line_counts == [separate_mock_soda_cloud.find_failed_rows_line_count(index) for index in range(5)]
+    # The samples limit of 2 applies to the 4 rows with country 'NL'
+    assert line_counts[4] == 2
+    combined_query_names = [query.query_name for query in combined_scan._queries]
+    assert len([query_name for query_name in combined_query_names if query_name.endswith("failed_rows_combined")]) == 1
+    assert len(combined_query_names) == len(separate_scan._queries) + 1
+    # Samples are only uploaded compressed if compress_sample_uploads is enabled
+    assert {file["content_encoding"] for file in separate_mock_soda_cloud.files.values()} == {None}
+    assert {file["content_encoding"] for file in combined_mock_soda_cloud.files.values()} == {"gzip"}
+
+
+def test_combined_failed_rows_samples_overlapping_limits(data_source_fixture: DataSourceFixture, monkeypatch):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+
+    def execute_scan() -> list[int]:
+        scan = data_source_fixture.create_test_scan()
+        scan.enable_mock_soda_cloud()
+        scan.enable_mock_sampler()
+        scan.add_sodacl_yaml_str(
+            f"""
+              checks for {table_name}:
+                - missing_count(country) > 0:
+                    missing values: ['NL']
+                    samples limit: 3
+                - missing_count(country) > 0:
+                    missing values: ['NL', 'BE']
+            """
+        )
+        scan.execute_unchecked()
+        # The number of rows that the sampler received per check
+        return [
+            query.sample_ref.total_row_count
+            for query in scan._queries
+            if query.query_name.endswith("failed_rows[missing_count]")
+        ]
+
+    separate_row_counts = execute_scan()
+    monkeypatch.setattr(data_source_fixture.data_source, "combine_failed_rows_samples", True)
+    combined_row_counts = execute_scan()
+
+    # The second check also selects the 4th 'NL' row, the first check still only gets its samples limit of 3 rows
+    assert separate_row_counts == [3, 10]
+    assert combined_row_counts == separate_row_counts
+
+
+def test_db_sample_streams_rows(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    data_source = data_source_fixture.data_source
+
+    cursor = data_source.connection.cursor()
+    try:
+        cursor.execute(f"SELECT * FROM {table_name}")
+        db_sample = DbSample(cursor, data_source)
+        streamed_rows = list(db_sample.get_rows_iter(3))
+    finally:
+        cursor.close()
+
+    assert len(streamed_rows) == 3
+    # All rows are counted, but only the streamed rows are kept
+    assert db_sample.get_rows_count() == 10
+    assert db_sample.get_rows() == streamed_rows
+
+
 duplicates_simple_header = "check, expected"
 duplicates_simple_config = [
     pytest.param(
@@ -1,4 +1,4 @@
-from helpers.common_test_tables import customers_test_table
+from helpers.common_test_tables import customers_test_table, orders_test_table
 from helpers.data_source_fixture import DataSourceFixture
 from helpers.utils import format_checks
 from soda.execution.check.schema_check import SchemaCheck
@@ -78,3 +78,30 @@ def test_required_columns_warn(data_source_fixture: DataSourceFixture):
     assert sorted(check.warn_result.missing_column_names) == sorted(
         [default_casify_column_name("non_existing_column"), default_casify_column_name("name")]
     )
+
+
+def test_required_columns_multiple_tables_single_metadata_query(data_source_fixture: DataSourceFixture):
+    customers_table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    orders_table_name = data_source_fixture.ensure_test_table(orders_test_table)
+    default_casify_column_name = data_source_fixture.data_source.default_casify_column_name
+
+    scan = data_source_fixture.create_test_scan()
+    scan.add_sodacl_yaml_str(
+        f"""
+      checks for {customers_table_name}:
+        - schema:
+            fail:
+              when required column missing: [{default_casify_column_name('id')}, {default_casify_column_name('distance')}]
+      checks for {orders_table_name}:
+        - schema:
+            fail:
+              when required column missing: [{default_casify_column_name('customer_id_ok')}]
+    """
+    )
+    scan.execute()
+
+    scan.assert_all_checks_pass()
+    query_names = [query.query_name for query in scan._queries]
+    if data_source_fixture.data_source.sql_get_tables_columns([customers_table_name, orders_table_name]):
+        assert query_names.count(f"{scan._data_source_name}.get_tables_columns") == 1
+        assert not any(".schema[" in query_name for query_name in query_names)
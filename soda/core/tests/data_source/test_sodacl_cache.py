@@ -0,0 +1,46 @@
+from helpers.common_test_tables import customers_test_table
+from helpers.data_source_fixture import DataSourceFixture
+
+CACHE_HIT_LOG = "Loaded 1 parsed SodaCL files from the SodaCL cache"
+
+
+def _execute_scan(data_source_fixture: DataSourceFixture, cache_dir: str, table_name: str, min_size: str):
+    scan = data_source_fixture.create_test_scan()
+    scan.enable_sodacl_cache(cache_dir)
+    scan.add_variables({"min_size": min_size})
+    scan.add_sodacl_yaml_str(
+        f"""
+          variables:
+            expected_row_count: "10"
+          checks for {table_name}:
+            - row_count = ${{expected_row_count}}
+            - min(cst_size) >= ${{min_size}}
+        """
+    )
+    scan.execute()
+    return scan
+
+
+def _cache_hit_count(scan) -> int:
+    return len([log for log in scan._logs.logs if CACHE_HIT_LOG in log.message])
+
+
+def test_sodacl_cache(data_source_fixture: DataSourceFixture, tmp_path):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    cache_dir = str(tmp_path)
+
+    first_scan = _execute_scan(data_source_fixture, cache_dir, table_name, min_size="-5000")
+    first_scan.assert_all_checks_pass()
+    assert _cache_hit_count(first_scan) == 0
+
+    cached_scan = _execute_scan(data_source_fixture, cache_dir, table_name, min_size="-5000")
+    cached_scan.assert_all_checks_pass()
+    assert _cache_hit_count(cached_scan) == 1
+    # Variables declared in the SodaCL file are restored from the cache
+    assert cached_scan._variables["expected_row_count"] == "10"
+    assert [check.check_value for check in cached_scan._checks] == [check.check_value for check in first_scan._checks]
+
+    # A change in a referenced variable invalidates the cached SodaCL
+    changed_scan = _execute_scan(data_source_fixture, cache_dir, table_name, min_size="5000")
+    assert _cache_hit_count(changed_scan) == 0
+    assert len(changed_scan.get_checks_fail()) == 1
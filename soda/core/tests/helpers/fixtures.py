@@ -15,7 +15,7 @@ from dotenv import load_dotenv
 from helpers.data_source_fixture import DataSourceFixture
 from helpers.mock_file_system import MockFileSystem
 from soda.common.file_system import FileSystemSingleton
-from soda.common.logs import Logs, configure_logging
+from soda.common.logs import configure_logging
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +26,6 @@ load_dotenv(f"{project_root_dir}/.env", override=True)
 # In global scope because it is used in pytest annotations, it would not work as a fixture.
 test_data_source = os.getenv("test_data_source", "postgres")
 
-logs = Logs()
-
 
 def pytest_sessionstart(session: Any) -> None:
     configure_logging()
@@ -69,12 +67,6 @@ def mock_file_system():
     FileSystemSingleton.INSTANCE = original_file_system
 
 
-@pytest.fixture(autouse=True)
-def clean_logs_before_tests():
-    logs.reset()
-    yield
-
-
 @pytest.fixture(scope="function")
 def environ():
     original_environ = os.environ.copy()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import gzip
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from threading import Lock
 
 from requests import Response
 from soda.cloud.historic_descriptor import (
@@ -52,6 +54,8 @@ class MockSodaCloud(SodaCloud):
         )
         self.historic_metric_values: list = []
         self.files = {}
+        # Samples are uploaded concurrently
+        self.files_lock = Lock()
         self.scan_results: list[dict] = []
         self.disable_collecting_warehouse_data = False
 
@@ -259,12 +263,16 @@ class MockSodaCloud(SodaCloud):
         return MockResponse(status_code=200)
 
     def _mock_server_upload(self, url, headers, data):
-        file_id = f"file-{len(self.files)}"
-        self.files[file_id] = {
-            "file_id": file_id,
-            "file_path": headers.get("File-Path"),
-            "content": data.read().decode("utf-8"),
-        }
+        if headers.get("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+        with self.files_lock:
+            file_id = f"file-{len(self.files)}"
+            self.files[file_id] = {
+                "file_id": file_id,
+                "file_path": headers.get("File-Path"),
+                "content_encoding": headers.get("Content-Encoding"),
+                "content": data.decode("utf-8"),
+            }
         return MockResponse(status_code=200, _json={"fileId": file_id})
 
     def _mock_server_query_core_cfg(self, url, headers, json):
@@ -1,7 +1,7 @@
 from functools import wraps
 from typing import Dict, List, Tuple, Union
 
-from soda.telemetry.soda_telemetry import MemorySpanExporter
+from soda.telemetry.memory_span_exporter import MemorySpanExporter
 
 telemetry_exporter = MemorySpanExporter.get_instance()
 
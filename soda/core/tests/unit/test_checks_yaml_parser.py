@@ -103,3 +103,79 @@ def test_invalid_check():
     log = next(log for log in scan._logs.logs if "this is not a good check" in log.message.lower())
     assert log.level == LogLevel.ERROR
     assert "invalid check" in log.message.lower()
+
+
+def cfg_values(cfg) -> dict:
+    # Locations are excluded as they have no equality
+    return {
+        k: dict(v) if isinstance(v, dict) else cfg_values(v) if hasattr(v, "__dict__") else v
+        for k, v in vars(cfg).items()
+        if not k.endswith("location")
+    }
+
+
+def test_simple_metric_checks_parsing_matches_antlr(monkeypatch):
+    from soda.sodacl import sodacl_parser
+
+    sodacl_yaml_str = dedent(
+        """
+      checks for CUSTOMERS:
+        - row_count > 0
+        - row_count between .0005 and 10.45
+        - row_count not between (0 and 10]
+        - missing_count(id) = 0
+        - duplicate_count(cat, "country") != -1
+        - percentile(cst_size, 0.95) <= +10.
+        - avg(cst_size):
+            fail: when > 100
+            warn: when between 50 and 100
+        - invalid_count(cst_size) < 5:
+            valid min: 0
+            filter: country = 'NL'
+        - change for row_count > 0
+        - freshness(ts) < 1d
+    """
+    )
+
+    def parse_check_cfgs() -> list:
+        scan = Scan()
+        scan.add_sodacl_yaml_str(sodacl_yaml_str)
+        scan.assert_no_error_nor_warning_logs()
+        partition_cfg = scan._sodacl_cfg.data_source_scan_cfgs[None].tables_cfgs["CUSTOMERS"].partition_cfgs[0]
+        check_cfgs = partition_cfg.check_cfgs + [
+            check_cfg
+            for column_checks_cfg in partition_cfg.column_checks_cfgs.values()
+            for check_cfg in column_checks_cfg.check_cfgs
+        ]
+        return [(type(check_cfg).__name__, cfg_values(check_cfg)) for check_cfg in check_cfgs]
+
+    check_cfgs = parse_check_cfgs()
+
+    sodacl_parser.antlr_parse.cache_clear()
+    monkeypatch.setattr(sodacl_parser, "parse_simple_metric_check", lambda check_str: None)
+    antlr_check_cfgs = parse_check_cfgs()
+
+    assert len(check_cfgs) == 10
+    assert check_cfgs == antlr_check_cfgs
+
+
+def test_antlr_parse_cache():
+    from soda.sodacl.sodacl_parser import antlr_parse
+
+    antlr_parse.cache_clear()
+    scan = Scan()
+    scan.add_sodacl_yaml_str(
+        dedent(
+            """
+      checks for CUSTOMERS:
+        - change for row_count > 0
+      checks for ORDERS:
+        - change for row_count > 0
+    """
+        )
+    )
+    scan.assert_no_error_nor_warning_logs()
+
+    # Each distinct section header and check is parsed once
+    assert antlr_parse.cache_info().misses == 3
+    assert antlr_parse.cache_info().hits == 1
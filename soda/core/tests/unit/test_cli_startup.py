@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+from benchmarks.benchmark_cli_startup import HELP_CODE, POSTGRES_SCAN_CODE
+
+# Not needed to show the CLI help, see the lazy imports in soda.cli.cli
+SLOW_HELP_MODULES = ["soda.scan", "opentelemetry", "ruamel", "requests", "pydantic", "antlr4", "soda.data_sources"]
+# Not needed to scan a Postgres data source
+SLOW_SCAN_MODULES = ["distutils", "pkg_resources", "pandas", "numpy", "scipy", "prophet", "soda.scientific"]
+
+
+def _get_imported_modules(code: str) -> list[str]:
+    completed_process = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed_process.stdout.split()
+
+
+def _get_imported(modules: list[str], module_prefixes: list[str]) -> list[str]:
+    return [
+        module
+        for module in modules
+        if any(module == prefix or module.startswith(f"{prefix}.") for prefix in module_prefixes)
+    ]
+
+
+def test_cli_help_imports():
+    assert _get_imported(_get_imported_modules(HELP_CODE), SLOW_HELP_MODULES) == []
+
+
+def test_cli_scan_imports():
+    modules = _get_imported_modules(POSTGRES_SCAN_CODE)
+
+    assert _get_imported(modules, SLOW_SCAN_MODULES) == []
+    # Only the data source of the scan is imported, if soda-core-postgres is installed
+    data_source_modules = [
+        module for module in _get_imported(modules, ["soda.data_sources"]) if module != "soda.data_sources"
+    ]
+    assert data_source_modules in ([], ["soda.data_sources.postgres_data_source"])
@@ -0,0 +1,34 @@
+import sqlite3
+
+import pytest
+from soda.common.columnar_rows import ColumnarRows
+
+
+def _create_cursor(row_count: int):
+    cursor = sqlite3.connect(":memory:").cursor()
+    values = ", ".join(f"({i}, 'group_{i % 3}')" for i in range(row_count))
+    cursor.execute(f"SELECT column1 AS id, column2 AS grp FROM (VALUES {values})")
+    return cursor
+
+
+def test_columnar_rows_from_cursor():
+    rows = ColumnarRows.from_cursor(_create_cursor(2500))
+
+    assert len(rows) == 2500
+    assert rows.column_names == ["id", "grp"]
+    assert rows.get_column("id") == list(range(2500))
+    assert rows.get_column(1)[:4] == ["group_0", "group_1", "group_2", "group_0"]
+    assert rows[4]["grp"] == "group_1"
+    assert rows[-1][0] == 2499
+    assert rows[4].get("missing", "default") == "default"
+    assert tuple(rows[5]) == (5, "group_2")
+    assert rows.to_dicts()[:2] == [{"id": 0, "grp": "group_0"}, {"id": 1, "grp": "group_1"}]
+    with pytest.raises(IndexError):
+        rows[2500]
+
+
+def test_columnar_rows_limit():
+    rows = ColumnarRows.from_cursor(_create_cursor(2500), limit=1001)
+
+    assert len(rows) == 1001
+    assert [row[0] for row in rows] == list(range(1001))
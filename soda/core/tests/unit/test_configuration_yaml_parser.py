@@ -78,6 +78,52 @@ def test_parse_configuration_yaml_env_var_resolving(monkeypatch):
     assert scan._configuration.soda_cloud.scheme == "https"
 
 
+def test_parse_soda_cloud_connection_pool_configuration():
+    scan = Scan()
+    scan.add_configuration_yaml_str(
+        dedent(
+            """
+        soda_cloud:
+          api_key_id: x
+          api_key_secret: x
+          max_concurrent_requests: 4
+          max_retries: 5
+          retry_backoff_factor: 2
+          compress_sample_uploads: true
+    """
+        )
+    )
+    scan.assert_no_error_nor_warning_logs()
+
+    soda_cloud = scan._configuration.soda_cloud
+    adapter = soda_cloud._session.get_adapter(soda_cloud.api_url)
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.backoff_factor == 2
+    # Read errors are not retried as Soda Cloud may have processed the request
+    assert adapter.max_retries.read == 0
+    # Gateway errors are not retried as Soda Cloud may have processed the request
+    assert set(adapter.max_retries.status_forcelist) == {429, 503}
+    assert soda_cloud.compress_sample_uploads
+
+
+def test_parse_soda_cloud_compress_sample_uploads_must_be_boolean():
+    scan = Scan()
+    scan.add_configuration_yaml_str(
+        dedent(
+            """
+        soda_cloud:
+          api_key_id: x
+          api_key_secret: x
+          compress_sample_uploads: "false"
+    """
+        )
+    )
+
+    scan.assert_has_error("'compress_sample_uploads' configuration must be a boolean")
+    assert not scan._configuration.soda_cloud.compress_sample_uploads
+
+
 def test_no_data_source_type():
     scan = Scan()
     scan.add_configuration_yaml_str(
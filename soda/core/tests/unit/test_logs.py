@@ -1,10 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from soda.common.log import LogLevel
 from soda.common.logs import Logs
 
 
-def test_logs_singleton():
+def test_logs_per_instance():
     logs_one = Logs()
     logs_two = Logs()
     logs_one.warning("Message")
 
-    assert logs_one is logs_two
-    assert len(logs_one.logs) == len(logs_two.logs)
+    assert logs_one is not logs_two
+    assert len(logs_one.logs) == 1
+    assert len(logs_two.logs) == 0
+
+
+def test_logs_concurrent():
+    logs = Logs()
+
+    def log_messages(thread_index: int):
+        for message_index in range(1000):
+            logs.info(f"Message {thread_index}.{message_index}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(log_messages, range(8)))
+
+    assert len(logs.logs) == 8000
+
+
+def test_logs_bounded():
+    logs = Logs(max_logs=3)
+    logs.verbose = True
+    for index in range(5):
+        logs.debug(f"Debug {index}")
+    logs.error("Error")
+
+    assert [log.message for log in logs.logs] == ["Debug 0", "Debug 1", "Debug 2", "Error"]
+    assert logs.dropped_log_count == 2
+    assert logs.logs[-1].level == LogLevel.ERROR
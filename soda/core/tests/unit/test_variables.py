@@ -14,3 +14,24 @@ def test_variables():
 
     assert scan._variables["hello"] == "world"
     assert scan._variables["sometime_later"] == "2022-10-22 11:12:13"
+
+
+def test_jinja_resolve_reuses_compiled_templates(monkeypatch):
+    from soda.common.jinja import Jinja
+
+    scan = Scan()
+    scan.add_variables({"table": "customers"})
+    template = "SELECT * FROM ${table} WHERE ${column} > 0 AND ${ env_var('SODA_TEST_SCHEMA') } = 1"
+
+    monkeypatch.setenv("SODA_TEST_SCHEMA", "a")
+    Jinja.compile.cache_clear()
+    assert scan.jinja_resolve(template, {"column": "x"}) == "SELECT * FROM customers WHERE x > 0 AND a = 1"
+
+    # Variables and environment variables are resolved at render time, not when the template is compiled
+    monkeypatch.setenv("SODA_TEST_SCHEMA", "b")
+    assert scan.jinja_resolve(template, {"column": "y"}) == "SELECT * FROM customers WHERE y > 0 AND b = 1"
+    assert Jinja.compile.cache_info().hits == 1
+    assert Jinja.compile.cache_info().misses == 1
+
+    # Extra variables do not leak into the scan variables
+    assert "column" not in scan._variables
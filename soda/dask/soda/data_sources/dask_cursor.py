@@ -12,31 +12,45 @@ class DaskCursor:
         self.description: tuple[tuple] | None = None
         self.rowcount: int = -1
         self.cursor_index: int = -1
+        # The computed result as one object array per column, in which missing values are None
+        self._columns: list[np.ndarray] = []
 
     def execute(self, sql: str) -> None:
-        # Run sql query in dask sql context and replace np.nan with None
+        # Run sql query in dask sql context
         sql = self._handle_uppercase_queries(sql)
         sql = self._handle_uppercase_table_names(sql)
-        self.df: DataFrame = self.context.sql(sql).compute().replace({np.nan: None})
+        self.df: DataFrame = self.context.sql(sql).compute()
 
         # Reset index
         self.df = self.df.reset_index(drop=True)
+        self._columns = [self._to_column_array(self.df[column]) for column in self.df.columns]
+        self.rowcount = self.df.shape[0]
         self.description: tuple = self.get_description()
         self.cursor_index = 0
 
+    @staticmethod
+    def _to_column_array(series) -> np.ndarray:
+        # Converts once to python objects and replaces np.nan with None
+        column_array = series.to_numpy(dtype=object)
+        column_array[series.isna().to_numpy()] = None
+        return column_array
+
+    def _get_rows(self, start: int, stop: int) -> tuple[list, ...]:
+        # Only the requested rows are converted to lists
+        column_slices = [column_array[start:stop] for column_array in self._columns]
+        return tuple(list(row) for row in zip(*column_slices))
+
     def fetchall(self) -> tuple[list, ...]:
-        self.rowcount = self.df.shape[0]
-        rows: tuple[list, ...] = tuple(self.df.values.tolist())
+        rows: tuple[list, ...] = self._get_rows(self.cursor_index, self.rowcount)
+        self.cursor_index = self.rowcount
         return rows
 
     def fetchmany(self, size: int) -> tuple[list, ...]:
-        self.rowcount = self.df.shape[0]
-        rows: tuple[list, ...] = tuple(self.df.values.tolist()[self.cursor_index : self.cursor_index + size])
+        rows: tuple[list, ...] = self._get_rows(self.cursor_index, self.cursor_index + size)
         self.cursor_index += len(rows)
         return rows
 
     def fetchone(self) -> tuple:
-        self.rowcount = self.df.shape[0]
         if self.df.empty:
             row_value = []
             for col_dtype in self.df.dtypes:
@@ -45,7 +59,7 @@ class DaskCursor:
                 else:
                     row_value.append(None)
         else:
-            row_value = self.df.values[0]
+            row_value = [column_array[0] for column_array in self._columns]
         return tuple(row_value)
 
     def close(self) -> None: ...
@@ -53,7 +67,11 @@ class DaskCursor:
     def get_description(self) -> tuple:
         if self.df.empty:
             return tuple((column, None) for column in self.df.columns)
-        return tuple((column, type(self.df[column][0]).__name__) for column in self.df.columns)
+        return tuple((column, self._get_type_name(self.df[column].iloc[0])) for column in self.df.columns)
+
+    @staticmethod
+    def _get_type_name(value) -> str:
+        return type(None).__name__ if value is None or value is np.nan else type(value).__name__
 
     @staticmethod
     def _handle_uppercase_queries(sql: str) -> str:
@@ -73,6 +73,8 @@ class DaskDataSource(DataSource):
         "serial",
         "bigserial",
     ]
+    # count distinct raises an error if it runs together with other profiling computations in dask-sql
+    SUPPORTS_MULTI_COLUMN_PROFILING: bool = False
 
     def __init__(self, logs: Logs, data_source_name: str, data_source_properties: dict):
         super().__init__(logs, data_source_name, data_source_properties)
@@ -148,6 +150,9 @@ class DaskDataSource(DataSource):
         self.context.create_table(self.sql_information_schema_columns(), dd_show_columns)
         return super().sql_get_tables_columns_metadata(include_patterns, exclude_patterns, table_names_only)
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        return None
+
     def sql_get_table_columns(
         self, table_name: str, included_columns: list[str] | None = None, excluded_columns: list[str] | None = None
     ) -> str:
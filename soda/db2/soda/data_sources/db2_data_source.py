@@ -118,6 +118,9 @@ class Db2DataSource(DataSource):
     def catalog_column_filter(self) -> str:
         return ""
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        return None
+
     def sql_get_table_columns(
         self,
         table_name: str,
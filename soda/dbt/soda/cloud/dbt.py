@@ -51,6 +51,8 @@ class DbtCloud:
         self.dbt_run_results = dbt_run_results
         self.dbt_cloud_run_id = dbt_cloud_run_id
         self.dbt_cloud_job_id = dbt_cloud_job_id
+        # Shared by the dbt Cloud API requests so that the connection is reused
+        self.dbt_cloud_session: requests.Session = requests.Session()
 
     def ingest(self):
         return_code = 0
@@ -265,7 +267,7 @@ class DbtCloud:
 
         self.scan._logs.info(f"Downloading artifact: {artifact}, from run: {run_id}")
 
-        response = requests.get(url, headers=headers)
+        response = self.dbt_cloud_session.get(url, headers=headers)
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
 
@@ -279,7 +281,7 @@ class DbtCloud:
         headers["Content-Type"] = "application/json"
 
         query_params = {"job_definition_id": job_id, "order_by": "-finished_at"}
-        response = requests.get(url, headers=headers, params=query_params)
+        response = self.dbt_cloud_session.get(url, headers=headers, params=query_params)
 
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
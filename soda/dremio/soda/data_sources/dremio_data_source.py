@@ -150,3 +150,14 @@ class DremioDataSource(DataSource):
             FROM {qualified_table_name}
             """
         )
+
+    def profiling_sql_aggregates_numeric_fields(self, column_name: str) -> list[str]:
+        column_name = self.quote_column(column_name)
+        return [
+            f"avg({column_name})",
+            f"sum({column_name})",
+            f"variance({column_name})",
+            f"stddev({column_name})",
+            f"count(distinct({column_name}))",
+            f"sum(case when {column_name} is null then 1 else 0 end)",
+        ]
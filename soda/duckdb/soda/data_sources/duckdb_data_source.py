@@ -99,6 +99,7 @@ class DuckDBDataSource(DataSource):
         "real",
     ]
     TEXT_TYPES_FOR_PROFILING = ["char", "varchar"]
+    SUPPORTS_GROUPING_SETS: bool = True
 
     def __init__(self, logs: Logs, data_source_name: str, data_source_properties: dict):
         super().__init__(logs, data_source_name, data_source_properties)
@@ -131,6 +132,11 @@ class DuckDBDataSource(DataSource):
 
         return self.connection
 
+    def create_pooled_connection(self):
+        # A new duckdb.connect() would open a different (eg empty in-memory) database. A duckdb cursor is
+        # a separate connection to the same database that can be used from another thread.
+        return DuckDBDataSourceConnectionWrapper(self.connection._delegate.cursor())
+
     def safe_connection_data(self):
         return [self.path, self.read_only]
 
@@ -0,0 +1,124 @@
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+from soda.batch_scan import BatchScan
+from soda.cli.cli import main
+from soda.execution.batch_connection_pool import BatchConnectionPool
+from soda.scan import Scan
+
+
+def _create_batch(tmp_path: Path) -> tuple[str, Path]:
+    import duckdb
+
+    database_path = tmp_path / "batch.duckdb"
+    connection = duckdb.connect(str(database_path))
+    connection.execute("CREATE TABLE orders AS SELECT range AS id, range % 3 AS status FROM range(10)")
+    connection.close()
+
+    configuration_yaml_str = f"""
+      data_source batch_ds:
+        type: duckdb
+        path: {database_path}
+    """
+
+    batch_dir = tmp_path / "batch"
+    (batch_dir / "status").mkdir(parents=True)
+    (batch_dir / "row_count.yml").write_text("checks for orders:\n  - row_count = 10\n")
+    (batch_dir / "failing.yml").write_text("checks for orders:\n  - row_count = 11\n")
+    (batch_dir / "status" / "checks.yml").write_text("checks for orders:\n  - max(status) = 2\n")
+    (batch_dir / "README.md").write_text("Not a checks file")
+    return configuration_yaml_str, batch_dir
+
+
+def test_batch_scan(tmp_path: Path):
+    configuration_yaml_str, batch_dir = _create_batch(tmp_path)
+    scan_results_dir = tmp_path / "scan_results"
+
+    batch_scan = BatchScan(max_concurrent_scans=2)
+    batch_scan.set_data_source_name("batch_ds")
+    batch_scan.add_configuration_yaml_str(configuration_yaml_str)
+    batch_scan.set_verbose()
+    batch_scan.add_scans_from_dir(str(batch_dir), scan_results_dir=str(scan_results_dir))
+    batch_scan_results = batch_scan.execute()
+
+    assert [(result.scan_definition_name, result.exit_code) for result in batch_scan_results] == [
+        ("failing", 2),
+        ("row_count", 0),
+        ("status", 0),
+    ]
+    assert BatchScan.get_exit_code(batch_scan_results) == 2
+    # Logs are per scan
+    assert all(len(result.scan._checks) == 1 for result in batch_scan_results)
+    # At most max_concurrent_scans connections are opened, so at least one scan reuses a connection
+    reuse_count = sum(
+        result.scan._logs.log_message_present("Reusing a connection of the batch") for result in batch_scan_results
+    )
+    assert reuse_count >= 1
+
+    # The scan results files have the same content as those of an individual scan
+    scan = Scan()
+    scan.set_data_source_name("batch_ds")
+    scan.add_configuration_yaml_str(configuration_yaml_str)
+    scan.set_scan_definition_name("row_count")
+    scan.add_sodacl_yaml_files(str(batch_dir / "row_count.yml"))
+    scan.set_scan_results_file(str(tmp_path / "row_count.json"))
+    scan.execute()
+    individual_scan_results = json.loads((tmp_path / "row_count.json").read_text())
+    batch_scan_results_file = json.loads((scan_results_dir / "row_count.json").read_text())
+    assert sorted(batch_scan_results_file) == sorted(individual_scan_results)
+    assert batch_scan_results_file["definitionName"] == "row_count"
+    assert batch_scan_results_file["checks"][0]["outcome"] == individual_scan_results["checks"][0]["outcome"]
+
+
+def test_batch_scan_cli(tmp_path: Path):
+    configuration_yaml_str, batch_dir = _create_batch(tmp_path)
+    configuration_path = tmp_path / "configuration.yml"
+    configuration_path.write_text(configuration_yaml_str)
+    scan_results_dir = tmp_path / "scan_results"
+
+    result = CliRunner().invoke(
+        main,
+        [
+            "scan",
+            "-d",
+            "batch_ds",
+            "-c",
+            str(configuration_path),
+            "--batch",
+            str(batch_dir),
+            "--max-concurrent-scans",
+            "2",
+            "-srf",
+            str(scan_results_dir),
+        ],
+    )
+
+    assert result.exit_code == 2
+    assert sorted(path.name for path in scan_results_dir.iterdir()) == ["failing.json", "row_count.json", "status.json"]
+
+
+def test_batch_connection_pool_discards_broken_connections(tmp_path: Path):
+    configuration_yaml_str, _ = _create_batch(tmp_path)
+    batch_connection_pool = BatchConnectionPool()
+
+    def connect_data_source():
+        scan = Scan()
+        scan.add_configuration_yaml_str(configuration_yaml_str)
+        scan._data_source_manager.batch_connection_pool = batch_connection_pool
+        return scan._data_source_manager.get_data_source("batch_ds")
+
+    data_source = connect_data_source()
+    connection = data_source.connection
+    # Without an open transaction DuckDB cannot roll back, but the connection is still valid and is reused
+    batch_connection_pool.release(data_source)
+    assert data_source.connection is None
+    data_source = connect_data_source()
+    assert data_source.connection is connection
+
+    connection.close()
+    batch_connection_pool.release(data_source)
+    data_source = connect_data_source()
+    assert data_source.connection is not connection
+    batch_connection_pool.release(data_source)
+    batch_connection_pool.close(data_source.logs)
@@ -8,6 +8,8 @@ logger = logging.getLogger(__name__)
 
 
 class PostgresDataSource(DataSource):
+    SUPPORTS_GROUPING_SETS: bool = True
+
     def __init__(self, logs: Logs, data_source_name: str, data_source_properties: dict):
         super().__init__(logs, data_source_name, data_source_properties)
         self.host = data_source_properties.get("host")
@@ -3,14 +3,16 @@ from __future__ import annotations
 import ast
 import itertools
 import logging
+import math
 import multiprocessing
 import random
 import sys
-from typing import Any, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
-from prophet.diagnostics import cross_validation, performance_metrics
+from prophet.diagnostics import cross_validation, generate_cutoffs, performance_metrics
 from soda.common.logs import Logs
 from soda.execution.check.anomaly_detection_metric_check import HISTORIC_RESULTS_LIMIT
 from soda.sodacl.anomaly_detection_metric_check_cfg import (
@@ -194,6 +196,15 @@ class ProphetDetector(BaseDetector):
     ) -> ProphetDefaultHyperparameters:
         # enable prophet logging again
         logging.getLogger("prophet").setLevel(logging.INFO)
+        best_params = self.sort_hyperparameter_performances(hyperparameter_performances_df)["hyperparams"].values[0]
+        dict_best_params = ast.literal_eval(best_params)
+
+        # Update hyperparameters with best params
+        best_hyperparameters = ProphetDefaultHyperparameters(**dict_best_params)
+        return best_hyperparameters
+
+    def sort_hyperparameter_performances(self, hyperparameter_performances_df: pd.DataFrame) -> pd.DataFrame:
+        """Sorts the hyperparameter performances from best to worst according to the objective metric."""
         sort_by = ["coverage", "smape", "mdape", "rmse", "mse"]
         objective = self.hyperparamaters_cfg.dynamic.objective_metric  # type: ignore
 
@@ -206,14 +217,7 @@ class ProphetDetector(BaseDetector):
             objective = [objective]
         sort_by = objective + sort_by
         ascending = [col != "coverage" for col in sort_by]
-        best_params = hyperparameter_performances_df.sort_values(by=sort_by, ascending=ascending)["hyperparams"].values[
-            0
-        ]
-        dict_best_params = ast.literal_eval(best_params)
-
-        # Update hyperparameters with best params
-        best_hyperparameters = ProphetDefaultHyperparameters(**dict_best_params)
-        return best_hyperparameters
+        return hyperparameter_performances_df.sort_values(by=sort_by, ascending=ascending)
 
     def get_hyperparameters_performance_df(
         self, time_series_df: pd.DataFrame, cutoff_point_for_cv: int
@@ -225,30 +229,72 @@ class ProphetDetector(BaseDetector):
             f"Anomaly Detection: Start hyperparameter tuning with grid search having {len(all_hyperparams)} combinations"
         )
 
-        # Set cross validation parameters
-        parallelize_cross_validation = self.hyperparamaters_cfg.dynamic.parallelize_cross_validation  # type: ignore
-        if parallelize_cross_validation is True:
-            parallelize_cross_validation = "processes"
-
         # find time delta in a new column in a rolling window of 1
         time_delta_series = time_series_df["ds"].diff(periods=1)
         inferred_time_delta = time_delta_series.dropna().iloc[-1]
-        df_all_performance = pd.DataFrame()
-        for hyperparams in tqdm(all_hyperparams):
-            # disable prophet logging
-            logging.getLogger("prophet").setLevel(logging.ERROR)
-            model = Prophet(**hyperparams).fit(time_series_df)
-            df_cv = cross_validation(
-                model,
-                initial=cutoff_point_for_cv * inferred_time_delta,
-                horizon=inferred_time_delta,
-                period=inferred_time_delta,
-                parallel=parallelize_cross_validation,
+        cutoffs = generate_cutoffs(
+            time_series_df,
+            horizon=inferred_time_delta,
+            initial=cutoff_point_for_cv * inferred_time_delta,
+            period=inferred_time_delta,
+        )
+
+        if self.hyperparamaters_cfg.dynamic.early_stopping and len(all_hyperparams) > 1 and len(cutoffs) > 1:  # type: ignore
+            # Successive halving: all combinations are evaluated on the most recent half of the folds and only the
+            # best half of the combinations is evaluated on all folds
+            first_rung_cutoffs = cutoffs[len(cutoffs) // 2 :]
+            first_rung_performances_df = self.evaluate_hyperparameters(
+                all_hyperparams, time_series_df, first_rung_cutoffs, inferred_time_delta
             )
-            df_performance = pd.DataFrame(performance_metrics(df_cv, rolling_window=1))
-            df_performance["hyperparams"] = str(hyperparams)
-            df_all_performance = pd.concat([df_all_performance, df_performance])
-        return df_all_performance
+            n_remaining_hyperparams = math.ceil(len(all_hyperparams) / 2)
+            all_hyperparams = [
+                ast.literal_eval(hyperparams)
+                for hyperparams in self.sort_hyperparameter_performances(first_rung_performances_df)[
+                    "hyperparams"
+                ].values[:n_remaining_hyperparams]
+            ]
+            self.logs.debug(
+                f"Anomaly Detection: Early stopping kept the best {n_remaining_hyperparams} hyperparameter combinations"
+            )
+
+        return self.evaluate_hyperparameters(all_hyperparams, time_series_df, cutoffs, inferred_time_delta)
+
+    def evaluate_hyperparameters(
+        self,
+        all_hyperparams: List[Dict[str, Any]],
+        time_series_df: pd.DataFrame,
+        cutoffs: List[pd.Timestamp],
+        horizon: pd.Timedelta,
+    ) -> pd.DataFrame:
+        """Cross validates each hyperparameter combination and returns the performances of all combinations.
+
+        If parallelize_cross_validation is enabled, the combinations are distributed over a process pool. A single
+        combination parallelizes its cross validation folds instead.
+        """
+        parallelize = self.hyperparamaters_cfg.dynamic.parallelize_cross_validation  # type: ignore
+        if parallelize and len(all_hyperparams) > 1:
+            with ProcessPoolExecutor(max_workers=min(len(all_hyperparams), multiprocessing.cpu_count())) as executor:
+                performances = list(
+                    tqdm(
+                        executor.map(
+                            _cross_validate_hyperparameters,
+                            all_hyperparams,
+                            itertools.repeat(time_series_df),
+                            itertools.repeat(cutoffs),
+                            itertools.repeat(horizon),
+                        ),
+                        total=len(all_hyperparams),
+                    )
+                )
+        else:
+            parallel_cross_validation = "processes" if parallelize else None
+            performances = [
+                _cross_validate_hyperparameters(
+                    hyperparams, time_series_df, cutoffs, horizon, parallel=parallel_cross_validation
+                )
+                for hyperparams in tqdm(all_hyperparams)
+            ]
+        return pd.concat(performances)
 
     def get_prophet_hyperparameters(self, time_series_df: pd.DataFrame) -> ProphetDefaultHyperparameters:
         if self.hyperparamaters_cfg.dynamic is None:
@@ -414,3 +460,23 @@ class ProphetDetector(BaseDetector):
         # Apply the function to each row
         anomalies_df["level"] = anomalies_df.apply(determine_level, axis=1)
         return anomalies_df
+
+
+def _cross_validate_hyperparameters(
+    hyperparams: Dict[str, Any],
+    time_series_df: pd.DataFrame,
+    cutoffs: List[pd.Timestamp],
+    horizon: pd.Timedelta,
+    parallel: str | None = None,
+) -> pd.DataFrame:
+    """Fits a Prophet model with the given hyperparameters and returns its cross validation performance.
+
+    Module level function so that it can be executed in a process pool.
+    """
+    # disable prophet logging
+    logging.getLogger("prophet").setLevel(logging.ERROR)
+    model = Prophet(**hyperparams).fit(time_series_df)
+    df_cv = cross_validation(model, horizon=horizon, cutoffs=cutoffs, parallel=parallel, disable_tqdm=True)
+    df_performance = pd.DataFrame(performance_metrics(df_cv, rolling_window=1))
+    df_performance["hyperparams"] = str(hyperparams)
+    return df_performance
@@ -16,6 +16,7 @@ from soda.scientific.distribution.utils import (
     assert_bidirectional_categorial_values,
     assert_categorical_min_sample_size,
     distribution_is_all_null,
+    generate_data_from_binned_counts,
     generate_ref_data,
 )
 
@@ -70,12 +71,17 @@ class DistributionChecker:
         data: list[Any],
         max_limit: int = int(1e6),
         logs: logging.Logger = logging.getLogger("soda.core"),
+        binned_counts: list[tuple] | None = None,
     ):
         self.logs = logs
-        self.test_data = data
         self.dist_ref, self.dist_method = self._parse_reference_cfg(
             dist_method, parsed_dro, dist_ref_file_path, dist_name
         )
+        if binned_counts is not None:
+            # Binned counts computed in the data source (pushdown), no values were limited when fetching
+            data = generate_data_from_binned_counts(binned_counts, max_sample_size=max_limit)
+            max_limit = None
+        self.test_data = data
         self.assert_test_data(
             data=data,
             max_limit=max_limit,
@@ -194,7 +200,9 @@ class DistributionChecker:
             )
         return RefDataCfg.model_validate(ref_data_cfg), dist_method
 
-    def assert_test_data(self, data: pd.Series, max_limit: int, distribution_type: str, column_name: str) -> None:
+    def assert_test_data(
+        self, data: pd.Series, max_limit: int | None, distribution_type: str, column_name: str
+    ) -> None:
         if len(data) == 0:
             raise EmptyDistributionCheckColumn(
                 f"""The column for which you defined this distribution check does not return any data. Make sure that """
@@ -77,3 +77,25 @@ def generate_ref_data(cfg: RefDataCfg, sample_size: int, rng: np.random.Generato
         return ref_data
     else:
         return pd.Series(rng.choice(cfg.bins, p=cfg.weights, size=sample_size))
+
+
+def generate_data_from_binned_counts(binned_counts: Sequence[tuple], max_sample_size: int) -> list:
+    """Approximates the values of a column from its binned counts.
+
+    Each binned count is a tuple (bin index, count, min value, max value) as returned by
+    DataSource.sql_distribution_binned_counts. Within a bin, values are spread evenly between the bin's min and
+    max value. Nulls (bin index -1) are kept as None. If the total count exceeds max_sample_size, the counts are
+    scaled down proportionally.
+    """
+    total_count = sum(row[1] for row in binned_counts)
+    scale = min(1.0, max_sample_size / total_count) if total_count > 0 else 1.0
+    data = []
+    for bin_index, count, min_value, max_value in binned_counts:
+        sample_count = int(round(count * scale))
+        if sample_count == 0:
+            continue
+        if bin_index == -1 or min_value is None:
+            data.extend([None] * sample_count)
+        else:
+            data.extend(np.linspace(float(min_value), float(max_value), sample_count).tolist())
+    return data
@@ -261,6 +261,50 @@ def test_get_prophet_hyperparameters_with_tuning(
     assert best_hyperparameters == expected_hyperparameters
 
 
+@pytest.mark.parametrize(
+    "parallelize_cross_validation, early_stopping",
+    [
+        pytest.param(True, False, id="parallel grid search"),
+        pytest.param(False, True, id="early stopping"),
+    ],
+)
+def test_get_prophet_hyperparameters_with_tuning_options(
+    parallelize_cross_validation: bool, early_stopping: bool
+) -> None:
+    time_series_df = generate_random_dataframe(size=20, n_rows_to_convert_none=0, frequency="D")
+    model_cfg = ModelConfigs(
+        hyperparameters=HyperparameterConfigs(
+            static=ProphetHyperparameterProfiles(),
+            dynamic=ProphetDynamicHyperparameters(
+                objective_metric="smape",
+                parallelize_cross_validation=parallelize_cross_validation,
+                early_stopping=early_stopping,
+                parameter_grid=ProphetParameterGrid(
+                    changepoint_prior_scale=[0.05, 0.1],
+                    seasonality_prior_scale=[0.05, 0.1],
+                ),
+            ),
+        )
+    )
+
+    prophet_detector = ProphetDetector(
+        logs=LOGS,
+        params=PARAMS,
+        time_series_df=time_series_df,
+        model_cfg=model_cfg,
+        training_dataset_params=TrainingDatasetParameters(),
+        severity_level_params=SeverityLevelParameters(),
+    )
+    best_hyperparameters = prophet_detector.get_prophet_hyperparameters(
+        time_series_df=time_series_df,
+    )
+    expected_hyperparameters = ProphetDefaultHyperparameters(
+        changepoint_prior_scale=0.1,
+        seasonality_prior_scale=0.05,
+    )
+    assert best_hyperparameters == expected_hyperparameters
+
+
 def test_setup_fit_predict() -> None:
     predictions_df = PROPHET_DETECTOR.setup_fit_predict(
         time_series_df=DAILY_TIME_SERIES_DF,
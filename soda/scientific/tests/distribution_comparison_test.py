@@ -606,3 +606,73 @@ def test_empty_test_data(test_data, dist_ref_file_path, method):
             dist_name=None,
             data=test_data,
         )
+
+
+def _binned_counts(values: list, bins: list) -> list[tuple]:
+    # Same binning as DataSource.sql_distribution_binned_counts: (bin index, count, min value, max value) per bin
+    values = np.asarray(values)
+    bin_indexes = np.digitize(values, bins)
+    bin_indexes[values == bins[-1]] = max(len(bins) - 1, 1)
+    return [
+        (bin_index, len(bin_values), bin_values.min(), bin_values.max())
+        for bin_index in sorted(set(bin_indexes))
+        for bin_values in [values[bin_indexes == bin_index]]
+    ]
+
+
+@pytest.mark.parametrize(
+    "method, test_data, threshold",
+    [
+        pytest.param(
+            "ks", list(default_rng(61).normal(loc=1.0, scale=1.0, size=1000)), 0.05, id="Similar distribution with ks"
+        ),
+        pytest.param(
+            "ks", list(default_rng(61).normal(loc=1.5, scale=1.0, size=1000)), 0.05, id="Different distribution with ks"
+        ),
+        pytest.param(
+            "swd", list(default_rng(61).normal(loc=1.0, scale=1.0, size=1000)), 0.2, id="Similar distribution with swd"
+        ),
+        pytest.param(
+            "swd",
+            list(default_rng(61).normal(loc=1.5, scale=1.0, size=1000)),
+            0.2,
+            id="Different distribution with swd",
+        ),
+        pytest.param(
+            "psi", list(default_rng(61).normal(loc=1.0, scale=1.0, size=1000)), 0.1, id="Similar distribution with psi"
+        ),
+        pytest.param(
+            "psi",
+            list(default_rng(61).normal(loc=1.5, scale=1.0, size=1000)),
+            0.1,
+            id="Different distribution with psi",
+        ),
+    ],
+)
+def test_distribution_checker_binned_counts(method, test_data, threshold):
+    from soda.scientific.distribution.comparison import DistributionChecker
+
+    reference_file_path = "soda/scientific/tests/assets/dist_ref_continuous.yml"
+    parsed_dro = read_dro(reference_file_path)
+    bins = sorted(parsed_dro["distribution reference"]["bins"])
+
+    check_value = DistributionChecker(
+        dist_method=method,
+        parsed_dro=parsed_dro,
+        dist_ref_file_path=reference_file_path,
+        dist_name=None,
+        data=test_data,
+    ).run()["check_value"]
+    pushdown_check_value = DistributionChecker(
+        dist_method=method,
+        parsed_dro=parsed_dro,
+        dist_ref_file_path=reference_file_path,
+        dist_name=None,
+        data=[],
+        binned_counts=_binned_counts(test_data, bins),
+    ).run()["check_value"]
+
+    # The values within a bin are approximated, so the check values differ slightly but the outcome is the same
+    assert (pushdown_check_value < threshold) == (check_value < threshold)
+    if method != "ks":
+        assert pushdown_check_value == pytest.approx(check_value, abs=0.01)
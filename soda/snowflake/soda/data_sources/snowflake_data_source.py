@@ -72,6 +72,7 @@ class SnowflakeDataSource(DataSource):
         "CHAR VARYING",
         "NCHAR VARYING",
     ]
+    SUPPORTS_GROUPING_SETS: bool = True
 
     def __init__(self, logs: Logs, data_source_name: str, data_source_properties: dict):
         super().__init__(logs, data_source_name, data_source_properties)
@@ -192,6 +193,14 @@ class SnowflakeDataSource(DataSource):
             """
         return sql
 
+    def sql_get_table_version(self, table_name: str) -> str | None:
+        schema_filter = f"\n              AND table_schema = '{self.schema.upper()}'" if self.schema else ""
+        return f"""
+            SELECT row_count, bytes, last_altered
+            FROM information_schema.tables
+            WHERE table_name = '{self.default_casify_table_name(table_name)}'{schema_filter}
+            """
+
     def _create_table_prefix(self):
         return ".".join([p for p in [self.database, self.schema] if p is not None])
 
@@ -195,6 +195,7 @@ class SparkSQLBase(DataSource):
         "tinyint",
     ]
     TEXT_TYPES_FOR_PROFILING = ["string", "varchar"]
+    SUPPORTS_GROUPING_SETS: bool = True
 
     def __init__(self, logs: Logs, data_source_name: str, data_source_properties: dict):
         super().__init__(logs, data_source_name, data_source_properties)
@@ -233,6 +234,9 @@ class SparkSQLBase(DataSource):
                 columns = {col_name: dtype for col_name, dtype in columns.items() if col_name in filtered_column_names}
         return columns
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        return None
+
     def sql_get_table_columns(
         self,
         table_name: str,
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from itertools import islice
+from typing import Iterator
+
 from pyspark.sql import DataFrame, SparkSession
 from pyspark.sql.types import Row
 
@@ -9,46 +12,59 @@ class SparkDfCursor:
         self.spark_session = spark_session
         self.df: DataFrame | None = None
         self.description: tuple[tuple] | None = None
-        self.rowcount: int = -1
         self.cursor_index: int = -1
+        self._rowcount: int | None = None
+        self._spark_rows: Iterator[Row] | None = None
 
     def execute(self, sql: str):
         self.df = self.spark_session.sql(sqlQuery=sql)
         self.description = self.convert_spark_df_schema_to_dbapi_description(self.df)
         self.cursor_index = 0
+        self._rowcount = None
+        self._spark_rows = None
+
+    @property
+    def rowcount(self) -> int:
+        if self.df is None:
+            return -1
+        if self._rowcount is None:
+            # Only triggers a Spark job if the rows were not all fetched yet
+            self._rowcount = self.df.count()
+        return self._rowcount
 
     def fetchall(self) -> tuple[tuple]:
-        rows = []
         spark_rows: list[Row] = self.df.collect()
-        self.rowcount = len(spark_rows)
-        for spark_row in spark_rows:
-            row = self.convert_spark_row_to_dbapi_row(spark_row)
-            rows.append(row)
-        return tuple(rows)
+        self._rowcount = len(spark_rows)
+        return tuple(self.convert_spark_row_to_dbapi_row(spark_row) for spark_row in spark_rows)
 
     def fetchmany(self, size: int) -> tuple[tuple]:
-        rows = []
-        self.rowcount = self.df.count()
-        spark_rows: list[Row] = self.df.limit(size).offset(self.cursor_index).collect()
+        # The result is streamed partition by partition in a single pass over the DataFrame.
+        spark_rows: list[Row] = list(islice(self._get_spark_rows(), size))
         self.cursor_index += len(spark_rows)
-        for spark_row in spark_rows:
-            row = self.convert_spark_row_to_dbapi_row(spark_row)
-            rows.append(row)
-        return tuple(rows)
+        if len(spark_rows) < size:
+            self._rowcount = self.cursor_index
+        return tuple(self.convert_spark_row_to_dbapi_row(spark_row) for spark_row in spark_rows)
 
-    def fetchone(self) -> tuple:
-        spark_rows: list[Row] = self.df.collect()
-        self.rowcount = len(spark_rows)
-        spark_row = spark_rows[0]
-        row = self.convert_spark_row_to_dbapi_row(spark_row)
-        return tuple(row)
+    def fetchone(self) -> tuple | None:
+        spark_row: Row | None = next(self._get_spark_rows(), None)
+        if spark_row is None:
+            self._rowcount = self.cursor_index
+            return None
+        self.cursor_index += 1
+        return tuple(spark_row)
+
+    def _get_spark_rows(self) -> Iterator[Row]:
+        if self._spark_rows is None:
+            self._spark_rows = self.df.toLocalIterator(prefetchPartitions=True)
+        return self._spark_rows
 
     @staticmethod
-    def convert_spark_row_to_dbapi_row(spark_row):
-        return [spark_row[field] for field in spark_row.__fields__]
+    def convert_spark_row_to_dbapi_row(spark_row: Row) -> list:
+        # A Row is a tuple with the values in the order of the fields
+        return list(spark_row)
 
     def close(self):
-        pass
+        self._spark_rows = None
 
     @staticmethod
     def convert_spark_df_schema_to_dbapi_description(df) -> tuple[tuple]:
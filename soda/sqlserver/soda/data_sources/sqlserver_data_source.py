@@ -183,6 +183,17 @@ class SQLServerDataSource(DataSource):
             """
         )
 
+    def profiling_sql_aggregates_numeric_fields(self, column_name: str) -> list[str]:
+        column_name = self.quote_column(column_name)
+        return [
+            f"avg({column_name})",
+            f"sum({column_name})",
+            f"var({column_name})",
+            f"stdev({column_name})",
+            self.expr_count(f"distinct({column_name})"),
+            f"sum(case when {column_name} is null then 1 else 0 end)",
+        ]
+
     def profiling_sql_values_frequencies_query(
         self,
         data_type_category: str,
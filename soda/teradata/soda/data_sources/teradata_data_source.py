@@ -446,6 +446,9 @@ class TeradataDataSource(DataSource):
     def expr_false_condition(self):
         return "1 = 0"
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        return None
+
     def sql_get_table_columns(
         self,
         table_name: str,
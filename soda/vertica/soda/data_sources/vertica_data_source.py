@@ -135,6 +135,9 @@ class VerticaDataSource(DataSource):
     def sql_information_schema_columns(self) -> str:
         return "v_catalog.columns"
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        return None
+
     def sql_get_table_columns(
         self,
         table_name: str,